@@ -0,0 +1,109 @@
+"""
+Per-row overhead of building Record and ProcessingResult objects on the hot path.
+
+Compares the previous row conversion (dict(row) copy plus two pops) with the positional
+row adapter of PostgresSource, and validated pydantic construction with model_construct.
+No database needed: rows are emulated with a stand-in for asyncpg.Record.
+
+    uv run python benchmarks/record_construction.py
+"""
+
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from rich.console import Console
+from rich.table import Table
+
+from llm_pipeline import PostgresSource, ProcessingResult, Record
+from llm_pipeline.config import PGSettings
+
+ROWS = 100_000
+COLUMNS = ['id', 'content', 'title', 'author_id', 'created_at']
+
+
+class Row:
+    """Stand-in for asyncpg.Record: values addressable by position or by column name."""
+
+    __slots__ = ('_mapping', '_values')
+
+    def __init__(self, values: tuple[Any, ...], mapping: dict[str, int]) -> None:
+        self._values = values
+        self._mapping = mapping
+
+    def keys(self) -> list[str]:
+        return list(self._mapping)
+
+    def __getitem__(self, key: int | str) -> Any:
+        return self._values[key if isinstance(key, int) else self._mapping[key]]
+
+
+def make_rows() -> list[Row]:
+    mapping = {name: index for index, name in enumerate(COLUMNS)}
+    content = 'x' * 2000
+    return [Row((i, content, f'title {i}', i % 100, '2024-01-01'), mapping) for i in range(ROWS)]
+
+
+def record_before(row: Row) -> Record:
+    row_dict = dict(row)  # type: ignore[call-overload]
+    record_id = row_dict.pop('id')
+    content = row_dict.pop('content')
+    return Record(id=record_id, content=content, metadata=row_dict)
+
+
+def result_kwargs(record: Record) -> dict[str, Any]:
+    return {
+        'record_id': record.id,
+        'success': True,
+        'original_content': record.content,
+        'transformed_content': record.content,
+        'tokens_used': 1500,
+        'cost': 0.01,
+    }
+
+
+def per_row_us(func: Callable[[], None]) -> float:
+    return min(timeit.repeat(func, number=1, repeat=5)) / ROWS * 1_000_000
+
+
+def main() -> None:
+    rows = make_rows()
+    source = PostgresSource('SELECT 1', settings=PGSettings.model_construct())
+    records = [source._to_record(row) for row in rows]
+
+    measurements = [
+        ('Row -> Record: dict(row) + pops (previous)', lambda: [record_before(row) for row in rows]),
+        (
+            'Row -> Record: positional adapter (current)',
+            lambda: [source._to_record(row) for row in rows],
+        ),
+        (
+            'Row -> Record: positional adapter + model_construct',
+            lambda: [
+                Record.model_construct(
+                    id=row[0], content=row[1], metadata={'title': row[2], 'author_id': row[3], 'created_at': row[4]}
+                )
+                for row in rows
+            ],
+        ),
+        (
+            'ProcessingResult: validated (current)',
+            lambda: [ProcessingResult(**result_kwargs(record)) for record in records],
+        ),
+        (
+            'ProcessingResult: model_construct',
+            lambda: [ProcessingResult.model_construct(**result_kwargs(record)) for record in records],
+        ),
+    ]
+
+    table = Table(title=f'Per-row construction overhead ({ROWS:,} rows)')
+    table.add_column('Approach')
+    table.add_column('µs/row', justify='right')
+    for approach, func in measurements:
+        table.add_row(approach, f'{per_row_us(func):.2f}')
+
+    Console().print(table)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+Compare PostgresSink write modes: executemany vs COPY into a staging table.
+
+Requires a PostgreSQL database configured through PG_* environment variables.
+A scratch table is created and dropped by the benchmark.
+
+    uv run python benchmarks/sink_write_modes.py
+"""
+
+import asyncio
+import time
+
+import asyncpg
+from rich.console import Console
+from rich.table import Table
+
+from llm_pipeline import PostgresSink
+from llm_pipeline.config import PGSettings
+
+TABLE = 'llm_pipeline_sink_benchmark'
+BATCH_SIZES = [10, 100, 1000, 10_000]
+ROWS = 20_000
+CONTENT_SIZE = 5_000
+
+
+async def prepare_table(settings: PGSettings) -> None:
+    conn = await asyncpg.connect(settings.dsn)
+    try:
+        await conn.execute(f'DROP TABLE IF EXISTS {TABLE}')
+        await conn.execute(f'CREATE TABLE {TABLE} (id BIGINT PRIMARY KEY, content TEXT NOT NULL)')
+        await conn.execute(f"INSERT INTO {TABLE} SELECT i, '' FROM generate_series(1, {ROWS}) AS i")  # noqa: S608
+    finally:
+        await conn.close()
+
+
+async def drop_table(settings: PGSettings) -> None:
+    conn = await asyncpg.connect(settings.dsn)
+    try:
+        await conn.execute(f'DROP TABLE IF EXISTS {TABLE}')
+    finally:
+        await conn.close()
+
+
+async def measure(settings: PGSettings, write_mode: str, batch_size: int) -> float:
+    """Return rows per second written with the given mode and batch size."""
+    sink = PostgresSink(
+        query=f'UPDATE {TABLE} SET content = :content WHERE id = :id',  # noqa: S608
+        settings=settings,
+        write_mode=write_mode,  # type: ignore[arg-type]
+    )
+    content = 'x' * CONTENT_SIZE
+
+    # Warm up the pool, prepared statements and the staging table
+    await sink.write_record(1, content)
+    await sink.commit_batch()
+
+    start = time.perf_counter()
+    for record_id in range(1, ROWS + 1):
+        await sink.write_record(record_id, content)
+        if sink.pending_count >= batch_size:
+            await sink.commit_batch()
+    await sink.commit_batch()
+    elapsed = time.perf_counter() - start
+
+    await sink.close()
+    return ROWS / elapsed
+
+
+async def main() -> None:
+    settings = PGSettings()
+    console = Console()
+    await prepare_table(settings)
+
+    table = Table(title=f'PostgresSink: {ROWS:,} rows of {CONTENT_SIZE:,} chars')
+    table.add_column('Batch size', justify='right')
+    table.add_column('executemany, rows/s', justify='right')
+    table.add_column('copy, rows/s', justify='right')
+    table.add_column('Speedup', justify='right')
+
+    try:
+        for batch_size in BATCH_SIZES:
+            executemany = await measure(settings, 'executemany', batch_size)
+            copy = await measure(settings, 'copy', batch_size)
+            table.add_row(f'{batch_size:,}', f'{executemany:,.0f}', f'{copy:,.0f}', f'{copy / executemany:.2f}x')
+    finally:
+        await drop_table(settings)
+
+    console.print(table)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
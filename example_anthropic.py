@@ -38,12 +38,12 @@ where lsi.lesson_id = '3d6123f6-3124-4d7e-b006-7094e2483522' and si.step_type =
         batch_commit_size=10,
     )
 
-    results = await pipeline.run()
-    if not results:
+    summary = await pipeline.run()
+    if summary is None:
         return
-    successful = sum(1 for r in results if r.success)
-    failed = len(results) - successful
-    print(f'\nProcessed: {len(results)}, Success: {successful}, Failed: {failed}')
+    print(f'\nProcessed: {summary.processed}, Success: {summary.successful}, Failed: {summary.failed}')
+    if summary.failed_ids:
+        print(f'Failed ids: {summary.failed_ids}')
 
 
 if __name__ == '__main__':
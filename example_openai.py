@@ -32,12 +32,12 @@ async def main() -> None:
         batch_commit_size=10,
     )
 
-    results = await pipeline.run()
-    if not results:
+    summary = await pipeline.run()
+    if summary is None:
         return
-    successful = sum(1 for r in results if r.success)
-    failed = len(results) - successful
-    print(f'\nProcessed: {len(results)}, Success: {successful}, Failed: {failed}')
+    print(f'\nProcessed: {summary.processed}, Success: {summary.successful}, Failed: {summary.failed}')
+    if summary.failed_ids:
+        print(f'Failed ids: {summary.failed_ids}')
 
 
 if __name__ == '__main__':
@@ -1,5 +1,6 @@
-from llm_pipeline.models import ProcessingResult, Record
+from llm_pipeline.models import ProcessingResult, Record, RunOptions, RunSummary
 from llm_pipeline.pipeline import Pipeline
+from llm_pipeline.runner import ShardedRunner
 from llm_pipeline.sinks.postgres import PostgresSink
 from llm_pipeline.sources.postgres import PostgresSource
 
@@ -9,4 +10,7 @@ __all__ = [
     'PostgresSource',
     'ProcessingResult',
     'Record',
+    'RunOptions',
+    'RunSummary',
+    'ShardedRunner',
 ]
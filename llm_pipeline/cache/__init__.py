@@ -0,0 +1,4 @@
+from .base import ResponseCache
+from .sqlite import SQLiteResponseCache
+
+__all__ = ['ResponseCache', 'SQLiteResponseCache']
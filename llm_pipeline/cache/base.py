@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+
+from llm_pipeline.models import LLMResponse
+
+
+class ResponseCache(ABC):
+    @abstractmethod
+    async def get(self, key: str) -> LLMResponse | None:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Content-addressed cache key.
+
+        Returns:
+            Cached response, or None on a miss.
+        """
+
+    @abstractmethod
+    async def set(self, key: str, response: LLMResponse) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Content-addressed cache key.
+            response: Provider response to store.
+        """
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Close the cache storage."""
@@ -0,0 +1,152 @@
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from llm_pipeline.cache.base import ResponseCache
+from llm_pipeline.models import LLMResponse
+
+logger = logging.getLogger(__name__)
+
+# Eviction scans the whole table, so it runs once per this many writes
+EVICTION_INTERVAL = 100
+# Access times of cache hits are written in batches of this size instead of one commit per hit
+TOUCH_BATCH_SIZE = 100
+
+
+class SQLiteResponseCache(ResponseCache):
+    def __init__(
+        self,
+        path: str | Path = '.llm_cache.sqlite',
+        max_entries: int | None = None,
+        max_size_bytes: int | None = None,
+        max_age_seconds: float | None = None,
+    ) -> None:
+        """
+        Initialize SQLite response cache.
+
+        Least recently used entries are evicted first when a size limit is exceeded.
+
+        Args:
+            path: Path to the SQLite database file.
+            max_entries: Maximum number of cached responses.
+            max_size_bytes: Maximum total size of cached responses.
+            max_age_seconds: Responses older than this are treated as misses and evicted.
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.max_size_bytes = max_size_bytes
+        self.max_age_seconds = max_age_seconds
+
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._writes = 0
+        # Access times of hits not yet written, by key
+        self._touched: dict[str, float] = {}
+
+    def _ensure_conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            # In WAL mode a crash can only lose the last commits, not corrupt the cache
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                'key TEXT PRIMARY KEY, response TEXT NOT NULL, size INTEGER NOT NULL, '
+                'created_at REAL NOT NULL, accessed_at REAL NOT NULL)'
+            )
+            self._conn.execute('CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)')
+            self._conn.commit()
+        return self._conn
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.max_age_seconds is not None and now - created_at > self.max_age_seconds
+
+    def _get(self, key: str) -> LLMResponse | None:
+        with self._lock:
+            conn = self._ensure_conn()
+            row = conn.execute('SELECT response, created_at FROM responses WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+
+            now = time.time()
+            if self._is_expired(row[1], now):
+                conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+                conn.commit()
+                return None
+
+            self._touched[key] = now
+            if len(self._touched) >= TOUCH_BATCH_SIZE:
+                self._write_touches(conn)
+            return LLMResponse.model_validate_json(row[0])
+
+    def _write_touches(self, conn: sqlite3.Connection) -> None:
+        """Write the access times of recent hits, which eviction orders entries by."""
+        if not self._touched:
+            return
+        conn.executemany(
+            'UPDATE responses SET accessed_at = ? WHERE key = ?',
+            [(accessed_at, key) for key, accessed_at in self._touched.items()],
+        )
+        conn.commit()
+        self._touched.clear()
+
+    def _set(self, key: str, response: LLMResponse) -> None:
+        data = response.model_dump_json()
+        now = time.time()
+
+        with self._lock:
+            conn = self._ensure_conn()
+            conn.execute(
+                'INSERT OR REPLACE INTO responses (key, response, size, created_at, accessed_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (key, data, len(data), now, now),
+            )
+            conn.commit()
+            self._touched.pop(key, None)
+
+            self._writes += 1
+            if self._writes % EVICTION_INTERVAL == 0:
+                self._evict(conn, now)
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        self._write_touches(conn)
+        if self.max_age_seconds is not None:
+            conn.execute('DELETE FROM responses WHERE created_at < ?', (now - self.max_age_seconds,))
+
+        if self.max_entries is not None:
+            conn.execute(
+                'DELETE FROM responses WHERE key IN '
+                '(SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)',
+                (self.max_entries,),
+            )
+
+        if self.max_size_bytes is not None:
+            # Keep the most recently used entries whose running size fits into the limit
+            conn.execute(
+                'DELETE FROM responses WHERE key IN (SELECT key FROM ('
+                'SELECT key, SUM(size) OVER (ORDER BY accessed_at DESC, key) AS running_size FROM responses'
+                ') WHERE running_size > ?)',
+                (self.max_size_bytes,),
+            )
+
+        conn.commit()
+        logger.debug('Response cache eviction done')
+
+    async def get(self, key: str) -> LLMResponse | None:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, response: LLMResponse) -> None:
+        await asyncio.to_thread(self._set, key, response)
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self._close)
+
+    def _close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._evict(self._conn, time.time())
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,5 @@
+from .base import CheckpointStore
+from .file import FileCheckpointStore
+from .postgres import PostgresCheckpointStore
+
+__all__ = ['CheckpointStore', 'FileCheckpointStore', 'PostgresCheckpointStore']
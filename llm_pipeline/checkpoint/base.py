@@ -0,0 +1,51 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+from llm_pipeline.models import Checkpoint
+
+
+class CheckpointStore(ABC):
+    # Store only the highest primary key below which every record is done, instead of every completed id.
+    # Requires the source to yield records in ascending primary key order.
+    high_water_mark: bool = False
+
+    def use_shard(self, shard: int) -> None:
+        """
+        Keep the progress of one shard of a sharded run apart from that of the other shards.
+
+        Must be called before the store is used.
+
+        Args:
+            shard: Index of the shard.
+        """
+        raise NotImplementedError(f'{type(self).__name__} does not support sharded runs')
+
+    @abstractmethod
+    async def load(self) -> Checkpoint:
+        """Return the progress recorded so far."""
+
+    @abstractmethod
+    async def mark_completed(self, record_ids: list[Any]) -> None:
+        """
+        Durably record completed records.
+
+        Args:
+            record_ids: Primary keys of records whose results are committed to the sink.
+        """
+
+    @abstractmethod
+    async def set_high_water_mark(self, record_id: Any) -> None:
+        """
+        Durably record that every record up to and including this primary key is done.
+
+        Args:
+            record_id: New high-water mark.
+        """
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Forget all recorded progress."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Close the checkpoint storage."""
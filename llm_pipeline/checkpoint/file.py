@@ -0,0 +1,84 @@
+import asyncio
+import json
+import logging
+import os
+from pathlib import Path
+from typing import IO, Any
+
+from llm_pipeline.checkpoint.base import CheckpointStore
+from llm_pipeline.models import Checkpoint
+
+logger = logging.getLogger(__name__)
+
+
+class FileCheckpointStore(CheckpointStore):
+    def __init__(self, path: str | Path = '.llm_checkpoint.jsonl', high_water_mark: bool = False) -> None:
+        """
+        Initialize file checkpoint store.
+
+        Progress is appended to a JSON lines file and fsynced after every write.
+
+        Args:
+            path: Path to the checkpoint file.
+            high_water_mark: Record only the highest primary key below which every record is done.
+                Requires the source to yield records in ascending primary key order.
+        """
+        self.path = Path(path)
+        self.high_water_mark = high_water_mark
+        self._file: IO[str] | None = None
+
+    def _load(self) -> Checkpoint:
+        checkpoint = Checkpoint()
+        if not self.path.exists():
+            return checkpoint
+
+        with self.path.open(encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash in the middle of a write leaves a truncated last line
+                    logger.warning('Skipping malformed checkpoint line %s in %s', line_number, self.path)
+                    continue
+
+                if 'completed' in entry:
+                    checkpoint.completed_ids.update(entry['completed'])
+                if 'high_water_mark' in entry:
+                    checkpoint.high_water_mark = entry['high_water_mark']
+
+        return checkpoint
+
+    def _append(self, entry: dict[str, Any]) -> None:
+        if self._file is None:
+            self._file = self.path.open('a', encoding='utf-8')
+
+        self._file.write(json.dumps(entry, ensure_ascii=False, default=str) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _clear(self) -> None:
+        self._close()
+        self.path.unlink(missing_ok=True)
+
+    def _close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def use_shard(self, shard: int) -> None:
+        self.path = self.path.with_name(f'{self.path.stem}.shard{shard}{self.path.suffix}')
+
+    async def load(self) -> Checkpoint:
+        return await asyncio.to_thread(self._load)
+
+    async def mark_completed(self, record_ids: list[Any]) -> None:
+        await asyncio.to_thread(self._append, {'completed': record_ids})
+
+    async def set_high_water_mark(self, record_id: Any) -> None:
+        await asyncio.to_thread(self._append, {'high_water_mark': record_id})
+
+    async def clear(self) -> None:
+        await asyncio.to_thread(self._clear)
+
+    async def close(self) -> None:
+        self._close()
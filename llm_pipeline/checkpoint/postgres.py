@@ -0,0 +1,107 @@
+import json
+from typing import Any
+
+from llm_pipeline.checkpoint.base import CheckpointStore
+from llm_pipeline.config import PGSettings
+from llm_pipeline.models import Checkpoint
+from llm_pipeline.utils.pool import PGPool, PoolManager
+
+COMPLETED = 'completed'
+HIGH_WATER_MARK = 'high_water_mark'
+
+
+class PostgresCheckpointStore(CheckpointStore):
+    def __init__(
+        self,
+        settings: PGSettings,
+        run_id: str = 'default',
+        table: str = 'llm_pipeline_checkpoints',
+        high_water_mark: bool = False,
+        pool_manager: PoolManager | None = None,
+    ) -> None:
+        """
+        Initialize PostgreSQL checkpoint store.
+
+        The table is created on first use. Primary keys are stored JSON-encoded.
+
+        Args:
+            settings: Database connection settings.
+            run_id: Name of the run, so that several pipelines can share one table.
+            table: Checkpoint table name.
+            high_water_mark: Record only the highest primary key below which every record is done.
+                Requires the source to yield records in ascending primary key order.
+            pool_manager: Share the connection pool through this manager. Without it, the store owns its pool.
+        """
+        self.run_id = run_id
+        self.table = table
+        self.high_water_mark = high_water_mark
+        self._settings = settings
+        self._pool = pool_manager.get(settings) if pool_manager is not None else PGPool(settings)
+        self._owns_pool = pool_manager is None
+        self._table_ready = False
+
+    async def _ensure_pool(self) -> PGPool:
+        if not self._table_ready:
+            async with self._pool.acquire() as conn:
+                await conn.execute(
+                    f'CREATE TABLE IF NOT EXISTS {self.table} ('
+                    'run_id TEXT NOT NULL, kind TEXT NOT NULL, record_id TEXT NOT NULL, '
+                    'PRIMARY KEY (run_id, kind, record_id))'
+                )
+            self._table_ready = True
+        return self._pool
+
+    def use_shard(self, shard: int) -> None:
+        self.run_id = f'{self.run_id}:shard{shard}'
+
+    async def load(self) -> Checkpoint:
+        pool = await self._ensure_pool()
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(
+                f'SELECT kind, record_id FROM {self.table} WHERE run_id = $1',  # noqa: S608
+                self.run_id,
+            )
+
+        checkpoint = Checkpoint()
+        for row in rows:
+            if row['kind'] == COMPLETED:
+                checkpoint.completed_ids.add(json.loads(row['record_id']))
+            elif row['kind'] == HIGH_WATER_MARK:
+                checkpoint.high_water_mark = json.loads(row['record_id'])
+        return checkpoint
+
+    async def mark_completed(self, record_ids: list[Any]) -> None:
+        pool = await self._ensure_pool()
+        encoded = [json.dumps(record_id, default=str) for record_id in record_ids]
+        async with pool.acquire() as conn:
+            await conn.execute(
+                f'INSERT INTO {self.table} (run_id, kind, record_id) '
+                'SELECT $1, $2, unnest($3::text[]) ON CONFLICT DO NOTHING',
+                self.run_id,
+                COMPLETED,
+                encoded,
+            )
+
+    async def set_high_water_mark(self, record_id: Any) -> None:
+        pool = await self._ensure_pool()
+        async with pool.acquire() as conn, conn.transaction():
+            await conn.execute(
+                f'DELETE FROM {self.table} WHERE run_id = $1 AND kind = $2',  # noqa: S608
+                self.run_id,
+                HIGH_WATER_MARK,
+            )
+            await conn.execute(
+                f'INSERT INTO {self.table} (run_id, kind, record_id) VALUES ($1, $2, $3)',  # noqa: S608
+                self.run_id,
+                HIGH_WATER_MARK,
+                json.dumps(record_id, default=str),
+            )
+
+    async def clear(self) -> None:
+        pool = await self._ensure_pool()
+        async with pool.acquire() as conn:
+            await conn.execute(f'DELETE FROM {self.table} WHERE run_id = $1', self.run_id)  # noqa: S608
+
+    async def close(self) -> None:
+        if self._owns_pool:
+            await self._pool.close()
@@ -0,0 +1,54 @@
+import logging
+from collections import deque
+from collections.abc import AsyncGenerator
+from contextlib import aclosing
+from typing import Any
+
+from llm_pipeline.checkpoint.base import CheckpointStore
+from llm_pipeline.models import ProcessingResult, Record
+
+logger = logging.getLogger(__name__)
+
+
+class CheckpointTracker:
+    def __init__(self, store: CheckpointStore) -> None:
+        """
+        Initialize checkpoint tracker.
+
+        Persists results to the store once the sink has committed them. Failed records are
+        not recorded as completed, so a resumed run retries them; a high-water mark cannot
+        leave gaps and moves past them.
+
+        Args:
+            store: Checkpoint store to persist progress to.
+        """
+        self.store = store
+        # High-water mark mode: ids in fetch order that are not yet below the mark
+        self._fetched: deque[Any] = deque()
+        self._finished: set[Any] = set()
+
+    async def track(self, records: AsyncGenerator[Record]) -> AsyncGenerator[Record]:
+        """Pass records through, remembering their fetch order when it is needed."""
+        async with aclosing(records) as stream:
+            async for record in stream:
+                if self.store.high_water_mark:
+                    self._fetched.append(record.id)
+                yield record
+
+    async def commit(self, results: list[ProcessingResult]) -> None:
+        """Persist results whose batch the sink has committed."""
+        if not self.store.high_water_mark:
+            record_ids = [result.record_id for result in results if result.success]
+            if record_ids:
+                await self.store.mark_completed(record_ids)
+            return
+
+        self._finished.update(result.record_id for result in results)
+        mark = None
+        while self._fetched and self._fetched[0] in self._finished:
+            mark = self._fetched.popleft()
+            self._finished.discard(mark)
+
+        if mark is not None:
+            await self.store.set_high_water_mark(mark)
+            logger.debug('Checkpoint high-water mark: %s', mark)
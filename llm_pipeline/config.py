@@ -11,6 +11,13 @@ class PGSettings(BaseSettings):
     host: str
     port: int = Field(5432)
 
+    pool_min_size: int = 1
+    pool_max_size: int = 5
+    statement_cache_size: int = 100
+    command_timeout: float | None = None
+    # e.g. PG_SERVER_SETTINGS='{"synchronous_commit": "off"}' for a sink pool
+    server_settings: dict[str, str] = Field(default_factory=dict)
+
     @property
     def dsn(self) -> str:
         return PostgresDsn.build(
@@ -27,12 +34,14 @@ class OpenAISettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix='OPENAI_', extra='ignore')
 
     api_key: str = ''
+    base_url: str | None = None
 
 
 class AnthropicSettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix='ANTHROPIC_', extra='ignore')
 
     api_key: str = ''
+    base_url: str | None = None
 
 
 class YandexSettings(BaseSettings):
@@ -1,4 +1,6 @@
-from typing import Any
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -19,5 +21,135 @@ class ProcessingResult(BaseModel):
     original_content: str
     transformed_content: str | None = None
     tokens_used: int = 0
+    cache_write_tokens: int = 0
+    cache_read_tokens: int = 0
     cost: float = 0.0
+    cache_savings: float = 0.0
+    cached: bool | None = None
+    deduplicated: bool = False
+    time_to_first_token: float | None = None
+    # Index of the cascade tier whose response was kept, None outside a cascade
+    tier: int | None = None
     error: str | None = None
+
+
+class LLMResponse(BaseModel):
+    """Completion returned by a provider together with its usage."""
+
+    content: str
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_write_tokens: int = 0
+    cache_read_tokens: int = 0
+    cost: float = 0.0
+    cache_savings: float = 0.0
+    # True/False for a response cache hit/miss, None when no response cache is used
+    cached: bool | None = None
+    # Response of an identical payload sent earlier in the same run
+    deduplicated: bool = False
+    # Seconds until the first output chunk arrived, set for streamed requests
+    time_to_first_token: float | None = None
+
+    @property
+    def tokens_used(self) -> int:
+        """All input (uncached, cache write and cache read) and output tokens."""
+        return self.input_tokens + self.cache_write_tokens + self.cache_read_tokens + self.output_tokens
+
+
+class RequestTimings(BaseModel):
+    """Timings of one HTTP request, in seconds."""
+
+    # Connection setup is None when a pooled keep-alive connection was reused.
+    # Name resolution happens inside the TCP connect and is included in its time.
+    connect: float | None = None
+    tls: float | None = None
+    # From sending the request headers to receiving the response headers
+    ttfb: float = 0.0
+    http_version: str = ''
+
+    @property
+    def reused_connection(self) -> bool:
+        return self.connect is None
+
+
+class BatchItemResult(BaseModel):
+    """Result of a single request inside a provider batch job."""
+
+    custom_id: str
+    response: LLMResponse | None = None
+    error: str | None = None
+
+
+class Checkpoint(BaseModel):
+    """Progress of a previous run, used to resume it."""
+
+    completed_ids: set[Any] = Field(default_factory=set)
+    high_water_mark: Any = None
+
+
+class TierStats(BaseModel):
+    """Requests, cost and latency of one cascade tier."""
+
+    tier: int
+    model: str
+    requests: int = 0
+    accepted: int = 0
+    cost: float = 0.0
+    total_latency: float = 0.0
+
+    @property
+    def escalated(self) -> int:
+        return self.requests - self.accepted
+
+    @property
+    def mean_latency(self) -> float:
+        return self.total_latency / self.requests if self.requests else 0.0
+
+
+class RunOptions(BaseModel):
+    """How a pipeline run writes results, counts records and limits its spend."""
+
+    # Maximum seconds a result waits for its batch to be committed
+    flush_interval: float = 0.5
+    # Maximum number of results waiting to be written before processing slows down
+    write_queue_size: int = 1000
+    # How the total number of records is obtained. "exact" counts them before processing starts;
+    # "estimate" uses the source's cheap estimate; "background" starts processing right away and
+    # sets the total once the exact count finishes
+    count_mode: Literal['exact', 'estimate', 'background'] = 'exact'
+    # Write every full result to this JSON lines file. The file is overwritten, or appended to when
+    # resuming. Only aggregate statistics and failed record ids are kept in memory
+    results_file: Path | None = None
+    # Spend limit in dollars. Before a record is sent its cost is projected from the token estimate
+    # and provider pricing, scaled by the actual to projected cost ratio seen so far; once the
+    # projection would cross the limit, no more records are read and the run ends after the
+    # requests in flight. ShardedRunner gives every worker an equal share of the limit
+    max_cost: float | None = Field(default=None, gt=0)
+
+
+class RunSummary(BaseModel):
+    """Aggregate outcome of a pipeline run. Full results are only kept in ``results_file``, if any."""
+
+    successful: int = 0
+    failed: int = 0
+    failed_ids: list[Any] = Field(default_factory=list)
+    total_tokens: int = 0
+    total_cost: float = 0.0
+    duration_seconds: float = 0.0
+    results_file: Path | None = None
+    # The run stopped early because the cost budget was reached
+    budget_exhausted: bool = False
+    tiers: list[TierStats] = Field(default_factory=list)
+
+    @property
+    def processed(self) -> int:
+        return self.successful + self.failed
+
+    def iter_results(self) -> Iterator[ProcessingResult]:
+        """Read full results back from ``results_file``."""
+        if self.results_file is None:
+            raise ValueError('Results were not written to a file')
+
+        with self.results_file.open(encoding='utf-8') as f:
+            for line in f:
+                yield ProcessingResult.model_validate_json(line)
@@ -2,16 +2,24 @@ import asyncio
 import logging
 import signal
 import time
+from collections.abc import AsyncGenerator, Callable
+from contextlib import aclosing
+from functools import partial
 from pathlib import Path
+from typing import IO, Any
 
 from rich.console import Console
 
-from llm_pipeline.models import ProcessingResult
+from llm_pipeline.checkpoint.base import CheckpointStore
+from llm_pipeline.checkpoint.tracker import CheckpointTracker
+from llm_pipeline.models import ProcessingResult, Record, RunOptions, RunSummary
 from llm_pipeline.providers.base import LLMProvider
 from llm_pipeline.sinks.base import DataSink
-from llm_pipeline.sources.base import DataSource
+from llm_pipeline.sinks.writer import BackgroundWriter
+from llm_pipeline.sources.base import DataSource, ResumableSource
 from llm_pipeline.strategies.base import ProcessingStrategy
 from llm_pipeline.strategies.sequential import SequentialStrategy
+from llm_pipeline.utils.budget import CostBudget
 from llm_pipeline.utils.logging import setup_logging
 from llm_pipeline.utils.progress import ProgressTracker
 from llm_pipeline.utils.retry import with_retry
@@ -31,6 +39,10 @@ class Pipeline:
         validate_sql: bool = True,
         batch_commit_size: int = 10,
         sql_validation_prompt_file: str | Path | None = None,
+        progress_factory: Callable[[int, Console], ProgressTracker] = ProgressTracker,
+        checkpoint: CheckpointStore | None = None,
+        resume: bool = False,
+        options: RunOptions | None = None,
     ) -> None:
         """
         Initialize the pipeline.
@@ -44,6 +56,11 @@ class Pipeline:
             validate_sql: Whether to validate SQL queries before processing.
             batch_commit_size: Number of records before committing a batch.
             sql_validation_prompt_file: Optional path to SQL validation prompt.
+            progress_factory: Creates the progress tracker from the total number of records and the console.
+            checkpoint: Store recording records whose results were committed to the sink.
+            resume: Skip records completed by a previous run recorded in ``checkpoint``.
+                Without it, the recorded progress is cleared at start.
+            options: Result writing, record counting and spend limit settings of the run.
         """
         self.source = source
         self.sink = sink
@@ -53,10 +70,20 @@ class Pipeline:
         self.validate_sql = validate_sql
         self.batch_commit_size = batch_commit_size
         self.sql_validation_prompt_file = sql_validation_prompt_file
+        self.progress_factory = progress_factory
+        self.checkpoint = checkpoint
+        self.resume = resume
+        self.options = options or RunOptions()
+
+        if resume and checkpoint is None:
+            raise ValueError('resume requires a checkpoint store')
+        if resume and not isinstance(source, ResumableSource):
+            raise ValueError(f'{type(source).__name__} does not support resuming')
 
         self._shutdown_event = asyncio.Event()
+        # Records held for an open circuit must not delay a graceful shutdown
+        self.strategy.shutdown_event = self._shutdown_event
         self.console = Console()
-        self.results: list[ProcessingResult] = []
 
     def _load_prompt(self) -> str:
         if not self.prompt_file.exists():
@@ -105,67 +132,203 @@ class Pipeline:
         except Exception:
             return False
 
-    async def run(self) -> list[ProcessingResult] | None:
-        """Run the pipeline."""
+    async def _prepare_checkpoint(self, checkpoint: CheckpointStore) -> None:
+        if not self.resume:
+            await checkpoint.clear()
+            return
+
+        state = await checkpoint.load()
+        logger.info(
+            'Resuming: %s records completed, high-water mark %s', len(state.completed_ids), state.high_water_mark
+        )
+        if isinstance(self.source, ResumableSource):
+            self.source.resume_from(state)
+
+    @staticmethod
+    def _apply_count(progress: ProgressTracker, task: asyncio.Task[int]) -> None:
+        """Set the progress total from a finished background count."""
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            logger.warning('Background record count failed: %s', task.exception())
+            return
+
+        logger.info('Total records to process: %s', task.result())
+        progress.set_total(task.result())
+
+    async def _within_budget(
+        self, records: AsyncGenerator[Record], prompt: str, budget: CostBudget
+    ) -> AsyncGenerator[Record]:
+        """Pass records through while their projected cost fits into the budget."""
+        async with aclosing(records) as stream:
+            async for record in stream:
+                if not budget.reserve(record.id, self.provider.estimate_cost(prompt, record.content)):
+                    return
+                yield record
+
+    async def _count_records(self) -> int | None:
+        """Total number of records according to ``count_mode``, None while it is unknown."""
+        if self.options.count_mode == 'exact':
+            total_records = await self.source.count_records()
+            logger.info('Total records to process: %s', total_records)
+            return total_records
+        if self.options.count_mode == 'estimate':
+            total_records = await self.source.estimate_records()
+            logger.info('Estimated records to process: %s', total_records)
+            return total_records
+        return None
+
+    def _start_background_count(self, progress: ProgressTracker) -> asyncio.Task[int] | None:
+        if self.options.count_mode != 'background':
+            return None
+        count_task = asyncio.create_task(self.source.count_records())
+        count_task.add_done_callback(partial(self._apply_count, progress))
+        return count_task
+
+    def _open_results_file(self) -> IO[str] | None:
+        if self.options.results_file is None:
+            return None
+        # A resumed run continues the previous run's file; a fresh run must not mix with it
+        return self.options.results_file.open('a' if self.resume else 'w', encoding='utf-8')
+
+    async def _handle_result(
+        self,
+        result: ProcessingResult,
+        writer: BackgroundWriter,
+        progress: ProgressTracker,
+        failed_ids: list[Any],
+        results_file: IO[str] | None,
+    ) -> None:
+        """Queue a result for the sink and record it in the progress, failed ids and results file."""
+        await writer.put(result)
+        if not result.success:
+            failed_ids.append(result.record_id)
+        if results_file is not None:
+            results_file.write(result.model_dump_json() + '\n')
+
+        progress.update(
+            success=result.success,
+            tokens=result.tokens_used,
+            cost=result.cost,
+            cache_write_tokens=result.cache_write_tokens,
+            cache_read_tokens=result.cache_read_tokens,
+            cache_savings=result.cache_savings,
+            cached=result.cached,
+            deduplicated=result.deduplicated,
+            writer_queue_depth=writer.queue_depth,
+            time_to_first_token=result.time_to_first_token,
+        )
+
+    async def _close(
+        self, writer: BackgroundWriter, count_task: asyncio.Task[int] | None, results_file: IO[str] | None
+    ) -> None:
+        """Write the remaining results and release everything the run used."""
+        if count_task is not None:
+            count_task.cancel()
+        try:
+            # Results already produced are still written when processing fails
+            await writer.close()
+        except Exception as e:
+            logger.error('Failed to write remaining results: %s', e)
+        await self.source.close()
+        await self.sink.close()
+        await self.provider.close()
+        await self.strategy.close()
+        if self.checkpoint is not None:
+            await self.checkpoint.close()
+        if results_file is not None:
+            results_file.close()
+
+    async def run(self) -> RunSummary | None:
+        """
+        Run the pipeline.
+
+        Returns:
+            Summary of the run, or None if SQL validation failed.
+        """
 
         setup_logging()
 
         logger.info('Starting pipeline with provider: %s', self.provider.name)
         logger.info('Model: %s', self.provider.model)
 
-        if self.validate_sql:
-            is_valid = await self._validate_sql_queries()
-            if not is_valid:
-                return None
+        if self.validate_sql and not await self._validate_sql_queries():
+            return None
 
         prompt = self._load_prompt()
         logger.info('Loaded prompt from: %s', self.prompt_file)
 
         self._setup_signal_handlers()
 
-        total_records = await self.source.count_records()
-        logger.info('Total records to process: %s', total_records)
+        if self.checkpoint is not None:
+            await self._prepare_checkpoint(self.checkpoint)
 
-        if total_records == 0:
+        total_records = await self._count_records()
+        if self.options.count_mode == 'exact' and total_records == 0:
             logger.warning('No records to process')
-            return []
+            return RunSummary(results_file=self.options.results_file)
 
+        return await self._process(prompt, total_records)
+
+    async def _process(self, prompt: str, total_records: int | None) -> RunSummary:
+        """Stream records through the strategy into the sink."""
         start_time = time.monotonic()
-        records_processed = 0
+        failed_ids: list[Any] = []
+        results_file: IO[str] | None = None
+        count_task: asyncio.Task[int] | None = None
+        tracker = CheckpointTracker(self.checkpoint) if self.checkpoint is not None else None
+        budget = CostBudget(self.options.max_cost) if self.options.max_cost is not None else None
+        records = self.source.fetch_records()
+        if budget is not None:
+            records = self._within_budget(records, prompt, budget)
+        if tracker is not None:
+            records = tracker.track(records)
+
+        # Commits run in a separate task, so that a slow database does not stall request dispatch
+        writer = BackgroundWriter(
+            self.sink,
+            batch_size=self.batch_commit_size,
+            flush_interval=self.options.flush_interval,
+            max_queue_size=self.options.write_queue_size,
+            on_commit=tracker.commit if tracker is not None else None,
+        )
 
         try:
-            with ProgressTracker(total_records, self.console) as progress:
-                async for result in self.strategy.process(
-                    self.source.fetch_records(),
-                    self.provider,
-                    prompt,
-                ):
-                    if self._shutdown_event.is_set():
-                        logger.warning('Shutdown requested, finishing current batch...')
-                        break
-
-                    self.results.append(result)
-                    records_processed += 1
+            results_file = self._open_results_file()
 
-                    if result.success and result.transformed_content:
-                        await self.sink.write_record(result.record_id, result.transformed_content)
+            with self.progress_factory(total_records, self.console) as progress:
+                count_task = self._start_background_count(progress)
+                writer.start()
+                async with aclosing(self.strategy.process(records, self.provider, prompt)) as stream:
+                    async for result in stream:
+                        if self._shutdown_event.is_set():
+                            logger.warning('Shutdown requested, finishing current batch...')
+                            break
 
-                    progress.update(success=result.success, tokens=result.tokens_used, cost=result.cost)
+                        if budget is not None:
+                            budget.settle(result.record_id, result.cost)
+                        await self._handle_result(result, writer, progress, failed_ids, results_file)
 
-                    if records_processed % self.batch_commit_size == 0:
-                        await self.sink.commit_batch()
-                        logger.debug('Committed batch at record %s', records_processed)
-
-                await self.sink.commit_batch()
+                await writer.close()
 
                 duration = time.monotonic() - start_time
-                progress.print_summary(duration)
+                tiers = self.strategy.tier_stats()
+                progress.print_summary(duration, tiers)
+
+                return RunSummary(
+                    successful=progress.successful,
+                    failed=progress.failed,
+                    failed_ids=failed_ids,
+                    total_tokens=progress.total_tokens,
+                    total_cost=progress.total_cost,
+                    duration_seconds=duration,
+                    results_file=self.options.results_file,
+                    budget_exhausted=budget is not None and budget.exhausted,
+                    tiers=tiers,
+                )
 
         except Exception as e:
             logger.error('Pipeline error: %s', e)
             raise
         finally:
-            await self.source.close()
-            await self.sink.close()
-
-        return self.results
+            await self._close(writer, count_task, results_file)
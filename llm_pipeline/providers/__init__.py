@@ -1,6 +1,20 @@
 from .anthropic import AnthropicProvider
-from .base import LLMProvider
+from .base import BatchProvider, ContextWindowExceededError, LLMProvider, StreamAbortedError
+from .cached import CachedProvider
+from .dedup import DeduplicatingProvider
 from .openai import OpenAIProvider
+from .router import HedgedRouter
 from .yandex import YandexProvider
 
-__all__ = ['AnthropicProvider', 'LLMProvider', 'OpenAIProvider', 'YandexProvider']
+__all__ = [
+    'AnthropicProvider',
+    'BatchProvider',
+    'CachedProvider',
+    'ContextWindowExceededError',
+    'DeduplicatingProvider',
+    'HedgedRouter',
+    'LLMProvider',
+    'OpenAIProvider',
+    'StreamAbortedError',
+    'YandexProvider',
+]
@@ -1,8 +1,17 @@
+from collections.abc import AsyncGenerator
+
 from anthropic import AsyncAnthropic
-from anthropic.types import MessageParam
+from anthropic.types import CacheControlEphemeralParam, Message, MessageParam, TextBlockParam
+from anthropic.types.message_create_params import MessageCreateParamsNonStreaming
+from anthropic.types.messages.batch_create_params import Request
 
 from llm_pipeline.config import AnthropicSettings
-from llm_pipeline.providers.base import LLMProvider
+from llm_pipeline.models import BatchItemResult, LLMResponse
+from llm_pipeline.providers.base import BatchProvider, LLMProvider
+from llm_pipeline.utils.circuit_breaker import CircuitBreaker
+from llm_pipeline.utils.http import HTTPTransport
+from llm_pipeline.utils.rate_limit import TokenBucketLimiter
+from llm_pipeline.utils.tokens import TokenEstimator
 
 PRICING = {
     # https://platform.claude.com/docs/en/about-claude/pricing
@@ -11,14 +20,31 @@ PRICING = {
     'claude-3-5-haiku-20241022': {'input': 0.0008, 'output': 0.004},
 }
 
+CONTEXT_WINDOWS = {
+    'claude-sonnet-4-5-20250929': 200_000,
+    'claude-haiku-4-5-20251001': 200_000,
+    'claude-3-5-haiku-20241022': 200_000,
+}
+
+# Message Batches are billed at 50% of the standard price
+BATCH_DISCOUNT = 0.5
+# Prompt cache writes and reads relative to the base input price (5-minute cache)
+CACHE_WRITE_MULTIPLIER = 1.25
+CACHE_READ_MULTIPLIER = 0.1
 
-class AnthropicProvider(LLMProvider):
+
+class AnthropicProvider(LLMProvider, BatchProvider):
     def __init__(
         self,
         settings: AnthropicSettings,
         model: str = 'claude-3-5-haiku-20241022',
         temperature: float = 0.7,
         max_tokens: int = 4096,
+        rate_limiter: TokenBucketLimiter | None = None,
+        cache_prompt: bool = True,
+        transport: HTTPTransport | None = None,
+        token_estimator: TokenEstimator | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
     ) -> None:
         """
         Initialize Anthropic provider
@@ -28,39 +54,138 @@ class AnthropicProvider(LLMProvider):
             temperature: Sampling temperature
             max_tokens: Maximum tokens in response
             settings: Anthropic settings. If None, loads from environment
+            rate_limiter: Optional requests/min and tokens/min limiter
+            cache_prompt: Mark the system prompt for prompt caching
+            transport: Shared HTTP transport. Without it, the SDK's own connection pool is used
+            token_estimator: Local token counting for rate limits, context window and cost checks
+            circuit_breaker: Stops sending requests while the provider is failing
         """
-        super().__init__('Anthropic', model, temperature)
+        super().__init__('Anthropic', model, temperature, rate_limiter, token_estimator, circuit_breaker)
+        self.context_window = CONTEXT_WINDOWS.get(model)
         self.max_tokens = max_tokens
+        self.cache_prompt = cache_prompt
         self._settings = settings
-        self._client = AsyncAnthropic(api_key=self._settings.api_key)
+        self._transport = transport
+        self._client = AsyncAnthropic(
+            api_key=self._settings.api_key,
+            base_url=self._settings.base_url,
+            http_client=transport.client if transport is not None else None,
+            # Retries are handled by with_retry, which honors Retry-After and the retry budget
+            max_retries=0,
+        )
+
+    async def close(self) -> None:
+        # A shared transport is closed by its owner
+        if self._transport is None:
+            await self._client.close()
 
-    def _calculate_cost(self, input_tokens: int, output_tokens: int) -> float:
+    def _calculate_cost(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        cache_write_tokens: int = 0,
+        cache_read_tokens: int = 0,
+        batch: bool = False,
+    ) -> float:
         """Calculate estimated cost based on token usage."""
         pricing = PRICING.get(self.model, {'input': 0.003, 'output': 0.015})
-        input_cost = (input_tokens / 1000) * pricing['input']
+        billed_input_tokens = (
+            input_tokens + cache_write_tokens * CACHE_WRITE_MULTIPLIER + cache_read_tokens * CACHE_READ_MULTIPLIER
+        )
+        input_cost = (billed_input_tokens / 1000) * pricing['input']
         output_cost = (output_tokens / 1000) * pricing['output']
-        return input_cost + output_cost
+        cost = input_cost + output_cost
+        return cost * BATCH_DISCOUNT if batch else cost
 
-    async def execute(self, prompt: str, content: str) -> tuple[str, int, float]:
-        """Transform content using Anthropic"""
-        response = await self._client.messages.create(
+    def _message_params(self, prompt: str, content: str) -> MessageCreateParamsNonStreaming:
+        # Empty text blocks are rejected by the API, so only non-empty prompts are cached
+        system: str | list[TextBlockParam] = prompt
+        if self.cache_prompt and prompt:
+            system = [
+                TextBlockParam(type='text', text=prompt, cache_control=CacheControlEphemeralParam(type='ephemeral'))
+            ]
+
+        return MessageCreateParamsNonStreaming(
             model=self.model,
-            max_tokens=self.max_tokens,
+            max_tokens=self._output_limit(prompt, content) or self.max_tokens,
             temperature=self.temperature,
-            system=prompt,
+            system=system,
             messages=[
                 MessageParam(role='user', content=content),
             ],
         )
 
+    def _parse_message(self, message: Message, batch: bool = False) -> LLMResponse:
         result = ''
-        for block in response.content:
+        for block in message.content:
             if block.type == 'text':
                 result += block.text
 
-        input_tokens = response.usage.input_tokens
-        output_tokens = response.usage.output_tokens
-        total_tokens = input_tokens + output_tokens
-        cost = self._calculate_cost(input_tokens, output_tokens)
+        usage = message.usage
+        input_tokens = usage.input_tokens
+        output_tokens = usage.output_tokens
+        cache_write_tokens = usage.cache_creation_input_tokens or 0
+        cache_read_tokens = usage.cache_read_input_tokens or 0
+
+        cost = self._calculate_cost(input_tokens, output_tokens, cache_write_tokens, cache_read_tokens, batch=batch)
+        uncached_cost = self._calculate_cost(
+            input_tokens + cache_write_tokens + cache_read_tokens, output_tokens, batch=batch
+        )
+
+        return LLMResponse(
+            content=result,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cache_write_tokens=cache_write_tokens,
+            cache_read_tokens=cache_read_tokens,
+            cost=cost,
+            cache_savings=uncached_cost - cost,
+        )
+
+    async def _execute(self, prompt: str, content: str) -> LLMResponse:
+        """Transform content using Anthropic"""
+        response = await self._client.messages.create(**self._message_params(prompt, content))
+        return self._parse_message(response)
+
+    async def _stream(self, prompt: str, content: str) -> AsyncGenerator[str | LLMResponse]:
+        """Stream content from Anthropic"""
+        async with self._client.messages.stream(**self._message_params(prompt, content)) as stream:
+            async for event in stream:
+                if event.type == 'message_start':
+                    # Input usage is known up front, output usage only at the end
+                    yield self._parse_message(event.message)
+                elif event.type == 'text':
+                    yield event.text
+            yield self._parse_message(await stream.get_final_message())
+
+    async def submit_batch(self, prompt: str, requests: dict[str, str]) -> str:
+        """Submit requests as a Message Batch"""
+        batch = await self._client.messages.batches.create(
+            requests=[
+                Request(custom_id=custom_id, params=self._message_params(prompt, content))
+                for custom_id, content in requests.items()
+            ],
+        )
+        return batch.id
+
+    async def is_batch_done(self, batch_id: str) -> bool:
+        batch = await self._client.messages.batches.retrieve(batch_id)
+        return batch.processing_status == 'ended'
+
+    async def fetch_batch_results(self, batch_id: str) -> AsyncGenerator[BatchItemResult]:
+        """Stream results of an ended Message Batch"""
+        async for entry in await self._client.messages.batches.results(batch_id):
+            result = entry.result
+
+            if result.type == 'succeeded':
+                yield BatchItemResult(
+                    custom_id=entry.custom_id,
+                    response=self._parse_message(result.message, batch=True),
+                )
+            elif result.type == 'errored':
+                yield BatchItemResult(custom_id=entry.custom_id, error=result.error.error.message)
+            else:
+                yield BatchItemResult(custom_id=entry.custom_id, error=f'Batch request {result.type}')
 
-        return result, total_tokens, cost
+    async def cancel_batch(self, batch_id: str) -> None:
+        await self._client.messages.batches.cancel(batch_id)
@@ -1,21 +1,123 @@
+import time
 from abc import ABC, abstractmethod
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from contextlib import aclosing
+
+from llm_pipeline.models import BatchItemResult, LLMResponse
+from llm_pipeline.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from llm_pipeline.utils.rate_limit import TokenBucketLimiter
+from llm_pipeline.utils.retry import RateLimitError, classify_error
+from llm_pipeline.utils.tokens import TokenEstimator
+
+StreamValidator = Callable[[str], tuple[bool, str | None]]
+
+
+class StreamAbortedError(Exception):
+    """Generation was cancelled because the partial output failed validation."""
+
+    def __init__(self, message: str, response: LLMResponse) -> None:
+        """
+        Args:
+            message: Validation error.
+            response: Output received before the abort, with estimated usage and cost.
+        """
+        super().__init__(message)
+        self.response = response
+
+
+class ContextWindowExceededError(Exception):
+    """The estimated request does not fit into the model context window. It is not sent."""
 
 
 class LLMProvider(ABC):
-    def __init__(self, name: str, model: str, temperature: float = 0.7) -> None:
+    max_tokens: int | None = None
+    # Input + output tokens the model accepts, None when unknown
+    context_window: int | None = None
+
+    def __init__(
+        self,
+        name: str,
+        model: str,
+        temperature: float = 0.7,
+        rate_limiter: TokenBucketLimiter | None = None,
+        token_estimator: TokenEstimator | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+    ) -> None:
         """
         Initialize provider.
 
         Args:
             model: Model identifier.
             temperature: Sampling temperature.
+            rate_limiter: Optional requests/min and tokens/min limiter. May be shared between providers.
+            token_estimator: Local token counting. Defaults to a length heuristic.
+            circuit_breaker: Stops sending requests while the provider is failing. May be shared between providers.
         """
         self.name = name
         self.model = model
         self.temperature = temperature
+        self.rate_limiter = rate_limiter
+        self.token_estimator = token_estimator or TokenEstimator()
+        self.circuit_breaker = circuit_breaker
 
-    @abstractmethod
-    async def execute(self, prompt: str, content: str) -> tuple[str, int, float]:
+    def _estimate_usage(self, prompt: str, content: str) -> tuple[int, int]:
+        """Estimated input and output tokens of a request."""
+        content_tokens = self.token_estimator.count(content)
+        input_tokens = self.token_estimator.count_prompt(prompt) + content_tokens
+        output_tokens = self.token_estimator.estimate_output(content_tokens)
+        limit = self._output_limit(prompt, content)
+        return input_tokens, min(output_tokens, limit) if limit is not None else output_tokens
+
+    def _estimate_tokens(self, prompt: str, content: str) -> int:
+        """Rough input + output token estimate used to reserve rate limiter quota."""
+        return sum(self._estimate_usage(prompt, content))
+
+    def _output_limit(self, prompt: str, content: str) -> int | None:
+        """
+        Per-request ``max_tokens``: the configured limit, lowered to the expected output size when
+        the estimator has an output ratio and to the room left in the context window.
+        """
+        limit = self.max_tokens
+        estimator = self.token_estimator
+        content_tokens = estimator.count(content)
+
+        if estimator.output_ratio is not None:
+            expected = max(estimator.estimate_output(content_tokens), estimator.min_output_tokens)
+            limit = min(limit, expected) if limit is not None else expected
+
+        if limit is not None and self.context_window is not None:
+            room = self.context_window - estimator.count_prompt(prompt) - content_tokens
+            limit = max(min(limit, room), 1)
+
+        return limit
+
+    def estimate_cost(self, prompt: str, content: str) -> float:
+        """Projected cost of a request from the estimated usage and provider pricing."""
+        try:
+            self.check_context_window(prompt, content)
+        except ContextWindowExceededError:
+            # Skipped without a request
+            return 0.0
+        return self._calculate_cost(*self._estimate_usage(prompt, content))
+
+    def check_context_window(self, prompt: str, content: str) -> None:
+        """
+        Raise if the request would not leave room for the output in the context window.
+
+        Raises:
+            ContextWindowExceededError: The estimated input is too large.
+        """
+        if self.context_window is None:
+            return
+
+        input_tokens = self.token_estimator.count_prompt(prompt) + self.token_estimator.count(content)
+        if input_tokens + self.token_estimator.min_output_tokens > self.context_window:
+            raise ContextWindowExceededError(
+                f'Input of ~{input_tokens} tokens leaves no room for output in the '
+                f'{self.context_window} token context window of {self.model}'
+            )
+
+    async def execute(self, prompt: str, content: str) -> LLMResponse:
         """
         Execute request using the LLM.
 
@@ -24,5 +126,186 @@ class LLMProvider(ABC):
             content: Content to transform.
 
         Returns:
-            Tuple of (transformed_content, tokens_used, estimated_cost).
+            Transformed content with token usage and estimated cost.
+
+        Raises:
+            ContextWindowExceededError: The request would not fit into the context window.
+            CircuitOpenError: The provider's circuit is open, the request was not sent or its failure opened it.
         """
+        return await self._send(prompt, content, lambda: self._execute(prompt, content))
+
+    async def execute_stream(self, prompt: str, content: str, validator: StreamValidator | None = None) -> LLMResponse:
+        """
+        Execute request, streaming the output and cancelling generation once it fails validation.
+
+        Args:
+            prompt: System/instruction prompt.
+            content: Content to transform.
+            validator: Called with the output received so far after every chunk. None only streams.
+
+        Returns:
+            Transformed content with token usage, estimated cost and time to first token.
+
+        Raises:
+            ContextWindowExceededError: The request would not fit into the context window.
+            CircuitOpenError: The provider's circuit is open, the request was not sent or its failure opened it.
+            StreamAbortedError: The partial output failed validation.
+        """
+        return await self._send(prompt, content, lambda: self._execute_stream(prompt, content, validator))
+
+    async def _send(self, prompt: str, content: str, request: Callable[[], Awaitable[LLMResponse]]) -> LLMResponse:
+        self.check_context_window(prompt, content)
+        breaker = self.circuit_breaker
+        if breaker is None:
+            return await self._send_limited(prompt, content, request)
+
+        if not breaker.allow_request():
+            raise CircuitOpenError(breaker)
+        try:
+            response = await self._send_limited(prompt, content, request)
+        except Exception as e:
+            error = classify_error(e)
+            if error is None or isinstance(error, RateLimitError):
+                # The provider answered: a bad request or backpressure, not an outage
+                breaker.release_probe()
+                raise
+            breaker.record_failure()
+            if breaker.state != 'closed':
+                # Fail fast instead of retrying against an unavailable provider
+                raise CircuitOpenError(breaker) from e
+            raise
+        except BaseException:
+            breaker.release_probe()
+            raise
+
+        breaker.record_success()
+        return response
+
+    async def _send_limited(
+        self, prompt: str, content: str, request: Callable[[], Awaitable[LLMResponse]]
+    ) -> LLMResponse:
+        if self.rate_limiter is None:
+            return await request()
+
+        reserved = await self.rate_limiter.reserve(self._estimate_tokens(prompt, content))
+        # Failed requests return their token reservation, the request slot stays used
+        tokens_used = 0
+        try:
+            response = await request()
+            tokens_used = response.tokens_used
+            return response
+        except StreamAbortedError as e:
+            tokens_used = e.response.tokens_used
+            raise
+        finally:
+            self.rate_limiter.settle(reserved, tokens_used)
+
+    async def _execute_stream(self, prompt: str, content: str, validator: StreamValidator | None) -> LLMResponse:
+        start = time.monotonic()
+        time_to_first_token: float | None = None
+        text = ''
+        usage = LLMResponse(content='')
+
+        async with aclosing(self._stream(prompt, content)) as stream:
+            async for chunk in stream:
+                if isinstance(chunk, LLMResponse):
+                    usage = chunk
+                    continue
+
+                if time_to_first_token is None:
+                    time_to_first_token = time.monotonic() - start
+                text += chunk
+                if validator is None:
+                    continue
+
+                is_valid, error = validator(text)
+                if not is_valid:
+                    # Leaving the stream closes the connection, which stops generation
+                    partial = self._partial_response(prompt, content, text, usage)
+                    raise StreamAbortedError(
+                        error or 'Streaming validation failed',
+                        partial.model_copy(update={'time_to_first_token': time_to_first_token}),
+                    )
+
+        return usage.model_copy(update={'content': text, 'time_to_first_token': time_to_first_token})
+
+    def _partial_response(self, prompt: str, content: str, text: str, usage: LLMResponse) -> LLMResponse:
+        """Estimate usage of an aborted stream from the usage reported so far and the output length."""
+        output_tokens = max(usage.output_tokens, self.token_estimator.count(text))
+        if usage.tokens_used:
+            cost = usage.cost + self._calculate_cost(0, output_tokens - usage.output_tokens)
+            return usage.model_copy(update={'content': text, 'output_tokens': output_tokens, 'cost': cost})
+
+        input_tokens = self.token_estimator.count_prompt(prompt) + self.token_estimator.count(content)
+        return LLMResponse(
+            content=text,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cost=self._calculate_cost(input_tokens, output_tokens),
+        )
+
+    def _calculate_cost(self, input_tokens: int, output_tokens: int) -> float:
+        """Estimated cost of the given usage. Providers without pricing report zero."""
+        return 0.0
+
+    async def _stream(self, prompt: str, content: str) -> AsyncGenerator[str | LLMResponse]:
+        """
+        Stream a single request from the provider API.
+
+        Yields text chunks as they arrive and ``LLMResponse`` objects with the usage reported
+        so far (their content is ignored). Providers without streaming support send the request
+        in one piece.
+
+        Args:
+            prompt: System/instruction prompt.
+            content: Content to transform.
+        """
+        response = await self._execute(prompt, content)
+        yield response.content
+        yield response
+
+    # Optional hook: providers that hold no connections have nothing to release
+    async def close(self) -> None:  # noqa: B027
+        """Release connections held by the provider."""
+
+    @abstractmethod
+    async def _execute(self, prompt: str, content: str) -> LLMResponse:
+        """
+        Send a single request to the provider API.
+
+        Args:
+            prompt: System/instruction prompt.
+            content: Content to transform.
+
+        Returns:
+            Transformed content with token usage and estimated cost.
+        """
+
+
+class BatchProvider(ABC):
+    """Mixin for providers that can run many requests as one asynchronous batch job."""
+
+    @abstractmethod
+    async def submit_batch(self, prompt: str, requests: dict[str, str]) -> str:
+        """
+        Submit a batch job.
+
+        Args:
+            prompt: System/instruction prompt shared by all requests.
+            requests: Content to transform keyed by custom id.
+
+        Returns:
+            Provider batch id.
+        """
+
+    @abstractmethod
+    async def is_batch_done(self, batch_id: str) -> bool:
+        """Return True once the batch has finished and its results can be fetched."""
+
+    @abstractmethod
+    def fetch_batch_results(self, batch_id: str) -> AsyncGenerator[BatchItemResult]:
+        """Yield results of a finished batch, in no particular order."""
+
+    @abstractmethod
+    async def cancel_batch(self, batch_id: str) -> None:
+        """Cancel a batch that is still running."""
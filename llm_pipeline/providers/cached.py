@@ -0,0 +1,79 @@
+import hashlib
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from functools import partial
+
+from llm_pipeline.cache.base import ResponseCache
+from llm_pipeline.models import LLMResponse
+from llm_pipeline.providers.base import LLMProvider, StreamValidator
+from llm_pipeline.validation.response_validator import validate_response
+
+logger = logging.getLogger(__name__)
+
+
+class CachedProvider(LLMProvider):
+    def __init__(
+        self,
+        provider: LLMProvider,
+        cache: ResponseCache,
+        validator: Callable[[str], tuple[bool, str | None]] | None = validate_response,
+    ) -> None:
+        """
+        Wrap a provider with a persistent response cache.
+
+        Cache hits skip the network call and are reported with zero tokens and cost.
+
+        Args:
+            provider: Provider to wrap.
+            cache: Response cache storage. It is owned by the provider and closed with it.
+            validator: Only responses passing this validator are stored. None stores everything.
+        """
+        super().__init__(provider.name, provider.model, provider.temperature)
+        self.provider = provider
+        self.cache = cache
+        self.validator = validator
+        self.hits = 0
+        self.misses = 0
+
+    def _cache_key(self, prompt: str, content: str) -> str:
+        payload = json.dumps(
+            [self.provider.name, self.provider.model, self.provider.temperature, prompt, content],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def estimate_cost(self, prompt: str, content: str) -> float:
+        return self.provider.estimate_cost(prompt, content)
+
+    async def close(self) -> None:
+        try:
+            await self.provider.close()
+        finally:
+            # Applies the final eviction and releases the database connection
+            await self.cache.close()
+
+    async def _execute(self, prompt: str, content: str) -> LLMResponse:
+        return await self._cached(prompt, content, self.provider.execute)
+
+    async def _execute_stream(self, prompt: str, content: str, validator: StreamValidator | None) -> LLMResponse:
+        return await self._cached(prompt, content, partial(self.provider.execute_stream, validator=validator))
+
+    async def _cached(
+        self, prompt: str, content: str, request: Callable[[str, str], Awaitable[LLMResponse]]
+    ) -> LLMResponse:
+        """Return a cached response or call the wrapped provider."""
+        key = self._cache_key(prompt, content)
+
+        cached = await self.cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            return LLMResponse(content=cached.content, cached=True)
+
+        self.misses += 1
+        response = await request(prompt, content)
+
+        if self.validator is None or self.validator(response.content)[0]:
+            await self.cache.set(key, response)
+
+        return response.model_copy(update={'cached': False})
@@ -0,0 +1,109 @@
+import asyncio
+import hashlib
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from functools import partial
+
+from llm_pipeline.models import LLMResponse
+from llm_pipeline.providers.base import LLMProvider, StreamValidator
+from llm_pipeline.validation.response_validator import validate_response
+
+
+class DeduplicatingProvider(LLMProvider):
+    def __init__(
+        self,
+        provider: LLMProvider,
+        max_entries: int = 100_000,
+        validator: Callable[[str], tuple[bool, str | None]] | None = validate_response,
+    ) -> None:
+        """
+        Wrap a provider so that identical payloads within a run are sent only once.
+
+        Concurrent requests for the same payload wait for the one already in flight,
+        later ones reuse its response. Reused responses are reported with zero tokens and cost.
+
+        Args:
+            provider: Provider to wrap.
+            max_entries: Maximum number of completed responses kept in memory (least recently used are dropped).
+            validator: Only responses passing this validator are reused by later requests.
+                None reuses everything.
+        """
+        super().__init__(provider.name, provider.model, provider.temperature)
+        self.provider = provider
+        self.max_entries = max_entries
+        self.validator = validator
+        self.calls_saved = 0
+
+        self._in_flight: dict[str, asyncio.Future[LLMResponse]] = {}
+        self._completed: OrderedDict[str, str] = OrderedDict()
+
+    @staticmethod
+    def _payload_key(prompt: str, content: str) -> str:
+        digest = hashlib.sha256()
+        digest.update(prompt.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(content.encode('utf-8'))
+        return digest.hexdigest()
+
+    def _duplicate(self, content: str) -> LLMResponse:
+        self.calls_saved += 1
+        return LLMResponse(content=content, deduplicated=True)
+
+    def estimate_cost(self, prompt: str, content: str) -> float:
+        return self.provider.estimate_cost(prompt, content)
+
+    async def close(self) -> None:
+        await self.provider.close()
+
+    async def _execute(self, prompt: str, content: str) -> LLMResponse:
+        return await self._deduplicated(prompt, content, self.provider.execute)
+
+    async def _execute_stream(self, prompt: str, content: str, validator: StreamValidator | None) -> LLMResponse:
+        return await self._deduplicated(prompt, content, partial(self.provider.execute_stream, validator=validator))
+
+    async def _deduplicated(
+        self, prompt: str, content: str, request: Callable[[str, str], Awaitable[LLMResponse]]
+    ) -> LLMResponse:
+        """Send the payload once, or reuse the response of an identical one."""
+        key = self._payload_key(prompt, content)
+
+        while True:
+            if key in self._completed:
+                self._completed.move_to_end(key)
+                return self._duplicate(self._completed[key])
+
+            in_flight = self._in_flight.get(key)
+            if in_flight is None:
+                break
+
+            try:
+                response = await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                if in_flight.cancelled():
+                    # The request we waited for was cancelled, send it ourselves
+                    continue
+                raise
+            return self._duplicate(response.content)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            response = await request(prompt, content)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters (if any) re-raise it; mark it retrieved so asyncio does not warn when there are none
+            future.exception()
+            raise
+        finally:
+            del self._in_flight[key]
+
+        future.set_result(response)
+        if self.validator is None or self.validator(response.content)[0]:
+            self._completed[key] = response.content
+            if len(self._completed) > self.max_entries:
+                self._completed.popitem(last=False)
+
+        return response
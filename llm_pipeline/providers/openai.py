@@ -1,8 +1,21 @@
+import json
+import logging
+from collections.abc import AsyncGenerator
+from typing import Any
+
 from openai import AsyncOpenAI
-from openai.types.chat import ChatCompletionSystemMessageParam, ChatCompletionUserMessageParam
+from openai.types import CompletionUsage
+from openai.types.chat import ChatCompletion, ChatCompletionSystemMessageParam, ChatCompletionUserMessageParam
 
 from llm_pipeline.config import OpenAISettings
-from llm_pipeline.providers.base import LLMProvider
+from llm_pipeline.models import BatchItemResult, LLMResponse
+from llm_pipeline.providers.base import BatchProvider, LLMProvider
+from llm_pipeline.utils.circuit_breaker import CircuitBreaker
+from llm_pipeline.utils.http import HTTPTransport
+from llm_pipeline.utils.rate_limit import TokenBucketLimiter
+from llm_pipeline.utils.tokens import TokenEstimator
+
+logger = logging.getLogger(__name__)
 
 PRICING = {
     'gpt-4': {'input': 0.03, 'output': 0.06},
@@ -13,9 +26,35 @@ PRICING = {
     'gpt-3.5-turbo': {'input': 0.0005, 'output': 0.0015},
 }
 
+CONTEXT_WINDOWS = {
+    'gpt-4': 8_192,
+    'gpt-4-turbo': 128_000,
+    'gpt-4-turbo-preview': 128_000,
+    'gpt-4o': 128_000,
+    'gpt-4o-mini': 128_000,
+    'gpt-3.5-turbo': 16_385,
+}
+
+# Prompt prefixes served from the automatic cache, relative to the base input price
+CACHED_INPUT_MULTIPLIER = 0.5
 
-class OpenAIProvider(LLMProvider):
-    def __init__(self, settings: OpenAISettings, model: str = 'gpt-4o', temperature: float = 0.7) -> None:
+# Batch API requests are billed at 50% of the standard price
+BATCH_DISCOUNT = 0.5
+BATCH_ENDPOINT = '/v1/chat/completions'
+BATCH_FINAL_STATUSES = {'completed', 'failed', 'expired', 'cancelled'}
+
+
+class OpenAIProvider(LLMProvider, BatchProvider):
+    def __init__(
+        self,
+        settings: OpenAISettings,
+        model: str = 'gpt-4o',
+        temperature: float = 0.7,
+        rate_limiter: TokenBucketLimiter | None = None,
+        transport: HTTPTransport | None = None,
+        token_estimator: TokenEstimator | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+    ) -> None:
         """
         Initialize OpenAI provider.
 
@@ -23,36 +62,163 @@ class OpenAIProvider(LLMProvider):
             model: OpenAI model to use.
             temperature: Sampling temperature.
             settings: OpenAI settings. If None, loads from environment.
+            rate_limiter: Optional requests/min and tokens/min limiter.
+            transport: Shared HTTP transport. Without it, the SDK's own connection pool is used.
+            token_estimator: Local token counting for rate limits, context window and cost checks.
+            circuit_breaker: Stops sending requests while the provider is failing.
         """
-        super().__init__('OpenAI', model, temperature)
+        super().__init__('OpenAI', model, temperature, rate_limiter, token_estimator, circuit_breaker)
+        self.context_window = CONTEXT_WINDOWS.get(model)
         self._settings = settings
-        self._client = AsyncOpenAI(api_key=self._settings.api_key)
+        self._transport = transport
+        self._client = AsyncOpenAI(
+            api_key=self._settings.api_key,
+            base_url=self._settings.base_url,
+            http_client=transport.client if transport is not None else None,
+            # Retries are handled by with_retry, which honors Retry-After and the retry budget
+            max_retries=0,
+        )
+
+    async def close(self) -> None:
+        # A shared transport is closed by its owner
+        if self._transport is None:
+            await self._client.close()
 
-    def _calculate_cost(self, input_tokens: int, output_tokens: int) -> float:
+    def _calculate_cost(
+        self, input_tokens: int, output_tokens: int, cache_read_tokens: int = 0, batch: bool = False
+    ) -> float:
         """Calculate estimated cost based on token usage."""
 
         pricing = PRICING.get(self.model, {'input': 0.01, 'output': 0.03})
-        input_cost = (input_tokens / 1000) * pricing['input']
+        billed_input_tokens = input_tokens + cache_read_tokens * CACHED_INPUT_MULTIPLIER
+        input_cost = (billed_input_tokens / 1000) * pricing['input']
         output_cost = (output_tokens / 1000) * pricing['output']
-        return input_cost + output_cost
+        cost = input_cost + output_cost
+        return cost * BATCH_DISCOUNT if batch else cost
 
-    async def execute(self, prompt: str, content: str) -> tuple[str, int, float]:
-        """Transform content using OpenAI."""
-        response = await self._client.chat.completions.create(
-            model=self.model,
-            temperature=self.temperature,
-            messages=[
+    def _completion_params(self, prompt: str, content: str) -> dict[str, Any]:
+        params: dict[str, Any] = {
+            'model': self.model,
+            'temperature': self.temperature,
+            'messages': [
                 ChatCompletionSystemMessageParam(role='system', content=prompt),
                 ChatCompletionUserMessageParam(role='user', content=content),
             ],
-        )
+        }
+        max_tokens = self._output_limit(prompt, content)
+        if max_tokens is not None:
+            params['max_completion_tokens'] = max_tokens
+        return params
 
-        result = response.choices[0].message.content or ''
-        usage = response.usage
+    def _parse_completion(self, response: ChatCompletion, batch: bool = False) -> LLMResponse:
+        return self._build_response(response.choices[0].message.content or '', response.usage, batch=batch)
 
-        input_tokens = usage.prompt_tokens if usage else 0
+    def _build_response(self, result: str, usage: CompletionUsage | None, batch: bool = False) -> LLMResponse:
+        prompt_tokens = usage.prompt_tokens if usage else 0
         output_tokens = usage.completion_tokens if usage else 0
-        total_tokens = input_tokens + output_tokens
-        cost = self._calculate_cost(input_tokens, output_tokens)
+        details = usage.prompt_tokens_details if usage else None
+        # Prompt caching is automatic; prompt_tokens already include the cached prefix
+        cache_read_tokens = (details.cached_tokens or 0) if details else 0
+        input_tokens = prompt_tokens - cache_read_tokens
+
+        cost = self._calculate_cost(input_tokens, output_tokens, cache_read_tokens, batch=batch)
+        uncached_cost = self._calculate_cost(prompt_tokens, output_tokens, batch=batch)
+
+        return LLMResponse(
+            content=result,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cache_read_tokens=cache_read_tokens,
+            cost=cost,
+            cache_savings=uncached_cost - cost,
+        )
+
+    async def _execute(self, prompt: str, content: str) -> LLMResponse:
+        """Transform content using OpenAI."""
+        response = await self._client.chat.completions.create(**self._completion_params(prompt, content))
+        return self._parse_completion(response)
+
+    async def _stream(self, prompt: str, content: str) -> AsyncGenerator[str | LLMResponse]:
+        """Stream content from OpenAI."""
+        stream = await self._client.chat.completions.create(
+            **self._completion_params(prompt, content),
+            stream=True,
+            stream_options={'include_usage': True},
+        )
+        async with stream:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+                # Usage arrives in a final chunk without choices
+                if chunk.usage is not None:
+                    yield self._build_response('', chunk.usage)
+
+    async def submit_batch(self, prompt: str, requests: dict[str, str]) -> str:
+        """Upload requests as a JSONL file and start a batch job."""
+        lines = [
+            json.dumps(
+                {
+                    'custom_id': custom_id,
+                    'method': 'POST',
+                    'url': BATCH_ENDPOINT,
+                    'body': self._completion_params(prompt, content),
+                },
+                ensure_ascii=False,
+            )
+            for custom_id, content in requests.items()
+        ]
+        request_file = await self._client.files.create(
+            file=('batch_requests.jsonl', '\n'.join(lines).encode('utf-8')),
+            purpose='batch',
+        )
+
+        batch = await self._client.batches.create(
+            input_file_id=request_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window='24h',
+        )
+        return batch.id
+
+    async def is_batch_done(self, batch_id: str) -> bool:
+        batch = await self._client.batches.retrieve(batch_id)
+        return batch.status in BATCH_FINAL_STATUSES
+
+    async def fetch_batch_results(self, batch_id: str) -> AsyncGenerator[BatchItemResult]:
+        """Stream output and error files of a finished batch."""
+        batch = await self._client.batches.retrieve(batch_id)
+        if batch.status != 'completed':
+            logger.error('Batch %s finished with status %s: %s', batch_id, batch.status, batch.errors)
+
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id is None:
+                continue
+            async with self._client.files.with_streaming_response.content(file_id) as response:
+                async for line in response.iter_lines():
+                    if line.strip():
+                        yield self._parse_batch_line(json.loads(line))
+
+        await self._delete_files(batch.input_file_id, batch.output_file_id, batch.error_file_id)
+
+    async def _delete_files(self, *file_ids: str | None) -> None:
+        """Remove the files of a batch whose results were read, so that runs do not fill the account's storage."""
+        for file_id in file_ids:
+            if file_id is None:
+                continue
+            try:
+                await self._client.files.delete(file_id)
+            except Exception as e:
+                logger.warning('Failed to delete batch file %s: %s', file_id, e)
+
+    def _parse_batch_line(self, data: dict[str, Any]) -> BatchItemResult:
+        custom_id = data['custom_id']
+        response = data.get('response') or {}
+
+        if data.get('error') or response.get('status_code') != 200:  # noqa: PLR2004
+            error = data.get('error') or response.get('body', {}).get('error') or {}
+            return BatchItemResult(custom_id=custom_id, error=error.get('message', 'Batch request failed'))
+
+        completion = ChatCompletion.model_validate(response['body'])
+        return BatchItemResult(custom_id=custom_id, response=self._parse_completion(completion, batch=True))
 
-        return result, total_tokens, cost
+    async def cancel_batch(self, batch_id: str) -> None:
+        await self._client.batches.cancel(batch_id)
@@ -0,0 +1,213 @@
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+
+from llm_pipeline.models import LLMResponse
+from llm_pipeline.providers.base import LLMProvider
+from llm_pipeline.utils.circuit_breaker import CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+
+class HedgedRouter(LLMProvider):
+    def __init__(
+        self,
+        providers: list[LLMProvider],
+        hedge_percentile: float = 0.95,
+        initial_hedge_delay: float = 10.0,
+        min_hedge_delay: float = 1.0,
+        min_samples: int = 20,
+        latency_window: int = 500,
+    ) -> None:
+        """
+        Route requests over several providers with hedging and failover.
+
+        A request goes to the first provider whose circuit is closed. If it has not answered
+        after the ``hedge_percentile`` latency observed so far, the same request is sent to the
+        next provider and the first response wins; the other request is cancelled. A provider
+        that fails is skipped for the rest of the request, and its own circuit breaker
+        (``LLMProvider(circuit_breaker=...)``), if any, takes it out of rotation after repeated
+        failures.
+
+        Cancelled hedges are usually still billed, so their estimated cost is added to the cost
+        of the winning response.
+
+        Args:
+            providers: Providers in order of preference.
+            hedge_percentile: Latency percentile after which a hedge request is sent.
+            initial_hedge_delay: Hedge delay in seconds until ``min_samples`` latencies were observed.
+            min_hedge_delay: Lower bound of the hedge delay in seconds.
+            min_samples: Number of latencies needed before the percentile is used.
+            latency_window: Number of most recent latencies the percentile is computed from.
+        """
+        if not providers:
+            raise ValueError('At least one provider is required')
+        if not 0 < hedge_percentile < 1:
+            raise ValueError('hedge_percentile must be between 0 and 1')
+
+        super().__init__('Router', '|'.join(provider.model for provider in providers))
+        self.providers = providers
+        self.hedge_percentile = hedge_percentile
+        self.initial_hedge_delay = initial_hedge_delay
+        self.min_hedge_delay = min_hedge_delay
+        self.min_samples = min_samples
+        self.hedges_sent = 0
+        self.hedges_won = 0
+        self.failovers = 0
+        self.hedge_cost = 0.0
+
+        self._latencies: deque[float] = deque(maxlen=latency_window)
+
+    @property
+    def hedge_delay(self) -> float:
+        """Seconds to wait for a response before sending a hedge request."""
+        if len(self._latencies) < self.min_samples:
+            return self.initial_hedge_delay
+
+        latencies = sorted(self._latencies)
+        index = min(math.ceil(self.hedge_percentile * len(latencies)) - 1, len(latencies) - 1)
+        return max(latencies[index], self.min_hedge_delay)
+
+    def estimate_cost(self, prompt: str, content: str) -> float:
+        return self.providers[0].estimate_cost(prompt, content)
+
+    async def close(self) -> None:
+        if self.hedges_sent or self.failovers:
+            logger.info(
+                'Router: %s hedges sent, %s won, $%.4f hedge cost, %s failovers',
+                self.hedges_sent,
+                self.hedges_won,
+                self.hedge_cost,
+                self.failovers,
+            )
+        for provider in self.providers:
+            await provider.close()
+
+    async def _call(self, index: int, prompt: str, content: str) -> LLMResponse:
+        """Send the request to one provider, recording its latency. Its circuit breaker records the outcome."""
+        start = time.monotonic()
+        try:
+            response = await self.providers[index].execute(prompt, content)
+        except asyncio.CancelledError:
+            # A request losing to its hedge took at least this long. Leaving it out would bias the
+            # percentile towards the fast requests and make hedges fire ever earlier.
+            self._latencies.append(time.monotonic() - start)
+            raise
+
+        self._latencies.append(time.monotonic() - start)
+        return response
+
+    def _next_backend(self, tried: set[int]) -> int | None:
+        for index in range(len(self.providers)):
+            breaker = self.providers[index].circuit_breaker
+            if index not in tried and (breaker is None or breaker.available):
+                return index
+        return None
+
+    def _launch(
+        self, index: int, tried: set[int], running: dict[asyncio.Task[LLMResponse], int], prompt: str, content: str
+    ) -> asyncio.Task[LLMResponse]:
+        tried.add(index)
+        task = asyncio.create_task(self._call(index, prompt, content))
+        running[task] = index
+        return task
+
+    def _launch_failover(
+        self,
+        tried: set[int],
+        running: dict[asyncio.Task[LLMResponse], int],
+        last_error: Exception | None,
+        prompt: str,
+        content: str,
+    ) -> None:
+        """Send the request to the next available provider, or raise the last error if there is none."""
+        index = self._next_backend(tried)
+        if index is None:
+            if last_error is not None:
+                raise last_error
+            # Only providers with an open circuit are skipped; hold the record until the preferred one recovers
+            raise CircuitOpenError(self.providers[0].circuit_breaker)  # type: ignore[arg-type]
+        if tried:
+            self.failovers += 1
+            provider = self.providers[index]
+            logger.warning('Failing over to %s/%s', provider.name, provider.model)
+        self._launch(index, tried, running, prompt, content)
+
+    def _launch_hedge(
+        self,
+        tried: set[int],
+        running: dict[asyncio.Task[LLMResponse], int],
+        hedges: set[asyncio.Task[LLMResponse]],
+        prompt: str,
+        content: str,
+    ) -> bool:
+        """Send a slow request to the next available provider too. Returns False if there is none."""
+        index = self._next_backend(tried)
+        if index is None:
+            return False
+        self.hedges_sent += 1
+        hedges.add(self._launch(index, tried, running, prompt, content))
+        return True
+
+    async def _execute(self, prompt: str, content: str) -> LLMResponse:
+        """Send the request to the preferred provider, hedging slow and replacing failed requests."""
+        tried: set[int] = set()
+        running: dict[asyncio.Task[LLMResponse], int] = {}
+        hedges: set[asyncio.Task[LLMResponse]] = set()
+        last_error: Exception | None = None
+
+        try:
+            while True:
+                if not running:
+                    self._launch_failover(tried, running, last_error, prompt, content)
+
+                timeout = self.hedge_delay if len(running) == 1 else None
+                done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+                if not done:
+                    # Slow request: hedge it on the next provider, keep waiting for both
+                    if not self._launch_hedge(tried, running, hedges, prompt, content):
+                        await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                    continue
+
+                for task in done:
+                    index = running.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        if task in hedges:
+                            self.hedges_won += 1
+                        return await self._settle(task.result(), running, prompt, content)
+                    last_error = error  # type: ignore[assignment]
+                    provider = self.providers[index]
+                    logger.warning('%s/%s failed: %s', provider.name, provider.model, error)
+        finally:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+
+    async def _settle(
+        self,
+        response: LLMResponse,
+        losers: dict[asyncio.Task[LLMResponse], int],
+        prompt: str,
+        content: str,
+    ) -> LLMResponse:
+        """Cancel the requests that lost and add their cost to the winning response."""
+        wasted = 0.0
+        for task, index in losers.items():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            if task.cancelled():
+                # The provider keeps generating the cancelled request and bills it
+                wasted += self.providers[index].estimate_cost(prompt, content)
+            elif task.exception() is None:
+                wasted += task.result().cost
+        losers.clear()
+
+        if not wasted:
+            return response
+
+        self.hedge_cost += wasted
+        return response.model_copy(update={'cost': response.cost + wasted})
@@ -1,13 +1,25 @@
-import httpx
+import json
+from collections.abc import AsyncGenerator
+from typing import Any
 
 from llm_pipeline.config import YandexSettings
+from llm_pipeline.models import LLMResponse
 from llm_pipeline.providers.base import LLMProvider
+from llm_pipeline.utils.circuit_breaker import CircuitBreaker
+from llm_pipeline.utils.http import HTTPTransport
+from llm_pipeline.utils.rate_limit import TokenBucketLimiter
+from llm_pipeline.utils.tokens import TokenEstimator
 
 PRICING = {
     'yandexgpt': {'input': 0.0002, 'output': 0.0004},
     'yandexgpt-lite': {'input': 0.00004, 'output': 0.00008},
 }
 
+CONTEXT_WINDOWS = {
+    'yandexgpt': 32_000,
+    'yandexgpt-lite': 32_000,
+}
+
 
 class YandexProvider(LLMProvider):
     API_URL = 'https://llm.api.cloud.yandex.net/foundationModels/v1/completion'
@@ -18,6 +30,10 @@ class YandexProvider(LLMProvider):
         model: str = 'yandexgpt',
         temperature: float = 0.7,
         max_tokens: int = 4096,
+        rate_limiter: TokenBucketLimiter | None = None,
+        transport: HTTPTransport | None = None,
+        token_estimator: TokenEstimator | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
     ) -> None:
         """
         Initialize YandexGPT provider.
@@ -27,10 +43,21 @@ class YandexProvider(LLMProvider):
             temperature: Sampling temperature.
             max_tokens: Maximum tokens in response.
             settings: Yandex settings. If None, loads from environment.
+            rate_limiter: Optional requests/min and tokens/min limiter.
+            transport: Shared HTTP transport. Without it, the provider keeps its own keep-alive connection pool.
+            token_estimator: Local token counting for rate limits, context window and cost checks.
+            circuit_breaker: Stops sending requests while the provider is failing.
         """
-        super().__init__('Yandex', model, temperature)
+        super().__init__('Yandex', model, temperature, rate_limiter, token_estimator, circuit_breaker)
+        self.context_window = CONTEXT_WINDOWS.get(model)
         self.max_tokens = max_tokens
         self._settings = settings
+        self._transport = transport or HTTPTransport()
+        self._owns_transport = transport is None
+
+    async def close(self) -> None:
+        if self._owns_transport:
+            await self._transport.close()
 
     def _get_model_uri(self) -> str:
         """Get full model URI for Yandex API."""
@@ -43,8 +70,7 @@ class YandexProvider(LLMProvider):
         output_cost = (output_tokens / 1000) * pricing['output']
         return input_cost + output_cost
 
-    async def execute(self, prompt: str, content: str) -> tuple[str, int, float]:
-        """Transform content using YandexGPT."""
+    def _request(self, prompt: str, content: str, stream: bool = False) -> tuple[dict[str, str], dict[str, Any]]:
         headers = {
             'Authorization': f'Api-Key {self._settings.yandex_api_key}',
             'Content-Type': 'application/json',
@@ -53,22 +79,18 @@ class YandexProvider(LLMProvider):
         payload = {
             'modelUri': self._get_model_uri(),
             'completionOptions': {
-                'stream': False,
+                'stream': stream,
                 'temperature': self.temperature,
-                'maxTokens': str(self.max_tokens),
+                'maxTokens': str(self._output_limit(prompt, content)),
             },
             'messages': [
                 {'role': 'system', 'text': prompt},
                 {'role': 'user', 'text': content},
             ],
         }
+        return headers, payload
 
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(self.API_URL, headers=headers, json=payload)
-            response.raise_for_status()
-            data = response.json()
-
-        result_data = data.get('result', {})
+    def _parse_result(self, result_data: dict[str, Any]) -> LLMResponse:
         alternatives = result_data.get('alternatives', [])
 
         result = alternatives[0].get('message', {}).get('text', '') if alternatives else ''
@@ -76,7 +98,33 @@ class YandexProvider(LLMProvider):
         usage = result_data.get('usage', {})
         input_tokens = int(usage.get('inputTextTokens', 0))
         output_tokens = int(usage.get('completionTokens', 0))
-        total_tokens = input_tokens + output_tokens
         cost = self._calculate_cost(input_tokens, output_tokens)
 
-        return result, total_tokens, cost
+        return LLMResponse(content=result, input_tokens=input_tokens, output_tokens=output_tokens, cost=cost)
+
+    async def _execute(self, prompt: str, content: str) -> LLMResponse:
+        """Transform content using YandexGPT."""
+        headers, payload = self._request(prompt, content)
+
+        response = await self._transport.client.post(self.API_URL, headers=headers, json=payload)
+        response.raise_for_status()
+        data = response.json()
+
+        return self._parse_result(data.get('result', {}))
+
+    async def _stream(self, prompt: str, content: str) -> AsyncGenerator[str | LLMResponse]:
+        """Stream content from YandexGPT."""
+        headers, payload = self._request(prompt, content, stream=True)
+
+        received = 0
+        async with self._transport.client.stream('POST', self.API_URL, headers=headers, json=payload) as response:
+            response.raise_for_status()
+            # Every line holds the whole text generated so far
+            async for line in response.aiter_lines():
+                if not line.strip():
+                    continue
+                snapshot = self._parse_result(json.loads(line).get('result', {}))
+                if len(snapshot.content) > received:
+                    yield snapshot.content[received:]
+                    received = len(snapshot.content)
+                yield snapshot
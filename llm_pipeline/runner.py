@@ -0,0 +1,306 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import shutil
+import signal
+import time
+from collections.abc import Callable
+from functools import partial
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+from queue import Empty
+from typing import Any
+
+from rich.console import Console
+
+from llm_pipeline.models import RunOptions, RunSummary, TierStats
+from llm_pipeline.pipeline import Pipeline
+from llm_pipeline.sources.postgres import PostgresSource
+from llm_pipeline.utils.logging import setup_logging
+from llm_pipeline.utils.progress import ProgressTracker
+
+logger = logging.getLogger(__name__)
+
+POLL_INTERVAL = 0.1
+
+
+class _ShardProgressReporter(ProgressTracker):
+    """Progress tracker of a worker process: forwards updates to the parent instead of rendering them."""
+
+    def __init__(self, queue: Any, shard: int, total: int | None, console: Console | None = None) -> None:
+        super().__init__(total, console)
+        self._queue = queue
+        self._shard = shard
+        queue.put(('total', shard, total))
+
+    def start(self) -> None:
+        pass
+
+    def set_total(self, total: int) -> None:
+        super().set_total(total)
+        self._queue.put(('total', self._shard, total))
+
+    def update(self, success: bool, **kwargs: Any) -> None:
+        super().update(success, **kwargs)
+        self._queue.put(('update', self._shard, {'success': success, **kwargs}))
+
+    def print_summary(self, duration_seconds: float, tiers: list[TierStats] | None = None) -> None:
+        # The parent prints the summary of all shards from the ones sent by _run_shard
+        pass
+
+
+def _shard_path(path: Path, shard: int) -> Path:
+    """Path of the file holding the part of ``path`` written by one shard."""
+    return path.with_name(f'{path.stem}.shard{shard}{path.suffix}')
+
+
+def _shard_options(options: RunOptions, shard: int, shards: int) -> RunOptions:
+    """Options of the pipeline of one shard."""
+    update: dict[str, Any] = {}
+    if options.results_file is not None:
+        # Concurrent writers would corrupt one file, the parent concatenates the shard files instead
+        update['results_file'] = _shard_path(options.results_file, shard)
+    if options.max_cost is not None:
+        # Every worker enforces its own budget, so each gets an equal share of the limit of the run
+        update['max_cost'] = options.max_cost / shards
+    return options.model_copy(update=update)
+
+
+def _run_shard(pipeline_factory: Callable[[], Pipeline], shard: int, shards: int, queue: Any) -> None:
+    """Worker process entry point: run a pipeline over one shard of the source."""
+
+    async def run() -> None:
+        pipeline = pipeline_factory()
+        if not isinstance(pipeline.source, PostgresSource):
+            raise TypeError('ShardedRunner requires a PostgresSource')
+
+        pipeline.source.shard = (shard, shards)
+        if pipeline.checkpoint is not None:
+            # Each worker clears or resumes only its own progress
+            pipeline.checkpoint.use_shard(shard)
+        pipeline.progress_factory = partial(_ShardProgressReporter, queue, shard)
+        results_file = pipeline.options.results_file
+        pipeline.options = _shard_options(pipeline.options, shard, shards)
+
+        summary = await pipeline.run()
+        if summary is not None:
+            queue.put(('summary', shard, (summary.model_copy(update={'results_file': results_file}), pipeline.resume)))
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        # Ctrl+C before the pipeline installed its own graceful shutdown handlers
+        pass
+    except Exception as e:
+        queue.put(('error', shard, repr(e)))
+    finally:
+        queue.put(('done', shard, None))
+
+
+class ShardedRunner:
+    def __init__(
+        self,
+        pipeline_factory: Callable[[], Pipeline],
+        workers: int = 4,
+        shutdown_timeout: float = 30.0,
+        console: Console | None = None,
+    ) -> None:
+        """
+        Initialize sharded runner.
+
+        Each worker process builds its own pipeline and processes the rows of the source
+        whose primary key hash modulo ``workers`` equals the worker index. Progress of all
+        workers is aggregated into one tracker in the parent process. A results file is
+        written per shard and concatenated into the configured one when the workers finish.
+        The cost limit of the run is split equally between the workers. A checkpoint store keeps
+        the progress of every shard apart, so a run must be resumed with the same number of workers.
+
+        Args:
+            pipeline_factory: Picklable (module level) callable building a pipeline with a PostgresSource.
+                It is called inside each worker process.
+            workers: Number of worker processes.
+            shutdown_timeout: Seconds workers get to finish their current batch after Ctrl+C before being killed.
+            console: Rich console instance.
+        """
+        if workers < 1:
+            raise ValueError('workers must be at least 1')
+
+        self.pipeline_factory = pipeline_factory
+        self.workers = workers
+        self.shutdown_timeout = shutdown_timeout
+        self.console = console or Console()
+
+    async def run(self) -> RunSummary:
+        """Run all shards and return the summary of the whole run."""
+        setup_logging()
+        logger.info('Starting %s worker processes', self.workers)
+
+        # Workers run their own event loops, which must not be inherited through fork
+        context = multiprocessing.get_context('spawn')
+        queue = context.Queue()
+        processes = [
+            context.Process(
+                target=_run_shard,
+                args=(self.pipeline_factory, shard, self.workers, queue),
+                name=f'pipeline-shard-{shard}',
+            )
+            for shard in range(self.workers)
+        ]
+        for process in processes:
+            process.start()
+
+        shutdown_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, shutdown_event.set)
+
+        start_time = time.monotonic()
+        totals: dict[int, int | None] = {}
+        summaries: dict[int, tuple[RunSummary, bool]] = {}
+        running = set(range(self.workers))
+        deadline: float | None = None
+
+        try:
+            with ProgressTracker(None, self.console) as progress:
+                while running:
+                    self._drain(queue, progress, totals, summaries, running)
+
+                    if shutdown_event.is_set() and deadline is None:
+                        logger.warning('Shutdown requested, waiting for workers to finish current batch...')
+                        deadline = time.monotonic() + self.shutdown_timeout
+                        self._signal(processes, running, signal.SIGTERM)
+
+                    if deadline is not None and time.monotonic() > deadline:
+                        logger.error('Workers did not stop in %ss, killing them', self.shutdown_timeout)
+                        self._signal(processes, running, signal.SIGKILL)
+                        deadline = float('inf')
+
+                    self._reap(queue, processes, progress, totals, summaries, running)
+                    await asyncio.sleep(POLL_INTERVAL)
+
+                summary = self._summarize(progress, time.monotonic() - start_time, summaries)
+                progress.print_summary(summary.duration_seconds, summary.tiers)
+        finally:
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                loop.remove_signal_handler(sig)
+            for process in processes:
+                if process.is_alive():
+                    process.kill()
+                process.join()
+
+        return summary
+
+    def _drain(
+        self,
+        queue: Any,
+        progress: ProgressTracker,
+        totals: dict[int, int | None],
+        summaries: dict[int, tuple[RunSummary, bool]],
+        running: set[int],
+    ) -> None:
+        """Apply all messages currently sent by the workers."""
+        while True:
+            try:
+                kind, shard, payload = queue.get_nowait()
+            except Empty:
+                return
+
+            if kind == 'total':
+                totals[shard] = payload
+                self._update_total(progress, totals)
+            elif kind == 'update':
+                progress.update(**payload)
+            elif kind == 'summary':
+                summaries[shard] = payload
+            elif kind == 'error':
+                logger.error('Shard %s failed: %s', shard, payload)
+            elif kind == 'done':
+                running.discard(shard)
+                # Shards without records finish without reporting a total
+                totals.setdefault(shard, 0)
+                self._update_total(progress, totals)
+
+    def _summarize(
+        self, progress: ProgressTracker, duration: float, summaries: dict[int, tuple[RunSummary, bool]]
+    ) -> RunSummary:
+        """Combine the summaries sent by the shards into the summary of the whole run."""
+        failed_ids: list[Any] = []
+        tiers: dict[int, TierStats] = {}
+        results_file: Path | None = None
+        resume = False
+        for shard in sorted(summaries):
+            summary, resumed = summaries[shard]
+            failed_ids.extend(summary.failed_ids)
+            self._merge_tiers(tiers, summary.tiers)
+            results_file = results_file or summary.results_file
+            resume = resume or resumed
+
+        if results_file is not None:
+            self._merge_results_files(results_file, resume)
+
+        return RunSummary(
+            successful=progress.successful,
+            failed=progress.failed,
+            failed_ids=failed_ids,
+            total_tokens=progress.total_tokens,
+            total_cost=progress.total_cost,
+            duration_seconds=duration,
+            results_file=results_file,
+            budget_exhausted=any(summary.budget_exhausted for summary, _ in summaries.values()),
+            tiers=[tiers[tier] for tier in sorted(tiers)],
+        )
+
+    @staticmethod
+    def _merge_tiers(tiers: dict[int, TierStats], shard_tiers: list[TierStats]) -> None:
+        """Add the cascade tier statistics of one shard to those of the others."""
+        for stats in shard_tiers:
+            merged = tiers.setdefault(stats.tier, TierStats(tier=stats.tier, model=stats.model))
+            merged.requests += stats.requests
+            merged.accepted += stats.accepted
+            merged.cost += stats.cost
+            merged.total_latency += stats.total_latency
+
+    def _merge_results_files(self, results_file: Path, resume: bool) -> None:
+        """Concatenate the results files of the shards into ``results_file`` and remove them."""
+        with results_file.open('ab' if resume else 'wb') as merged:
+            for shard in range(self.workers):
+                path = _shard_path(results_file, shard)
+                # Also picks up the results of shards that failed before reporting a summary
+                if path.exists():
+                    with path.open('rb') as part:
+                        shutil.copyfileobj(part, merged)
+                    path.unlink()
+
+    def _update_total(self, progress: ProgressTracker, totals: dict[int, int | None]) -> None:
+        """Show the aggregate total once every shard has reported its own."""
+        if len(totals) == self.workers and None not in totals.values():
+            progress.set_total(sum(total for total in totals.values() if total is not None))
+
+    def _reap(
+        self,
+        queue: Any,
+        processes: list[BaseProcess],
+        progress: ProgressTracker,
+        totals: dict[int, int | None],
+        summaries: dict[int, tuple[RunSummary, bool]],
+        running: set[int],
+    ) -> None:
+        """Drop workers that exited without reporting it (e.g. killed)."""
+        dead = [shard for shard in running if not processes[shard].is_alive()]
+        if not dead:
+            return
+
+        # Their last messages may still be in the queue
+        self._drain(queue, progress, totals, summaries, running)
+        for shard in dead:
+            if shard in running:
+                logger.error('Shard %s exited with code %s', shard, processes[shard].exitcode)
+                running.discard(shard)
+
+    @staticmethod
+    def _signal(processes: list[BaseProcess], running: set[int], sig: signal.Signals) -> None:
+        for shard in running:
+            pid = processes[shard].pid
+            if pid is not None and processes[shard].is_alive():
+                os.kill(pid, sig)
@@ -1,4 +1,5 @@
 from llm_pipeline.sinks.base import DataSink
 from llm_pipeline.sinks.postgres import PostgresSink
+from llm_pipeline.sinks.writer import BackgroundWriter
 
-__all__ = ['DataSink', 'PostgresSink']
+__all__ = ['BackgroundWriter', 'DataSink', 'PostgresSink']
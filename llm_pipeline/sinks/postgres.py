@@ -1,14 +1,24 @@
 import re
-from typing import Any
+from typing import Any, Literal
 
 import asyncpg
 
 from llm_pipeline.config import PGSettings
 from llm_pipeline.sinks.base import DataSink
+from llm_pipeline.utils.pool import PGPool, PoolManager
+
+PLACEHOLDER_PATTERN = re.compile(r':(\w+)')
+STAGING_TABLE = '_llm_pipeline_staging'
 
 
 class PostgresSink(DataSink):
-    def __init__(self, query: str, settings: PGSettings) -> None:
+    def __init__(
+        self,
+        query: str,
+        settings: PGSettings,
+        write_mode: Literal['executemany', 'copy'] = 'executemany',
+        pool_manager: PoolManager | None = None,
+    ) -> None:
         """
         Initialize PostgreSQL sink.
 
@@ -16,17 +26,24 @@ class PostgresSink(DataSink):
             query: UPDATE query with :content and :id placeholders.
                 Example: "UPDATE table SET content = :content WHERE id = :id"
             settings: Database connection settings.
+            write_mode: How a batch is written. "executemany" runs the query once per record;
+                "copy" streams the batch into a temporary staging table with COPY and runs the
+                query once as UPDATE ... FROM the staging table.
+            pool_manager: Share the connection pool through this manager. Without it, the sink owns its pool.
         """
         self.query = query
+        self.write_mode = write_mode
         self._settings = settings
-        self._pool: asyncpg.Pool | None = None
+        self._pool = pool_manager.get(settings) if pool_manager is not None else PGPool(settings)
+        self._owns_pool = pool_manager is None
         self._pending: list[tuple[Any, str]] = []
         self._prepared_query, self._param_order = self._convert_query(query)
+        self._staging_query = self._convert_staging_query(query) if write_mode == 'copy' else None
+        self._staging_columns: str | None = None
 
     @staticmethod
     def _convert_query(query: str) -> tuple[str, list[str]]:
-        pattern = re.compile(r':(\w+)')
-        placeholders = pattern.findall(query)
+        placeholders = PLACEHOLDER_PATTERN.findall(query)
 
         result = query
         for i, name in enumerate(placeholders, 1):
@@ -34,18 +51,20 @@ class PostgresSink(DataSink):
 
         return result, placeholders
 
-    async def _ensure_pool(self) -> asyncpg.Pool:
-        if self._pool is None:
-            self._pool = await asyncpg.create_pool(  # type: ignore[misc]
-                host=self._settings.host,
-                port=self._settings.port,
-                database=self._settings.db,
-                user=self._settings.user,
-                password=self._settings.password.get_secret_value(),
-                min_size=1,
-                max_size=5,
-            )
-        return self._pool
+    @staticmethod
+    def _convert_staging_query(query: str) -> str:
+        """Turn the per-record UPDATE into one UPDATE ... FROM the staging table."""
+        placeholders = set(PLACEHOLDER_PATTERN.findall(query))
+        if placeholders != {'id', 'content'}:
+            raise ValueError('copy write mode requires exactly the :id and :content placeholders')
+
+        result = PLACEHOLDER_PATTERN.sub(r'_staging._llm_\1', query)
+        staging = f'{STAGING_TABLE} AS _staging'
+        if re.search(r'\bFROM\b', result, re.IGNORECASE):
+            return re.sub(r'\bFROM\b', f'FROM {staging},', result, count=1, flags=re.IGNORECASE)
+        if re.search(r'\bWHERE\b', result, re.IGNORECASE):
+            return re.sub(r'\bWHERE\b', f'FROM {staging} WHERE', result, count=1, flags=re.IGNORECASE)
+        raise ValueError('copy write mode requires an UPDATE query with a WHERE clause')
 
     def _build_params(self, record_id: Any, content: str) -> list[Any]:
         params = []
@@ -72,19 +91,39 @@ class PostgresSink(DataSink):
         if not self._pending:
             return
 
-        pool = await self._ensure_pool()
-        args = [self._build_params(rid, content) for rid, content in self._pending]
+        pool = self._pool
 
         async with pool.acquire() as conn, conn.transaction():
-            await conn.executemany(self._prepared_query, args)
+            if self.write_mode == 'copy':
+                await self._copy_batch(conn)
+            else:
+                args = [self._build_params(rid, content) for rid, content in self._pending]
+                await conn.executemany(self._prepared_query, args)
 
         self._pending.clear()
 
+    async def _copy_batch(self, conn: asyncpg.Connection) -> None:
+        if self._staging_columns is None:
+            # Staging columns get the types Postgres infers for the placeholders of the original query
+            statement = await conn.prepare(self._prepared_query)
+            types = dict(zip(self._param_order, statement.get_parameters(), strict=True))
+            self._staging_columns = ', '.join(
+                f'_llm_{name} "{types[name].schema}"."{types[name].name}"' for name in ('id', 'content')
+            )
+
+        # Temporary tables live as long as the pooled connection, rows only until commit
+        await conn.execute(
+            f'CREATE TEMPORARY TABLE IF NOT EXISTS {STAGING_TABLE} ({self._staging_columns}) ON COMMIT DELETE ROWS'
+        )
+        # The last write of a record wins, as with executemany
+        records = list(dict(self._pending).items())
+        await conn.copy_records_to_table(STAGING_TABLE, records=records, columns=['_llm_id', '_llm_content'])
+        await conn.execute(self._staging_query)
+
     async def close(self) -> None:
         await self.commit_batch()
-        if self._pool is not None:
+        if self._owns_pool:
             await self._pool.close()
-            self._pool = None
 
     def get_query(self) -> str:
         return self.query
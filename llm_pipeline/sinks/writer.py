@@ -0,0 +1,145 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+from llm_pipeline.models import ProcessingResult
+from llm_pipeline.sinks.base import DataSink
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundWriter:
+    def __init__(
+        self,
+        sink: DataSink,
+        batch_size: int = 10,
+        flush_interval: float = 0.5,
+        max_queue_size: int = 1000,
+        on_commit: Callable[[list[ProcessingResult]], Awaitable[None]] | None = None,
+    ) -> None:
+        """
+        Initialize background writer.
+
+        Results are queued and written to the sink by a separate task, so that commits do not
+        stall result consumption. A batch is committed once it has ``batch_size`` results or
+        its oldest result has waited ``flush_interval`` seconds. When the queue is full,
+        ``put`` waits, slowing the producer down to the speed of the database.
+
+        Args:
+            sink: Data sink to write results to.
+            batch_size: Number of results per commit.
+            flush_interval: Maximum seconds a result waits for its batch to be committed.
+            max_queue_size: Maximum number of results waiting to be written.
+            on_commit: Called with the results of every batch after the sink committed it.
+        """
+        if batch_size < 1:
+            raise ValueError('batch_size must be at least 1')
+
+        self.sink = sink
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.on_commit = on_commit
+        self.max_queue_depth = 0
+        self.batches_committed = 0
+
+        self._queue: asyncio.Queue[ProcessingResult | None] = asyncio.Queue(maxsize=max_queue_size)
+        self._task: asyncio.Task[None] | None = None
+        self._closed = False
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of results waiting to be written."""
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        """Start the writer task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name='background-writer')
+
+    async def put(self, result: ProcessingResult) -> None:
+        """
+        Queue a result for writing, waiting while the queue is full.
+
+        Raises:
+            Exception: The error the writer task failed with.
+        """
+        if self._closed:
+            raise RuntimeError('Writer is closed')
+        await self._enqueue(result)
+        self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+
+    async def close(self) -> None:
+        """
+        Write and commit everything queued, then stop the writer task.
+
+        Raises:
+            Exception: The error the writer task failed with.
+        """
+        if self._task is None or self._closed:
+            return
+
+        self._closed = True
+        if not self._task.done():
+            await self._enqueue(None)
+        await self._task
+
+    async def _enqueue(self, item: ProcessingResult | None) -> None:
+        self._raise_if_failed()
+        if not self._queue.full():
+            self._queue.put_nowait(item)
+            return
+
+        # Wait for free space, unless the writer dies in the meantime
+        put = asyncio.ensure_future(self._queue.put(item))
+        try:
+            await asyncio.wait({put, self._task}, return_when=asyncio.FIRST_COMPLETED)  # type: ignore[arg-type]
+        finally:
+            if not put.done():
+                put.cancel()
+        self._raise_if_failed()
+
+    def _raise_if_failed(self) -> None:
+        if self._task is None:
+            raise RuntimeError('Writer is not started')
+        if self._task.done() and not self._closed:
+            raise self._task.exception() or RuntimeError('Writer stopped unexpectedly')
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        batch: list[ProcessingResult] = []
+        deadline = 0.0
+
+        while True:
+            timeout = max(deadline - loop.time(), 0) if batch else None
+            try:
+                result = await asyncio.wait_for(self._queue.get(), timeout)
+            except TimeoutError:
+                await self._flush(batch)
+                batch = []
+                continue
+
+            if result is None:
+                await self._flush(batch)
+                return
+
+            if not batch:
+                deadline = loop.time() + self.flush_interval
+            batch.append(result)
+            if len(batch) >= self.batch_size:
+                await self._flush(batch)
+                batch = []
+
+    async def _flush(self, batch: list[ProcessingResult]) -> None:
+        if not batch:
+            return
+
+        for result in batch:
+            if result.success and result.transformed_content:
+                await self.sink.write_record(result.record_id, result.transformed_content)
+        await self.sink.commit_batch()
+
+        self.batches_committed += 1
+        logger.debug('Committed batch of %s records, %s waiting', len(batch), self._queue.qsize())
+
+        if self.on_commit is not None:
+            await self.on_commit(batch)
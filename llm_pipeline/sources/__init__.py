@@ -1,4 +1,4 @@
-from .base import DataSource
+from .base import DataSource, ResumableSource
 from .postgres import PostgresSource
 
-__all__ = ['DataSource', 'PostgresSource']
+__all__ = ['DataSource', 'PostgresSource', 'ResumableSource']
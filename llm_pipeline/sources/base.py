@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from collections.abc import AsyncGenerator
 
-from llm_pipeline.models import Record
+from llm_pipeline.models import Checkpoint, Record
 
 
 class DataSource(ABC):
@@ -13,6 +13,23 @@ class DataSource(ABC):
     async def count_records(self) -> int:
         """Return total number of records to process."""
 
+    async def estimate_records(self) -> int:
+        """Return a cheap, possibly inexact number of records to process. Defaults to the exact count."""
+        return await self.count_records()
+
     @abstractmethod
     async def close(self) -> None:
         """Close the data source connection."""
+
+
+class ResumableSource(ABC):
+    """Mixin for sources that can skip records finished by a previous run. Required by ``Pipeline(resume=True)``."""
+
+    @abstractmethod
+    def resume_from(self, checkpoint: Checkpoint) -> None:
+        """
+        Exclude records finished in a previous run from fetch_records and count_records.
+
+        Args:
+            checkpoint: Progress recorded by the previous run.
+        """
@@ -1,69 +1,255 @@
+import asyncio
+import json
+import logging
 from collections.abc import AsyncGenerator
+from contextlib import aclosing
+from decimal import Decimal
+from typing import Any
 
 import asyncpg
 
 from llm_pipeline.config import PGSettings
-from llm_pipeline.models import Record
-from llm_pipeline.sources.base import DataSource
+from llm_pipeline.models import Checkpoint, Record
+from llm_pipeline.sources.base import DataSource, ResumableSource
+from llm_pipeline.utils.pool import PGPool, PoolManager
 
+logger = logging.getLogger(__name__)
 
-class PostgresSource(DataSource):
+
+def _quote_ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+class PostgresSource(DataSource, ResumableSource):
     def __init__(
-        self, query: str, settings: PGSettings, primary_key: str = 'id', content_field: str = 'content'
+        self,
+        query: str,
+        settings: PGSettings,
+        primary_key: str = 'id',
+        content_field: str = 'content',
+        partitions: int | None = None,
+        chunk_size: int = 1000,
+        shard: tuple[int, int] | None = None,
+        pool_manager: PoolManager | None = None,
     ) -> None:
         """
         Initialize pg source.
 
+        By default the query is streamed through one cursor inside one transaction.
+        With ``partitions`` set, the key space between the smallest and largest (numeric) primary key
+        is split into equal ranges which are read concurrently with keyset pagination, one short
+        transaction per chunk.
+
         Args:
             query: SELECT query to fetch records.
             settings: Database connection settings.
             primary_key: Name of the primary key column.
             content_field: Name of the content column.
+            partitions: Number of primary key ranges read concurrently. None reads through a single cursor.
+            chunk_size: Rows fetched per chunk in partitioned mode.
+            shard: (index, count) pair. Only rows whose primary key hash modulo count equals index are read.
+            pool_manager: Share the connection pool through this manager. Without it, the source owns its pool.
         """
+        if partitions is not None and partitions < 1:
+            raise ValueError('partitions must be at least 1')
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be at least 1')
+        if shard is not None and not 0 <= shard[0] < shard[1]:
+            raise ValueError('shard index must be in range [0, count)')
+
         self.query = query
         self.primary_key = primary_key
         self.content_field = content_field
+        self.partitions = partitions
+        self.chunk_size = chunk_size
+        self.shard = shard
+        self._resume_after: Any = None
+        self._completed_ids: list[str] = []
+        self._row_layout: tuple[int, int, list[tuple[int, str]]] | None = None
         self._settings = settings
-        self._pool: asyncpg.Pool | None = None
-
-    async def _ensure_pool(self) -> asyncpg.Pool:
-        if self._pool is None:
-            self._pool = await asyncpg.create_pool(  # type: ignore[misc]
-                host=self._settings.host,
-                port=self._settings.port,
-                database=self._settings.db,
-                user=self._settings.user,
-                password=self._settings.password.get_secret_value(),
-                min_size=1,
-                max_size=5,
-            )
-        return self._pool
+        self._pool = pool_manager.get(settings) if pool_manager is not None else PGPool(settings)
+        self._owns_pool = pool_manager is None
+
+    def _read_query(self) -> tuple[str, list[Any]]:
+        """The query restricted to this source's shard and to records not finished in a resumed run."""
+        primary_key = _quote_ident(self.primary_key)
+        query = self.query
+        if self.shard is not None:
+            index, count = self.shard
+            # hashtext is stable across sessions and servers; the mask keeps the modulo non-negative
+            shard_hash = f'(hashtext({primary_key}::text) & 2147483647)'
+            query = f'SELECT * FROM ({query}) AS unsharded WHERE {shard_hash} % {count} = {index}'  # noqa: S608
+
+        conditions: list[str] = []
+        args: list[Any] = []
+        if self._resume_after is not None:
+            args.append(self._resume_after)
+            conditions.append(f'{primary_key} > ${len(args)}')
+        if self._completed_ids:
+            # Compared as text, so that ids restored from JSON match any key type
+            args.append(self._completed_ids)
+            conditions.append(f'NOT ({primary_key}::text = ANY(${len(args)}::text[]))')
+
+        if conditions:
+            query = f'SELECT * FROM ({query}) AS remaining WHERE {" AND ".join(conditions)}'  # noqa: S608
+        return query, args
+
+    def resume_from(self, checkpoint: Checkpoint) -> None:
+        """Skip records finished in a previous run."""
+        if checkpoint.high_water_mark is not None and self.partitions is not None:
+            raise ValueError('High-water mark checkpoints need records in primary key order, use completed ids')
+
+        self._resume_after = checkpoint.high_water_mark
+        self._completed_ids = [str(record_id) for record_id in checkpoint.completed_ids]
+
+    def _to_record(self, row: asyncpg.Record) -> Record:
+        """Convert a row by column position, without building an intermediate dict of the whole row."""
+        if self._row_layout is None:
+            columns = list(row.keys())
+            reserved = (self.primary_key, self.content_field)
+            metadata = [(index, name) for index, name in enumerate(columns) if name not in reserved]
+            self._row_layout = (columns.index(self.primary_key), columns.index(self.content_field), metadata)
+
+        id_index, content_index, metadata = self._row_layout
+        return Record(
+            id=row[id_index],
+            content=row[content_index],
+            metadata={name: row[index] for index, name in metadata},
+        )
 
     async def fetch_records(self) -> AsyncGenerator[Record]:
         """Fetch records from PostgreSQL."""
-        pool = await self._ensure_pool()
+        if self.partitions is not None:
+            async with aclosing(self._fetch_partitioned()) as records:
+                async for record in records:
+                    yield record
+            return
+
+        pool = self._pool
 
         async with pool.acquire() as conn, conn.transaction():
-            async for row in conn.cursor(self.query):
-                row_dict = dict(row)
-                record_id = row_dict.pop(self.primary_key)
-                content = row_dict.pop(self.content_field)
-                yield Record(id=record_id, content=content, metadata=row_dict)
+            query, args = self._read_query()
+            async for row in conn.cursor(query, *args):
+                yield self._to_record(row)
+
+    async def _fetch_partitioned(self) -> AsyncGenerator[Record]:
+        """Read primary key ranges concurrently and merge them into one stream (in no particular order)."""
+        pool = self._pool
+        bounds = await self._partition_bounds(pool)
+        ranges = list(zip([None, *bounds], [*bounds, None], strict=True))
+        logger.info('Reading %s in %s partitions', self.primary_key, len(ranges))
+        if len(ranges) > self._settings.pool_max_size:
+            logger.warning('%s partitions share a pool of %s connections', len(ranges), self._settings.pool_max_size)
+
+        queue: asyncio.Queue[Record | Exception | None] = asyncio.Queue(maxsize=self.chunk_size)
+        tasks = [asyncio.create_task(self._read_range(pool, lower, upper, queue)) for lower, upper in ranges]
+
+        try:
+            remaining = len(tasks)
+            while remaining:
+                item = await queue.get()
+                if item is None:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _partition_bounds(self, pool: PGPool) -> list[Any]:
+        """
+        Split the primary key space into ranges of equal key width.
+
+        Only the smallest and largest key are read, which the primary key index answers without
+        scanning the table. Keys that cannot be split numerically are read as one range.
+        """
+        if self.partitions is None or self.partitions == 1:
+            return []
+
+        primary_key = _quote_ident(self.primary_key)
+        bounds_query = f'SELECT min({primary_key}), max({primary_key}) FROM ({self.query}) AS subquery'  # noqa: S608
+        async with pool.acquire() as conn:
+            row = await conn.fetchrow(bounds_query)
+
+        lowest, highest = row if row is not None else (None, None)
+        if lowest is None or highest is None:
+            return []
+        if not isinstance(lowest, int | float | Decimal) or isinstance(lowest, bool):
+            logger.warning('%s keys cannot be split into ranges, reading one partition', type(lowest).__name__)
+            return []
+
+        width = highest - lowest
+        if isinstance(width, int):
+            # Integer division keeps bigint keys exact
+            bounds = [lowest + width * i // self.partitions for i in range(1, self.partitions)]
+        else:
+            bounds = [lowest + width * i / self.partitions for i in range(1, self.partitions)]
+        # Narrow key spaces give repeated bounds
+        return sorted(set(bounds))
+
+    def _chunk_query(self, lower: Any, upper: Any) -> tuple[str, list[Any]]:
+        primary_key = _quote_ident(self.primary_key)
+        query, args = self._read_query()
+        conditions = []
+        if lower is not None:
+            args.append(lower)
+            conditions.append(f'{primary_key} > ${len(args)}')
+        if upper is not None:
+            args.append(upper)
+            conditions.append(f'{primary_key} <= ${len(args)}')
+        args.append(self.chunk_size)
+
+        where = f'WHERE {" AND ".join(conditions)} ' if conditions else ''
+        limit = f'LIMIT ${len(args)}'
+        return f'SELECT * FROM ({query}) AS subquery {where}ORDER BY {primary_key} {limit}', args  # noqa: S608
+
+    async def _read_range(
+        self, pool: PGPool, lower: Any, upper: Any, queue: asyncio.Queue[Record | Exception | None]
+    ) -> None:
+        """Read the (lower, upper] primary key range chunk by chunk, each chunk in its own transaction."""
+        try:
+            while True:
+                query, args = self._chunk_query(lower, upper)
+                async with pool.acquire() as conn:
+                    rows = await conn.fetch(query, *args)
+
+                for row in rows:
+                    await queue.put(self._to_record(row))
+
+                if len(rows) < self.chunk_size:
+                    break
+                lower = rows[-1][self.primary_key]
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(None)
 
     async def count_records(self) -> int:
         """Count total records matching the query."""
-        pool = await self._ensure_pool()
+        pool = self._pool
 
-        count_query = f'SELECT COUNT(*) FROM ({self.query}) AS subquery'  # noqa: S608
+        query, args = self._read_query()
+        count_query = f'SELECT COUNT(*) FROM ({query}) AS subquery'  # noqa: S608
         async with pool.acquire() as conn:
-            result = await conn.fetchval(count_query)
+            result = await conn.fetchval(count_query, *args)
             return result or 0
 
+    async def estimate_records(self) -> int:
+        """Return the planner's row estimate for the query, without executing it."""
+        pool = self._pool
+
+        query, args = self._read_query()
+        async with pool.acquire() as conn:
+            plan = await conn.fetchval(f'EXPLAIN (FORMAT JSON) {query}', *args)
+        return int(json.loads(plan)[0]['Plan']['Plan Rows'])
+
     async def close(self) -> None:
         """Close pool"""
-        if self._pool is not None:
+        if self._owns_pool:
             await self._pool.close()
-            self._pool = None
 
     def get_query(self) -> str:
         return self.query
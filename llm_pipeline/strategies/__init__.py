@@ -1,4 +1,15 @@
 from .base import ProcessingStrategy
+from .batch import BatchStrategy
+from .cascade import CascadeStrategy
+from .concurrent import ConcurrentStrategy
+from .packed import PackedStrategy
 from .sequential import SequentialStrategy
 
-__all__ = ['ProcessingStrategy', 'SequentialStrategy']
+__all__ = [
+    'BatchStrategy',
+    'CascadeStrategy',
+    'ConcurrentStrategy',
+    'PackedStrategy',
+    'ProcessingStrategy',
+    'SequentialStrategy',
+]
@@ -1,11 +1,31 @@
+import asyncio
+import logging
+import time
 from abc import ABC, abstractmethod
 from collections.abc import AsyncGenerator
+from functools import partial
 
-from llm_pipeline.models import ProcessingResult, Record
-from llm_pipeline.providers.base import LLMProvider
+from llm_pipeline.models import LLMResponse, ProcessingResult, Record, TierStats
+from llm_pipeline.providers.base import ContextWindowExceededError, LLMProvider, StreamAbortedError
+from llm_pipeline.utils.circuit_breaker import CircuitOpenError
+from llm_pipeline.utils.concurrency import AdaptiveConcurrencyController
+from llm_pipeline.utils.retry import with_retry
+from llm_pipeline.validation.response_validator import validate_partial_response, validate_response
+
+logger = logging.getLogger(__name__)
+
+# Seconds a record is held while the provider's circuit is open before it fails
+MAX_HOLD = 600.0
 
 
 class ProcessingStrategy(ABC):
+    # Stream responses, cancelling generation as soon as the partial output fails validation
+    stream: bool = False
+    # Seconds a record waits for an open circuit before it fails. None holds it until the circuit closes
+    max_hold: float | None = MAX_HOLD
+    # Set by the pipeline: held records stop waiting and fail once shutdown is requested
+    shutdown_event: asyncio.Event | None = None
+
     @abstractmethod
     def process(
         self,
@@ -24,3 +44,118 @@ class ProcessingStrategy(ABC):
         Yields:
             ProcessingResult for each processed record.
         """
+
+    def tier_stats(self) -> list[TierStats]:
+        """Per-tier statistics of strategies that escalate records between providers."""
+        return []
+
+    # Optional hook: most strategies use the pipeline's provider and own nothing
+    async def close(self) -> None:  # noqa: B027
+        """Release providers owned by the strategy."""
+
+    async def _process_single(
+        self,
+        record: Record,
+        provider: LLMProvider,
+        prompt: str,
+        controller: AdaptiveConcurrencyController | None = None,
+    ) -> ProcessingResult:
+        """
+        Process a single record with retry and validation.
+
+        While the provider's circuit is open the record is held, and sent again once the circuit
+        allows requests, instead of failing. It fails after ``max_hold`` seconds or on shutdown.
+        """
+        if self.stream:
+            request = partial(provider.execute_stream, prompt, record.content, validate_partial_response)
+        else:
+            request = partial(provider.execute, prompt, record.content)
+
+        held_since: float | None = None
+        try:
+            while True:
+                try:
+                    response = await with_retry(request, controller=controller)
+                except CircuitOpenError as e:
+                    held_since = held_since or time.monotonic()
+                    logger.debug('Record %s: held - %s', record.id, e)
+                    if not await self._hold(e, held_since):
+                        raise
+                    continue
+                return self._build_result(record, response)
+
+        except ContextWindowExceededError as e:
+            logger.warning('Record %s: skipped - %s', record.id, e)
+            return ProcessingResult(
+                record_id=record.id,
+                success=False,
+                original_content=record.content,
+                error=str(e),
+            )
+
+        except StreamAbortedError as e:
+            logger.warning('Record %s: generation aborted - %s', record.id, e)
+            return ProcessingResult(
+                record_id=record.id,
+                success=False,
+                original_content=record.content,
+                tokens_used=e.response.tokens_used,
+                cost=e.response.cost,
+                time_to_first_token=e.response.time_to_first_token,
+                error=f'Validation failed: {e}',
+            )
+
+        except Exception as e:
+            logger.error('Record %s: failed - %s', record.id, e)
+            return ProcessingResult(
+                record_id=record.id,
+                success=False,
+                original_content=record.content,
+                error=str(e),
+            )
+
+    async def _hold(self, error: CircuitOpenError, held_since: float) -> bool:
+        """
+        Wait until the open circuit allows requests again.
+
+        Returns:
+            False if the record was held for ``max_hold`` seconds or shutdown was requested first.
+        """
+        available = asyncio.create_task(error.breaker.wait_until_available())
+        waits = {available}
+        if self.shutdown_event is not None:
+            waits.add(asyncio.create_task(self.shutdown_event.wait()))
+        timeout = max(held_since + self.max_hold - time.monotonic(), 0.0) if self.max_hold is not None else None
+
+        try:
+            done, _ = await asyncio.wait(waits, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for wait in waits:
+                wait.cancel()
+            await asyncio.gather(*waits, return_exceptions=True)
+
+        shutdown = self.shutdown_event is not None and self.shutdown_event.is_set()
+        return available in done and not shutdown
+
+    @staticmethod
+    def _build_result(record: Record, response: LLMResponse) -> ProcessingResult:
+        """Validate a provider response and wrap it into a result."""
+        is_valid, validation_error = validate_response(response.content)
+        if not is_valid:
+            logger.warning('Record %s: validation failed - %s', record.id, validation_error)
+
+        return ProcessingResult(
+            record_id=record.id,
+            success=is_valid,
+            original_content=record.content,
+            transformed_content=response.content,
+            tokens_used=response.tokens_used,
+            cache_write_tokens=response.cache_write_tokens,
+            cache_read_tokens=response.cache_read_tokens,
+            cost=response.cost,
+            cache_savings=response.cache_savings,
+            cached=response.cached,
+            deduplicated=response.deduplicated,
+            time_to_first_token=response.time_to_first_token,
+            error=None if is_valid else f'Validation failed: {validation_error}',
+        )
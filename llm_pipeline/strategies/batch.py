@@ -0,0 +1,162 @@
+import asyncio
+import logging
+from collections import deque
+from collections.abc import AsyncGenerator
+from contextlib import aclosing
+
+from llm_pipeline.models import ProcessingResult, Record
+from llm_pipeline.providers.base import BatchProvider, LLMProvider
+from llm_pipeline.strategies.base import ProcessingStrategy
+from llm_pipeline.utils.retry import with_retry
+
+logger = logging.getLogger(__name__)
+
+
+class BatchStrategy(ProcessingStrategy):
+    def __init__(self, chunk_size: int = 1000, poll_interval: float = 30.0, max_pending_batches: int = 4) -> None:
+        """
+        Initialize batch strategy.
+
+        Records are submitted through the provider batch API in chunks. Results arrive
+        once a whole batch has ended, so this trades latency for price and throughput.
+
+        Args:
+            chunk_size: Number of records per batch job.
+            poll_interval: Seconds between batch status checks.
+            max_pending_batches: Maximum number of submitted batches waiting for results.
+        """
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be at least 1')
+        if max_pending_batches < 1:
+            raise ValueError('max_pending_batches must be at least 1')
+
+        self.chunk_size = chunk_size
+        self.poll_interval = poll_interval
+        self.max_pending_batches = max_pending_batches
+
+    async def process(
+        self,
+        records: AsyncGenerator[Record],
+        provider: LLMProvider,
+        prompt: str,
+    ) -> AsyncGenerator[ProcessingResult]:
+        """Process records through the provider batch API."""
+        if not isinstance(provider, BatchProvider):
+            raise TypeError(f'{provider.name} provider does not support batch processing')
+
+        pending: deque[tuple[str, dict[str, Record]]] = deque()
+        chunk: dict[str, Record] = {}
+        index = 0
+
+        try:
+            async for record in self._until_shutdown(records):
+                # Record ids may not be valid custom ids, so map them to generated ones
+                chunk[f'record-{index}'] = record
+                index += 1
+
+                if len(chunk) >= self.chunk_size:
+                    pending.append(await self._submit(provider, prompt, chunk))
+                    chunk = {}
+
+                if len(pending) >= self.max_pending_batches:
+                    async for result in self._collect_oldest(provider, pending):
+                        yield result
+
+            if chunk and not self._shutdown_requested:
+                pending.append(await self._submit(provider, prompt, chunk))
+
+            while pending and not self._shutdown_requested:
+                async for result in self._collect_oldest(provider, pending):
+                    yield result
+        finally:
+            await self._cancel_pending(provider, pending)
+
+    @property
+    def _shutdown_requested(self) -> bool:
+        return self.shutdown_event is not None and self.shutdown_event.is_set()
+
+    async def _until_shutdown(self, records: AsyncGenerator[Record]) -> AsyncGenerator[Record]:
+        """Pass records through until shutdown is requested."""
+        async with aclosing(records) as stream:
+            async for record in stream:
+                if self._shutdown_requested:
+                    return
+                yield record
+
+    async def _wait_until_done(self, provider: BatchProvider, batch_id: str) -> bool:
+        """Poll a batch until it ends. Returns False if shutdown was requested first."""
+        while not await with_retry(lambda: provider.is_batch_done(batch_id)):
+            if self.shutdown_event is None:
+                await asyncio.sleep(self.poll_interval)
+                continue
+            try:
+                async with asyncio.timeout(self.poll_interval):
+                    await self.shutdown_event.wait()
+            except TimeoutError:
+                continue
+            logger.warning('Shutdown requested, leaving batch %s', batch_id)
+            return False
+        return True
+
+    @staticmethod
+    async def _cancel_pending(provider: BatchProvider, pending: deque[tuple[str, dict[str, Record]]]) -> None:
+        """Cancel batches left behind by an interrupted or shut down run."""
+        for batch_id, _ in pending:
+            try:
+                if not await provider.is_batch_done(batch_id):
+                    logger.warning('Cancelling unfinished batch %s', batch_id)
+                    await provider.cancel_batch(batch_id)
+            except Exception as e:
+                logger.error('Failed to cancel batch %s: %s', batch_id, e)
+
+    @staticmethod
+    async def _submit(provider: BatchProvider, prompt: str, chunk: dict[str, Record]) -> tuple[str, dict[str, Record]]:
+        requests = {custom_id: record.content for custom_id, record in chunk.items()}
+        batch_id = await with_retry(lambda: provider.submit_batch(prompt, requests))
+        logger.info('Submitted batch %s with %s records', batch_id, len(chunk))
+        return batch_id, chunk
+
+    async def _collect_oldest(
+        self, provider: BatchProvider, pending: deque[tuple[str, dict[str, Record]]]
+    ) -> AsyncGenerator[ProcessingResult]:
+        """Collect the oldest pending batch. On shutdown it stays pending, to be cancelled."""
+        async for result in self._collect(provider, *pending[0]):
+            yield result
+        if not self._shutdown_requested:
+            pending.popleft()
+
+    async def _collect(
+        self, provider: BatchProvider, batch_id: str, chunk: dict[str, Record]
+    ) -> AsyncGenerator[ProcessingResult]:
+        """Wait for a batch to end and yield a result for every record in it. Yields nothing on shutdown."""
+        if not await self._wait_until_done(provider, batch_id):
+            return
+
+        logger.info('Batch %s ended, fetching results', batch_id)
+
+        async for item in provider.fetch_batch_results(batch_id):
+            record = chunk.pop(item.custom_id, None)
+            if record is None:
+                logger.warning('Batch %s: unknown custom id %s', batch_id, item.custom_id)
+                continue
+
+            if item.response is None:
+                logger.error('Record %s: failed - %s', record.id, item.error)
+                yield ProcessingResult(
+                    record_id=record.id,
+                    success=False,
+                    original_content=record.content,
+                    error=item.error,
+                )
+                continue
+
+            yield self._build_result(record, item.response)
+
+        for record in chunk.values():
+            logger.error('Record %s: missing from batch %s results', record.id, batch_id)
+            yield ProcessingResult(
+                record_id=record.id,
+                success=False,
+                original_content=record.content,
+                error=f'Missing from batch {batch_id} results',
+            )
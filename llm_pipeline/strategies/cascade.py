@@ -0,0 +1,115 @@
+import logging
+import time
+from collections.abc import AsyncGenerator, Callable
+
+from llm_pipeline.models import ProcessingResult, Record, TierStats
+from llm_pipeline.providers.base import LLMProvider
+from llm_pipeline.strategies.concurrent import ConcurrentStrategy
+from llm_pipeline.utils.concurrency import AdaptiveConcurrencyController
+
+logger = logging.getLogger(__name__)
+
+
+class CascadeStrategy(ConcurrentStrategy):
+    def __init__(
+        self,
+        escalation: list[LLMProvider],
+        validators: list[Callable[[str], tuple[bool, str | None]]] | None = None,
+        concurrency: int | AdaptiveConcurrencyController = 10,
+        ordered: bool = False,
+        read_ahead: int | None = None,
+        stream: bool = False,
+    ) -> None:
+        """
+        Initialize cascade strategy.
+
+        Every record is sent to the pipeline's provider first. Records whose request fails or whose
+        response does not pass ``validate_response`` and ``validators`` are re-run on the next,
+        stronger provider in ``escalation``. The result of the last tier is kept either way, with
+        the cost and tokens of all tiers it went through.
+
+        Args:
+            escalation: Providers to escalate to, in order, e.g. a stronger model of the same provider.
+            validators: Additional checks of the transformed content, each returning (is_valid, error).
+            concurrency: Maximum number of records in flight, or an adaptive controller.
+            ordered: Yield results in source order instead of as they complete.
+            read_ahead: Maximum number of records fetched from the source but not yet yielded.
+            stream: Stream responses and cancel generation once the partial output fails validation.
+        """
+        super().__init__(concurrency, ordered=ordered, read_ahead=read_ahead, stream=stream)
+
+        if not escalation:
+            raise ValueError('escalation requires at least one provider')
+
+        self.escalation = escalation
+        self.validators = validators or []
+        self._tier_stats: list[TierStats] = []
+
+    def tier_stats(self) -> list[TierStats]:
+        return self._tier_stats
+
+    async def process(
+        self,
+        records: AsyncGenerator[Record],
+        provider: LLMProvider,
+        prompt: str,
+    ) -> AsyncGenerator[ProcessingResult]:
+        self._tier_stats = [
+            TierStats(tier=tier, model=tier_provider.model)
+            for tier, tier_provider in enumerate([provider, *self.escalation])
+        ]
+        async for result in super().process(records, provider, prompt):
+            yield result
+
+        for stats in self._tier_stats:
+            logger.info(
+                'Tier %s (%s): %s requests, %s accepted, $%.4f, mean latency %.2fs',
+                stats.tier,
+                stats.model,
+                stats.requests,
+                stats.accepted,
+                stats.cost,
+                stats.mean_latency,
+            )
+
+    async def close(self) -> None:
+        for provider in self.escalation:
+            await provider.close()
+
+    async def _process_unit(self, unit: list[Record], provider: LLMProvider, prompt: str) -> list[ProcessingResult]:
+        return [await self._cascade(record, provider, prompt) for record in unit]
+
+    async def _cascade(self, record: Record, provider: LLMProvider, prompt: str) -> ProcessingResult:
+        """Run a record up the tiers until a response passes validation."""
+        tiers = [provider, *self.escalation]
+        cost = 0.0
+        tokens_used = 0
+
+        for tier, tier_provider in enumerate(tiers):
+            start = time.monotonic()
+            result = self._validate(await self._process_single(record, tier_provider, prompt, self.controller))
+            stats = self._tier_stats[tier]
+            stats.requests += 1
+            stats.cost += result.cost
+            stats.total_latency += time.monotonic() - start
+
+            cost += result.cost
+            tokens_used += result.tokens_used
+            if result.success:
+                stats.accepted += 1
+                break
+            if tier + 1 < len(tiers):
+                logger.info('Record %s: escalating to %s - %s', record.id, tiers[tier + 1].model, result.error)
+
+        return result.model_copy(update={'tier': tier, 'cost': cost, 'tokens_used': tokens_used})
+
+    def _validate(self, result: ProcessingResult) -> ProcessingResult:
+        """Apply the configured validators to a successful result."""
+        if not result.success:
+            return result
+
+        for validator in self.validators:
+            is_valid, error = validator(result.transformed_content or '')
+            if not is_valid:
+                return result.model_copy(update={'success': False, 'error': f'Validation failed: {error}'})
+        return result
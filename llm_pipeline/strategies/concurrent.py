@@ -0,0 +1,113 @@
+import asyncio
+from collections import deque
+from collections.abc import AsyncGenerator
+
+from llm_pipeline.models import ProcessingResult, Record
+from llm_pipeline.providers.base import LLMProvider
+from llm_pipeline.strategies.base import ProcessingStrategy
+from llm_pipeline.utils.concurrency import AdaptiveConcurrencyController
+
+
+class ConcurrentStrategy(ProcessingStrategy):
+    def __init__(
+        self,
+        concurrency: int | AdaptiveConcurrencyController = 10,
+        ordered: bool = False,
+        read_ahead: int | None = None,
+        stream: bool = False,
+    ) -> None:
+        """
+        Initialize concurrent strategy.
+
+        Args:
+            concurrency: Maximum number of requests in flight, or an adaptive controller
+                that adjusts the limit from rate limit feedback. A controller may be shared
+                between several strategies.
+            ordered: Yield results in source order instead of as they complete.
+            read_ahead: Maximum number of work units (records) fetched from the source but not yet yielded.
+                Defaults to twice the (maximum) concurrency.
+            stream: Stream responses and cancel generation once the partial output fails validation.
+        """
+        if isinstance(concurrency, AdaptiveConcurrencyController):
+            self.controller: AdaptiveConcurrencyController | None = concurrency
+            max_concurrency = concurrency.max_limit
+        else:
+            if concurrency < 1:
+                raise ValueError('concurrency must be at least 1')
+            self.controller = None
+            max_concurrency = concurrency
+
+        self.concurrency = max_concurrency
+        self.ordered = ordered
+        self.stream = stream
+        self.read_ahead = read_ahead or max_concurrency * 2
+
+        if self.read_ahead < max_concurrency:
+            raise ValueError('read_ahead must not be less than concurrency')
+
+    async def process(
+        self,
+        records: AsyncGenerator[Record],
+        provider: LLMProvider,
+        prompt: str,
+    ) -> AsyncGenerator[ProcessingResult]:
+        """Process records concurrently, keeping up to `concurrency` requests in flight."""
+        limiter = self.controller or asyncio.Semaphore(self.concurrency)
+        pending: deque[asyncio.Task[list[ProcessingResult]]] = deque()
+
+        async def run(unit: list[Record]) -> list[ProcessingResult]:
+            async with limiter:
+                return await self._process_unit(unit, provider, prompt)
+
+        try:
+            async for unit in self._work_units(records):
+                pending.append(asyncio.create_task(run(unit)))
+
+                # Backpressure: stop reading from the source until the window has room
+                block = len(pending) >= self.read_ahead
+                async for result in self._collect(pending, block=block):
+                    yield result
+
+            while pending:
+                async for result in self._collect(pending, block=True):
+                    yield result
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _work_units(self, records: AsyncGenerator[Record]) -> AsyncGenerator[list[Record]]:
+        """Group records into units that hold one concurrency slot each. One record per unit by default."""
+        async for record in records:
+            yield [record]
+
+    async def _process_unit(self, unit: list[Record], provider: LLMProvider, prompt: str) -> list[ProcessingResult]:
+        """Process one unit of work, returning results in unit order."""
+        return [await self._process_single(record, provider, prompt, controller=self.controller) for record in unit]
+
+    async def _collect(
+        self, pending: deque[asyncio.Task[list[ProcessingResult]]], block: bool
+    ) -> AsyncGenerator[ProcessingResult]:
+        """
+        Yield finished results, removing their tasks from the window.
+
+        Args:
+            pending: Tasks in source order.
+            block: Wait until at least one result can be yielded.
+        """
+        if self.ordered:
+            if block:
+                await asyncio.wait([pending[0]])
+            while pending and pending[0].done():
+                for result in pending.popleft().result():
+                    yield result
+            return
+
+        if block:
+            await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+        done = [task for task in pending if task.done()]
+        for task in done:
+            pending.remove(task)
+            for result in task.result():
+                yield result
@@ -0,0 +1,165 @@
+import json
+import logging
+import re
+from collections.abc import AsyncGenerator
+
+from llm_pipeline.models import LLMResponse, ProcessingResult, Record
+from llm_pipeline.providers.base import LLMProvider
+from llm_pipeline.strategies.concurrent import ConcurrentStrategy
+from llm_pipeline.utils.concurrency import AdaptiveConcurrencyController
+from llm_pipeline.utils.retry import with_retry
+
+logger = logging.getLogger(__name__)
+
+PACK_INSTRUCTIONS = """
+
+The input is a JSON array of items, each with an "id" and a "content" field. \
+Apply the instructions above to the content of every item independently. \
+Respond with only a JSON array containing one object per input item, \
+with the same "id" and the transformed text in "content"."""
+
+CODE_FENCE_PATTERN = re.compile(r'^```(?:json)?\s*(.*?)\s*```$', re.DOTALL)
+
+
+class PackedStrategy(ConcurrentStrategy):
+    def __init__(
+        self,
+        pack_size: int = 10,
+        max_record_chars: int = 1000,
+        concurrency: int | AdaptiveConcurrencyController = 1,
+        ordered: bool = False,
+        read_ahead: int | None = None,
+    ) -> None:
+        """
+        Initialize packed strategy.
+
+        Short records are grouped into packs sent as one JSON-array request, saving the
+        per-request overhead (system prompt tokens, round trip). Records of a malformed or
+        incomplete pack response are retried one by one.
+
+        Args:
+            pack_size: Maximum number of records per request.
+            max_record_chars: Records longer than this are always sent on their own.
+            concurrency: Maximum number of requests (packs) in flight, or an adaptive controller.
+            ordered: Yield results in source order instead of as they complete.
+            read_ahead: Maximum number of packs fetched from the source but not yet yielded.
+        """
+        super().__init__(concurrency, ordered=ordered, read_ahead=read_ahead)
+
+        if pack_size < 1:
+            raise ValueError('pack_size must be at least 1')
+
+        self.pack_size = pack_size
+        self.max_record_chars = max_record_chars
+
+    async def _work_units(self, records: AsyncGenerator[Record]) -> AsyncGenerator[list[Record]]:
+        pack: list[Record] = []
+        async for record in records:
+            if len(record.content) > self.max_record_chars:
+                yield [record]
+                continue
+
+            pack.append(record)
+            if len(pack) >= self.pack_size:
+                yield pack
+                pack = []
+
+        if pack:
+            yield pack
+
+    async def _process_unit(self, unit: list[Record], provider: LLMProvider, prompt: str) -> list[ProcessingResult]:
+        if len(unit) == 1:
+            return await super()._process_unit(unit, provider, prompt)
+
+        envelope = json.dumps(
+            [{'id': index, 'content': record.content} for index, record in enumerate(unit)],
+            ensure_ascii=False,
+        )
+        try:
+            response = await with_retry(
+                lambda: provider.execute(prompt + PACK_INSTRUCTIONS, envelope), controller=self.controller
+            )
+        except Exception as e:
+            logger.warning('Pack of %s records failed (%s), processing records individually', len(unit), e)
+            return await super()._process_unit(unit, provider, prompt)
+
+        contents = self._parse_pack(response.content, len(unit))
+        shares = self._split_usage(response, unit)
+
+        results = []
+        for index, record in enumerate(unit):
+            content = contents.get(index)
+            if content is not None:
+                result = self._build_result(record, shares[index].model_copy(update={'content': content}))
+                if result.success:
+                    results.append(result)
+                    continue
+
+            logger.warning('Record %s: missing or invalid in pack response, retrying individually', record.id)
+            result = await self._process_single(record, provider, prompt, controller=self.controller)
+            # The record's share of the pack request was paid for as well
+            share = shares[index]
+            results.append(
+                result.model_copy(
+                    update={
+                        'tokens_used': result.tokens_used + share.tokens_used,
+                        'cache_write_tokens': result.cache_write_tokens + share.cache_write_tokens,
+                        'cache_read_tokens': result.cache_read_tokens + share.cache_read_tokens,
+                        'cost': result.cost + share.cost,
+                        'cache_savings': result.cache_savings + share.cache_savings,
+                        'deduplicated': result.deduplicated or share.deduplicated,
+                    }
+                )
+            )
+
+        return results
+
+    @staticmethod
+    def _parse_pack(text: str, size: int) -> dict[int, str]:
+        """Extract per-item contents from a pack response. Malformed items are skipped."""
+        text = text.strip()
+        match = CODE_FENCE_PATTERN.match(text)
+        if match:
+            text = match.group(1)
+
+        try:
+            items = json.loads(text)
+        except json.JSONDecodeError:
+            logger.warning('Pack response is not valid JSON')
+            return {}
+
+        if not isinstance(items, list):
+            logger.warning('Pack response is not a JSON array')
+            return {}
+
+        contents: dict[int, str] = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            index, content = item.get('id'), item.get('content')
+            if isinstance(index, int) and 0 <= index < size and isinstance(content, str):
+                contents[index] = content
+        return contents
+
+    @staticmethod
+    def _split_usage(response: LLMResponse, unit: list[Record]) -> list[LLMResponse]:
+        """Split tokens and cost of a pack request across its records, proportionally to content length."""
+        total_chars = sum(len(record.content) for record in unit) or 1
+        shares = []
+        for index, record in enumerate(unit):
+            weight = len(record.content) / total_chars
+            shares.append(
+                LLMResponse(
+                    content='',
+                    input_tokens=round(response.input_tokens * weight),
+                    output_tokens=round(response.output_tokens * weight),
+                    cache_write_tokens=round(response.cache_write_tokens * weight),
+                    cache_read_tokens=round(response.cache_read_tokens * weight),
+                    cost=response.cost * weight,
+                    cache_savings=response.cache_savings * weight,
+                    cached=response.cached,
+                    # A deduplicated pack saved one request, counted on its first record
+                    deduplicated=response.deduplicated and index == 0,
+                )
+            )
+        return shares
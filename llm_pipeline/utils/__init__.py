@@ -1,12 +1,43 @@
+from llm_pipeline.utils.budget import CostBudget
+from llm_pipeline.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from llm_pipeline.utils.concurrency import AdaptiveConcurrencyController
+from llm_pipeline.utils.http import HTTPTransport
 from llm_pipeline.utils.logging import setup_logging
+from llm_pipeline.utils.pool import PGPool, PoolManager
 from llm_pipeline.utils.progress import ProgressTracker
-from llm_pipeline.utils.retry import RateLimitError, RequestTimeoutError, RetryableError, with_retry
+from llm_pipeline.utils.rate_limit import TokenBucketLimiter
+from llm_pipeline.utils.retry import (
+    NetworkError,
+    OverloadedError,
+    RateLimitError,
+    RequestTimeoutError,
+    RetryableError,
+    RetryBudget,
+    ServerError,
+    classify_error,
+    with_retry,
+)
+from llm_pipeline.utils.tokens import TokenEstimator
 
 __all__ = [
+    'AdaptiveConcurrencyController',
+    'CircuitBreaker',
+    'CircuitOpenError',
+    'CostBudget',
+    'HTTPTransport',
+    'NetworkError',
+    'OverloadedError',
+    'PGPool',
+    'PoolManager',
     'ProgressTracker',
     'RateLimitError',
     'RequestTimeoutError',
+    'RetryBudget',
     'RetryableError',
+    'ServerError',
+    'TokenBucketLimiter',
+    'TokenEstimator',
+    'classify_error',
     'setup_logging',
     'with_retry',
 ]
@@ -0,0 +1,94 @@
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class CostBudget:
+    """
+    Hard limit on the spend of a run.
+
+    The projected cost of every request is reserved before it is sent and settled with the
+    actual cost once its result arrives. Reservations are scaled by the ratio of actual to
+    projected cost observed so far, so a provider costing more than its pricing suggests
+    does not overrun the limit. A reservation that would cross the limit is refused and
+    marks the budget as exhausted.
+    """
+
+    def __init__(self, max_cost: float) -> None:
+        """
+        Initialize budget.
+
+        Args:
+            max_cost: Maximum spend in dollars.
+        """
+        if max_cost <= 0:
+            raise ValueError('max_cost must be positive')
+
+        self.max_cost = max_cost
+        self.spent = 0.0
+        self.exhausted = False
+        # Projected and actual cost of settled requests that had a projection
+        self._settled_projection = 0.0
+        self._settled_actual = 0.0
+        # Projected cost of requests without a result yet
+        self._reservations: dict[Any, float] = {}
+        self._in_flight_projection = 0.0
+
+    @property
+    def reserved(self) -> float:
+        """Expected cost of the requests in flight."""
+        return self._in_flight_projection * self.cost_ratio
+
+    @property
+    def remaining(self) -> float:
+        return self.max_cost - self.spent - self.reserved
+
+    @property
+    def cost_ratio(self) -> float:
+        """Actual to projected cost of settled requests. Projections are never scaled down."""
+        if self._settled_projection <= 0:
+            return 1.0
+        return max(self._settled_actual / self._settled_projection, 1.0)
+
+    def reserve(self, key: Any, cost: float) -> bool:
+        """
+        Reserve the projected cost of a request, scaled by the observed cost ratio.
+
+        Args:
+            key: Identifies the request when it is settled.
+            cost: Projected cost in dollars.
+
+        Returns:
+            False if the request would cross the limit. Nothing is reserved then.
+        """
+        amount = cost * self.cost_ratio
+        if self.exhausted or amount > self.remaining:
+            if not self.exhausted:
+                logger.warning(
+                    'Cost budget of $%.2f reached: $%.4f spent, $%.4f in flight',
+                    self.max_cost,
+                    self.spent,
+                    self.reserved,
+                )
+            self.exhausted = True
+            return False
+
+        self._reservations[key] = cost
+        self._in_flight_projection += cost
+        return True
+
+    def settle(self, key: Any, actual: float) -> None:
+        """
+        Replace the reservation of a request with its actual cost.
+
+        Args:
+            key: Key passed to ``reserve``. Requests sent without a reservation only add their cost.
+            actual: Actual cost of the request.
+        """
+        projected = self._reservations.pop(key, 0.0)
+        self._in_flight_projection = max(self._in_flight_projection - projected, 0.0)
+        self.spent += actual
+        if projected > 0:
+            self._settled_projection += projected
+            self._settled_actual += actual
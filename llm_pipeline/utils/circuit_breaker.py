@@ -0,0 +1,185 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Literal
+
+logger = logging.getLogger(__name__)
+
+CircuitState = Literal['closed', 'open', 'half_open']
+
+# How often requests held by a half-open circuit check whether its probes have finished
+PROBE_POLL_INTERVAL = 0.5
+
+
+class CircuitOpenError(Exception):
+    """The request was not sent, or its failure opened the circuit, because the backend is unavailable."""
+
+    def __init__(self, breaker: CircuitBreaker) -> None:
+        """
+        Args:
+            breaker: The open circuit breaker. Callers can wait for it to allow requests again.
+        """
+        super().__init__(f'Circuit {breaker.name} is open')
+        self.breaker = breaker
+
+
+class CircuitBreaker:
+    """
+    Stops sending requests to a backend that keeps failing.
+
+    The circuit opens after ``failure_threshold`` consecutive failures, or when at least
+    ``error_rate_threshold`` of the requests of the last ``window`` seconds failed. Requests are
+    then refused for ``reset_timeout`` seconds. Then it is half-open: ``half_open_probes`` probe
+    requests are let through; if all succeed the circuit closes, a failing probe reopens it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        name: str = '',
+        error_rate_threshold: float | None = 0.5,
+        window: float = 60.0,
+        min_requests: int = 20,
+        half_open_probes: int = 1,
+    ) -> None:
+        """
+        Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit.
+            reset_timeout: Seconds the circuit stays open before probes are allowed.
+            name: Backend name used in log messages.
+            error_rate_threshold: Share of failed requests within ``window`` that opens the circuit.
+                None only counts consecutive failures.
+            window: Seconds of outcomes the error rate is computed over.
+            min_requests: Outcomes within ``window`` needed before the error rate is used.
+            half_open_probes: Probe requests allowed in the half-open state, all of which must succeed.
+        """
+        if failure_threshold < 1:
+            raise ValueError('failure_threshold must be at least 1')
+        if error_rate_threshold is not None and not 0 < error_rate_threshold <= 1:
+            raise ValueError('error_rate_threshold must be between 0 and 1')
+        if half_open_probes < 1:
+            raise ValueError('half_open_probes must be at least 1')
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.name = name
+        self.error_rate_threshold = error_rate_threshold
+        self.window = window
+        self.min_requests = min_requests
+        self.half_open_probes = half_open_probes
+        self.times_opened = 0
+
+        self._failures = 0
+        # (time, failed) of recent outcomes
+        self._outcomes: deque[tuple[float, bool]] = deque()
+        self._opened_at: float | None = None
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+
+    @property
+    def state(self) -> CircuitState:
+        if self._opened_at is None:
+            return 'closed'
+        if time.monotonic() - self._opened_at < self.reset_timeout:
+            return 'open'
+        return 'half_open'
+
+    @property
+    def error_rate(self) -> float:
+        """Share of failed requests within the window."""
+        self._prune(time.monotonic())
+        if not self._outcomes:
+            return 0.0
+        return sum(failed for _, failed in self._outcomes) / len(self._outcomes)
+
+    def _prune(self, now: float) -> None:
+        while self._outcomes and now - self._outcomes[0][0] > self.window:
+            self._outcomes.popleft()
+
+    @property
+    def available(self) -> bool:
+        """Whether the circuit is closed or a probe may be sent. Unlike ``allow_request`` it takes no probe."""
+        state = self.state
+        if state == 'half_open':
+            return self._probes_in_flight + self._probe_successes < self.half_open_probes
+        return state == 'closed'
+
+    def allow_request(self) -> bool:
+        """
+        Return whether a request may be sent now. A half-open circuit allows ``half_open_probes``
+        probes and expects their outcomes to be recorded.
+        """
+        if self.state == 'closed':
+            return True
+        if not self.available:
+            return False
+
+        self._probes_in_flight += 1
+        return True
+
+    async def wait_until_available(self) -> None:
+        """Wait until the circuit is closed or a probe may be sent."""
+        while not self.available:
+            if self.state == 'open':
+                delay = self._opened_at + self.reset_timeout - time.monotonic()  # type: ignore[operator]
+            else:
+                delay = PROBE_POLL_INTERVAL
+            await asyncio.sleep(max(delay, 0.0))
+
+    def record_success(self) -> None:
+        if self._opened_at is not None:
+            if self.state == 'open':
+                # A request sent before the circuit opened, not a probe
+                return
+            self._probes_in_flight = max(self._probes_in_flight - 1, 0)
+            self._probe_successes += 1
+            if self._probe_successes < self.half_open_probes:
+                return
+            logger.info('Circuit %s closed', self.name)
+            self._outcomes.clear()
+
+        self._failures = 0
+        self._opened_at = None
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        now = time.monotonic()
+        self._prune(now)
+        self._outcomes.append((now, False))
+
+    def record_failure(self) -> None:
+        now = time.monotonic()
+        self._failures += 1
+
+        if self._opened_at is not None:
+            if self.state == 'half_open':
+                logger.warning('Circuit %s reopened, probe failed', self.name)
+            self._open(now)
+            return
+
+        self._prune(now)
+        self._outcomes.append((now, True))
+        if self._failures >= self.failure_threshold:
+            logger.warning('Circuit %s opened after %s consecutive failures', self.name, self._failures)
+            self._open(now)
+        elif (
+            self.error_rate_threshold is not None
+            and len(self._outcomes) >= self.min_requests
+            and self.error_rate >= self.error_rate_threshold
+        ):
+            logger.warning('Circuit %s opened at %.0f%% errors', self.name, self.error_rate * 100)
+            self._open(now)
+
+    def release_probe(self) -> None:
+        """Forget a probe that ended without an outcome, e.g. because it was cancelled."""
+        self._probes_in_flight = max(self._probes_in_flight - 1, 0)
+
+    def _open(self, now: float) -> None:
+        if self._opened_at is None:
+            self.times_opened += 1
+        self._opened_at = now
+        self._probes_in_flight = 0
+        self._probe_successes = 0
@@ -0,0 +1,131 @@
+import asyncio
+import logging
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveConcurrencyController:
+    """
+    AIMD limiter for the number of requests in flight.
+
+    The limit grows additively (by roughly `increase_step` per window of successful
+    requests) and is cut multiplicatively when the provider signals overload.
+    One instance can be shared by several strategies to cap their combined load.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase_step: float = 1.0,
+        decrease_factor: float = 0.5,
+        cooldown: float = 5.0,
+        history_size: int = 1000,
+    ) -> None:
+        """
+        Initialize controller.
+
+        Args:
+            initial_limit: Starting number of requests allowed in flight.
+            min_limit: Lower bound for the limit.
+            max_limit: Upper bound for the limit.
+            increase_step: How much the limit grows per window of successful requests.
+            decrease_factor: Multiplier applied to the limit on overload.
+            cooldown: Seconds after a decrease during which further overload signals are ignored,
+                so that one burst of 429s cuts the limit only once.
+            history_size: Number of limit changes to keep in `history`.
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError('Expected 1 <= min_limit <= initial_limit <= max_limit')
+        if not 0 < decrease_factor < 1:
+            raise ValueError('decrease_factor must be between 0 and 1')
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._last_decrease = float('-inf')
+        self._history: deque[tuple[float, int]] = deque([(time.monotonic(), initial_limit)], maxlen=history_size)
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently holding a slot."""
+        return self._in_flight
+
+    @property
+    def history(self) -> list[tuple[float, int]]:
+        """Limit changes as (monotonic timestamp, limit) pairs, oldest first."""
+        return list(self._history)
+
+    async def acquire(self) -> None:
+        """Wait for a free slot."""
+        if not self._waiters and self._in_flight < self.limit:
+            self._in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over right before cancellation
+                self.release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        """Return a slot."""
+        self._in_flight -= 1
+        self._wake_waiters()
+
+    def on_success(self) -> None:
+        """Additive increase after a successful request."""
+        self._set_limit(min(self.max_limit, self._limit + self.increase_step / self._limit))
+        self._wake_waiters()
+
+    def on_overload(self) -> None:
+        """Multiplicative decrease after a rate limit or timeout."""
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+
+        self._last_decrease = now
+        self._set_limit(max(self.min_limit, self._limit * self.decrease_factor))
+        logger.info('Provider overloaded, concurrency limit reduced to %s', self.limit)
+
+    def _set_limit(self, value: float) -> None:
+        previous = self.limit
+        self._limit = value
+        if self.limit != previous:
+            self._history.append((time.monotonic(), self.limit))
+            logger.debug('Concurrency limit changed: %s -> %s', previous, self.limit)
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    async def __aenter__(self) -> None:
+        """Context manager entry."""
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:  # noqa: ANN001
+        """Context manager exit."""
+        self.release()
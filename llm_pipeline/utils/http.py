@@ -0,0 +1,135 @@
+import logging
+import time
+from collections import deque
+from typing import Any
+
+import httpx
+
+from llm_pipeline.models import RequestTimings
+
+logger = logging.getLogger(__name__)
+
+TIMINGS_KEY = 'llm_pipeline.timings'
+
+
+class _RequestTrace:
+    """httpcore trace callback collecting event timestamps of one request."""
+
+    def __init__(self) -> None:
+        self.events: dict[str, float] = {}
+
+    async def __call__(self, event: str, info: dict[str, Any]) -> None:
+        self.events[event] = time.monotonic()
+
+    def _span(self, started: str, complete: str) -> float | None:
+        if started not in self.events or complete not in self.events:
+            return None
+        return self.events[complete] - self.events[started]
+
+    def timings(self, http_version: str) -> RequestTimings:
+        prefix = 'http2' if http_version == 'HTTP/2' else 'http11'
+        ttfb = self._span(f'{prefix}.send_request_headers.started', f'{prefix}.receive_response_headers.complete')
+        return RequestTimings(
+            connect=self._span('connection.connect_tcp.started', 'connection.connect_tcp.complete'),
+            tls=self._span('connection.start_tls.started', 'connection.start_tls.complete'),
+            ttfb=ttfb or 0.0,
+            http_version=http_version,
+        )
+
+
+class HTTPTransport:
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        timeout: float = 120.0,
+        connect_timeout: float = 10.0,
+        history_size: int = 1000,
+    ) -> None:
+        """
+        Initialize shared HTTP transport.
+
+        One ``httpx.AsyncClient`` with pooled keep-alive connections, meant to be shared by
+        providers, so that TCP and TLS setup is paid once per connection instead of once per
+        request. Connect, TLS and time-to-first-byte timings are recorded for every request.
+
+        Args:
+            max_connections: Maximum number of open connections.
+            max_keepalive_connections: Maximum number of idle connections kept open.
+            keepalive_expiry: Seconds an idle connection is kept open.
+            http2: Use HTTP/2 where the server supports it. Requires the ``h2`` package.
+            timeout: Read, write and pool timeout in seconds.
+            connect_timeout: Connect timeout in seconds.
+            history_size: Number of most recent request timings kept in ``timings``.
+        """
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(timeout, connect=connect_timeout),
+            http2=http2,
+            event_hooks={'request': [self._on_request], 'response': [self._on_response]},
+        )
+        self.timings: deque[RequestTimings] = deque(maxlen=history_size)
+        self.requests = 0
+        self.connections_opened = 0
+        self.total_connect = 0.0
+        self.total_tls = 0.0
+        self.total_ttfb = 0.0
+        self.max_ttfb = 0.0
+
+    async def _on_request(self, request: httpx.Request) -> None:
+        trace = _RequestTrace()
+        request.extensions['trace'] = trace
+        request.extensions[TIMINGS_KEY] = trace
+
+    async def _on_response(self, response: httpx.Response) -> None:
+        trace = response.request.extensions.get(TIMINGS_KEY)
+        if trace is None:
+            return
+
+        timings = trace.timings(response.http_version)
+        response.extensions[TIMINGS_KEY] = timings
+        self.timings.append(timings)
+
+        self.requests += 1
+        self.total_ttfb += timings.ttfb
+        self.max_ttfb = max(self.max_ttfb, timings.ttfb)
+        if not timings.reused_connection:
+            self.connections_opened += 1
+            self.total_connect += timings.connect or 0.0
+            self.total_tls += timings.tls or 0.0
+
+    @property
+    def mean_ttfb(self) -> float:
+        return self.total_ttfb / self.requests if self.requests else 0.0
+
+    @property
+    def mean_connect(self) -> float:
+        """Mean TCP connect time (including name resolution) of newly opened connections."""
+        return self.total_connect / self.connections_opened if self.connections_opened else 0.0
+
+    @property
+    def mean_tls(self) -> float:
+        return self.total_tls / self.connections_opened if self.connections_opened else 0.0
+
+    async def close(self) -> None:
+        if self.client.is_closed:
+            return
+
+        if self.requests:
+            logger.info(
+                'HTTP: %s requests over %s connections, connect mean %.1f ms, TLS mean %.1f ms, '
+                'TTFB mean %.1f ms, max %.1f ms',
+                self.requests,
+                self.connections_opened,
+                self.mean_connect * 1000,
+                self.mean_tls * 1000,
+                self.mean_ttfb * 1000,
+                self.max_ttfb * 1000,
+            )
+        await self.client.aclose()
@@ -0,0 +1,113 @@
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import asyncpg
+
+from llm_pipeline.config import PGSettings
+
+logger = logging.getLogger(__name__)
+
+
+class PGPool:
+    def __init__(self, settings: PGSettings) -> None:
+        """
+        Initialize a lazily created asyncpg pool that records how long acquires wait.
+
+        Args:
+            settings: Database connection and pool settings.
+        """
+        self.settings = settings
+        self.acquires = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+        self._pool: asyncpg.Pool | None = None
+        self._lock = asyncio.Lock()
+
+    async def _ensure_pool(self) -> asyncpg.Pool:
+        if self._pool is None:
+            async with self._lock:
+                if self._pool is None:
+                    self._pool = await asyncpg.create_pool(  # type: ignore[misc]
+                        host=self.settings.host,
+                        port=self.settings.port,
+                        database=self.settings.db,
+                        user=self.settings.user,
+                        password=self.settings.password.get_secret_value(),
+                        min_size=self.settings.pool_min_size,
+                        max_size=self.settings.pool_max_size,
+                        statement_cache_size=self.settings.statement_cache_size,
+                        command_timeout=self.settings.command_timeout,
+                        server_settings=self.settings.server_settings or None,
+                    )
+        return self._pool
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[asyncpg.Connection]:
+        """Acquire a connection, waiting while all of them are in use."""
+        pool = await self._ensure_pool()
+
+        start = time.monotonic()
+        async with pool.acquire() as conn:
+            wait = time.monotonic() - start
+            self.acquires += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            yield conn
+
+    @property
+    def mean_wait(self) -> float:
+        """Mean seconds an acquire waited for a free connection."""
+        return self.total_wait / self.acquires if self.acquires else 0.0
+
+    async def close(self) -> None:
+        if self._pool is None:
+            return
+
+        logger.info(
+            'Pool %s@%s/%s: %s acquires, wait mean %.1f ms, max %.1f ms',
+            self.settings.user,
+            self.settings.host,
+            self.settings.db,
+            self.acquires,
+            self.mean_wait * 1000,
+            self.max_wait * 1000,
+        )
+        await self._pool.close()
+        self._pool = None
+
+
+class PoolManager:
+    def __init__(self) -> None:
+        """
+        Share connection pools between sources, sinks and checkpoint stores.
+
+        Components given the same manager and equal settings use one pool. Shared pools are
+        not closed by the components; close the manager once all pipelines are done.
+        """
+        self._pools: dict[str, PGPool] = {}
+
+    def get(self, settings: PGSettings) -> PGPool:
+        """
+        Return the pool for these settings, creating it on first use.
+
+        Args:
+            settings: Database connection and pool settings.
+        """
+        # dsn carries the password, which the JSON dump masks
+        key = settings.dsn + settings.model_dump_json()
+        if key not in self._pools:
+            self._pools[key] = PGPool(settings)
+        return self._pools[key]
+
+    @property
+    def pools(self) -> list[PGPool]:
+        return list(self._pools.values())
+
+    async def close(self) -> None:
+        for pool in self._pools.values():
+            await pool.close()
+        self._pools.clear()
@@ -11,14 +11,16 @@ from rich.progress import (
 )
 from rich.table import Table
 
+from llm_pipeline.models import TierStats
+
 
 class ProgressTracker:
-    def __init__(self, total: int, console: Console | None = None) -> None:
+    def __init__(self, total: int | None, console: Console | None = None) -> None:
         """
         Initialize progress tracker.
 
         Args:
-            total: Total number of records to process.
+            total: Total number of records to process, None while unknown.
             console: Rich console instance.
         """
         self.total = total
@@ -26,7 +28,17 @@ class ProgressTracker:
         self.successful = 0
         self.failed = 0
         self.total_tokens = 0
+        self.cache_write_tokens = 0
+        self.cache_read_tokens = 0
         self.total_cost = 0.0
+        self.cache_savings = 0.0
+        self.response_cache_hits = 0
+        self.response_cache_misses = 0
+        self.calls_saved = 0
+        self.streamed = 0
+        self.total_time_to_first_token = 0.0
+        self.writer_queue_depth: int | None = None
+        self.max_writer_queue_depth = 0
         self._progress: Progress | None = None
         self._task_id = None
 
@@ -46,7 +58,30 @@ class ProgressTracker:
         self._progress.start()
         self._task_id = self._progress.add_task('Processing', total=self.total)
 
-    def update(self, success: bool, tokens: int = 0, cost: float = 0.0) -> None:
+    def set_total(self, total: int) -> None:
+        """
+        Change the total number of records, e.g. once it becomes known.
+
+        Args:
+            total: Total number of records to process.
+        """
+        self.total = total
+        if self._progress and self._task_id is not None:
+            self._progress.update(self._task_id, total=total)
+
+    def update(
+        self,
+        success: bool,
+        tokens: int = 0,
+        cost: float = 0.0,
+        cache_write_tokens: int = 0,
+        cache_read_tokens: int = 0,
+        cache_savings: float = 0.0,
+        cached: bool | None = None,
+        deduplicated: bool = False,
+        writer_queue_depth: int | None = None,
+        time_to_first_token: float | None = None,
+    ) -> None:
         """
         Update progress after processing a record.
 
@@ -54,6 +89,13 @@ class ProgressTracker:
             success: Whether processing was successful.
             tokens: Tokens used.
             cost: Cost incurred.
+            cache_write_tokens: Input tokens written to the prompt cache.
+            cache_read_tokens: Input tokens read from the prompt cache.
+            cache_savings: Cost saved by prompt caching.
+            cached: Response cache hit (True) or miss (False), None without a response cache.
+            deduplicated: Response was reused from an identical payload in this run.
+            writer_queue_depth: Number of results waiting to be written to the sink.
+            time_to_first_token: Seconds until the first output chunk of a streamed response.
         """
         if success:
             self.successful += 1
@@ -61,26 +103,45 @@ class ProgressTracker:
             self.failed += 1
 
         self.total_tokens += tokens
+        self.cache_write_tokens += cache_write_tokens
+        self.cache_read_tokens += cache_read_tokens
         self.total_cost += cost
+        self.cache_savings += cache_savings
+
+        if cached is True:
+            self.response_cache_hits += 1
+        elif cached is False:
+            self.response_cache_misses += 1
+
+        if deduplicated:
+            self.calls_saved += 1
+
+        if time_to_first_token is not None:
+            self.streamed += 1
+            self.total_time_to_first_token += time_to_first_token
+
+        if writer_queue_depth is not None:
+            self.writer_queue_depth = writer_queue_depth
+            self.max_writer_queue_depth = max(self.max_writer_queue_depth, writer_queue_depth)
 
         if self._progress and self._task_id is not None:
-            self._progress.update(
-                self._task_id,
-                advance=1,
-                description=f'Processing (OK: {self.successful}, ERR: {self.failed})',
-            )
+            description = f'Processing (OK: {self.successful}, ERR: {self.failed}'
+            if self.writer_queue_depth is not None:
+                description += f', write queue: {self.writer_queue_depth}'
+            self._progress.update(self._task_id, advance=1, description=description + ')')
 
     def stop(self) -> None:
         """Stop progress tracking."""
         if self._progress:
             self._progress.stop()
 
-    def print_summary(self, duration_seconds: float) -> None:
+    def print_summary(self, duration_seconds: float, tiers: list[TierStats] | None = None) -> None:
         """
         Print final summary.
 
         Args:
             duration_seconds: Total duration in seconds.
+            tiers: Per-tier statistics of a cascade strategy.
         """
         minutes, seconds = divmod(int(duration_seconds), 60)
         hours, minutes = divmod(minutes, 60)
@@ -96,14 +157,35 @@ class ProgressTracker:
         table.add_column('Metric', style='bold')
         table.add_column('Value', style='cyan')
 
-        table.add_row('Total records', str(self.total))
+        processed = self.successful + self.failed
+        table.add_row('Total records', str(self.total if self.total is not None else processed))
         table.add_row('Successful', f'[green]{self.successful}[/green]')
         table.add_row(
             'Failed',
             f'[red]{self.failed}[/red]' if self.failed > 0 else str(self.failed),
         )
         table.add_row('Total tokens', f'{self.total_tokens:,}')
+        if self.cache_write_tokens or self.cache_read_tokens:
+            table.add_row('Cache write tokens', f'{self.cache_write_tokens:,}')
+            table.add_row('Cache read tokens', f'{self.cache_read_tokens:,}')
         table.add_row('Estimated cost', f'${self.total_cost:.4f}')
+        if self.cache_savings:
+            table.add_row('Prompt cache savings', f'${self.cache_savings:.4f}')
+        if self.response_cache_hits or self.response_cache_misses:
+            table.add_row('Response cache hits', str(self.response_cache_hits))
+            table.add_row('Response cache misses', str(self.response_cache_misses))
+        if self.calls_saved:
+            table.add_row('Duplicate calls saved', str(self.calls_saved))
+        if self.streamed:
+            mean_ttft = self.total_time_to_first_token / self.streamed
+            table.add_row('Mean time to first token', f'{mean_ttft * 1000:.0f} ms')
+        for stats in tiers or []:
+            table.add_row(
+                f'Tier {stats.tier} ({stats.model})',
+                f'{stats.accepted}/{stats.requests} accepted, ${stats.cost:.4f}, {stats.mean_latency:.2f}s mean',
+            )
+        if self.writer_queue_depth is not None:
+            table.add_row('Max write queue depth', str(self.max_writer_queue_depth))
         table.add_row('Duration', duration_str)
 
         self.console.print()
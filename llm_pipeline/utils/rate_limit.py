@@ -0,0 +1,104 @@
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class _Bucket:
+    def __init__(self, per_minute: int) -> None:
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = self.capacity
+        self._updated = time.monotonic()
+
+    def refill(self) -> None:
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until `amount` units are available."""
+        missing = amount - self.level
+        return max(0.0, missing / self.rate)
+
+
+class TokenBucketLimiter:
+    """
+    Proactive limiter for provider requests/min and tokens/min quotas.
+
+    Tokens are reserved from an estimate before a request is sent and the
+    reservation is settled with the actual usage afterwards. One instance can be
+    shared by several providers (and pipelines) running in the same event loop.
+    """
+
+    def __init__(self, requests_per_minute: int | None = None, tokens_per_minute: int | None = None) -> None:
+        """
+        Initialize limiter.
+
+        Args:
+            requests_per_minute: Request quota. None disables the request limit.
+            tokens_per_minute: Input + output token quota. None disables the token limit.
+        """
+        if requests_per_minute is not None and requests_per_minute <= 0:
+            raise ValueError('requests_per_minute must be positive')
+        if tokens_per_minute is not None and tokens_per_minute <= 0:
+            raise ValueError('tokens_per_minute must be positive')
+
+        self._requests = _Bucket(requests_per_minute) if requests_per_minute else None
+        self._tokens = _Bucket(tokens_per_minute) if tokens_per_minute else None
+        self._lock = asyncio.Lock()
+
+    async def reserve(self, tokens: int) -> int:
+        """
+        Wait until one request and `tokens` tokens fit into the quota and take them.
+
+        Args:
+            tokens: Estimated input + output tokens of the request.
+
+        Returns:
+            Number of tokens actually reserved, to be passed to `settle`.
+        """
+        if self._tokens is not None:
+            # A single request larger than the whole bucket would wait forever
+            tokens = min(tokens, int(self._tokens.capacity))
+
+        # The lock keeps waiters in FIFO order, so large requests are not starved
+        async with self._lock:
+            while True:
+                wait = 0.0
+                if self._requests is not None:
+                    self._requests.refill()
+                    wait = max(wait, self._requests.wait_time(1))
+                if self._tokens is not None:
+                    self._tokens.refill()
+                    wait = max(wait, self._tokens.wait_time(tokens))
+
+                if wait <= 0:
+                    break
+
+                logger.debug('Rate limiter: waiting %.2fs for quota', wait)
+                await asyncio.sleep(wait)
+
+            if self._requests is not None:
+                self._requests.level -= 1
+            if self._tokens is not None:
+                self._tokens.level -= tokens
+
+        return tokens
+
+    def settle(self, reserved: int, actual: int) -> None:
+        """
+        Correct a reservation with the actual token usage.
+
+        Overuse is taken from the bucket (which may go into debt), underuse is returned.
+
+        Args:
+            reserved: Value returned by `reserve`.
+            actual: Tokens actually consumed by the request.
+        """
+        if self._tokens is None:
+            return
+
+        self._tokens.refill()
+        self._tokens.level = min(self._tokens.capacity, self._tokens.level + reserved - actual)
@@ -1,25 +1,52 @@
+import asyncio
 import logging
-from collections.abc import Awaitable, Callable
+import random
+import re
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Mapping
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 
-from tenacity import (
-    RetryError,
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
+import anthropic
+import httpx
+import openai
+
+from llm_pipeline.utils.concurrency import AdaptiveConcurrencyController
 
 logger = logging.getLogger(__name__)
 
 MAX_ATTEMPTS = 3
-WAIT_MIN = 4
-WAIT_MAX = 60
-WAIT_MULTIPLIER = 4
+# Decorrelated jitter: every wait is drawn from [WAIT_BASE, 3 * previous wait], capped at WAIT_MAX
+WAIT_BASE = 1.0
+WAIT_MAX = 60.0
+# Longest server-requested wait that is honored, longer ones give up
+MAX_RETRY_AFTER = 300.0
+
+TOO_MANY_REQUESTS = 429
+REQUEST_TIMEOUT = 408
+OVERLOADED_STATUSES = {503, 529}
+SERVER_ERROR_STATUSES = {500, 502, 504}
+
+# OpenAI x-ratelimit-reset-* durations, e.g. "1m30s", "250ms"
+DURATION_PATTERN = re.compile(r'(\d+(?:\.\d+)?)(ms|s|m|h)')
+DURATION_UNITS = {'ms': 0.001, 's': 1.0, 'm': 60.0, 'h': 3600.0}
+# x-ratelimit-reset values above this (September 2001) are Unix timestamps, not seconds to wait
+UNIX_TIMESTAMP_THRESHOLD = 1e9
 
 
 class RetryableError(Exception):
     """Base class for errors that should trigger retry."""
 
+    def __init__(self, message: str = '', retry_after: float | None = None) -> None:
+        """
+        Args:
+            message: Error message.
+            retry_after: Seconds the server asked to wait before retrying.
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
 
 class RateLimitError(RetryableError):
     """Rate limit exceeded error."""
@@ -29,52 +56,255 @@ class RequestTimeoutError(RetryableError):
     """Request timeout error."""
 
 
-def _before_sleep(retry_state) -> None:  # noqa: ANN001
-    attempt = retry_state.attempt_number
-    wait = retry_state.next_action.sleep if retry_state.next_action else 0
-    exc = retry_state.outcome.exception() if retry_state.outcome else None
-    logger.warning(
-        f'Retry attempt {attempt}/{MAX_ATTEMPTS}, error: {exc}. Waiting {wait:.1f}s before next attempt.'  # noqa: G004
-    )
+class ServerError(RetryableError):
+    """Provider returned a 5xx error."""
+
+
+class OverloadedError(ServerError):
+    """Provider is temporarily overloaded (503, Anthropic 529)."""
+
+
+class NetworkError(RetryableError):
+    """Connection to the provider failed before a response was received."""
 
 
-async def with_retry[T](func: Callable[[], Awaitable[T]]) -> T:
+class RetryBudget:
+    """
+    Caps retries at a fraction of the requests sent recently.
+
+    Without a budget, every request of a struggling provider is retried several times,
+    multiplying the load exactly when the provider can handle it least.
+    """
+
+    def __init__(self, ratio: float = 0.1, window: float = 10.0, min_retries_per_second: float = 1.0) -> None:
+        """
+        Initialize retry budget.
+
+        Args:
+            ratio: Retries allowed per request sent within the window.
+            window: Seconds of history the ratio is computed over.
+            min_retries_per_second: Retries always allowed, so that a low-traffic run can still retry.
+        """
+        if ratio < 0:
+            raise ValueError('ratio must not be negative')
+
+        self.ratio = ratio
+        self.window = window
+        self.min_retries_per_second = min_retries_per_second
+        self.rejected = 0
+
+        self._requests: deque[float] = deque()
+        self._retries: deque[float] = deque()
+
+    def _prune(self, now: float) -> None:
+        for history in (self._requests, self._retries):
+            while history and now - history[0] > self.window:
+                history.popleft()
+
+    def record_request(self) -> None:
+        """Record a first attempt."""
+        now = time.monotonic()
+        self._prune(now)
+        self._requests.append(now)
+
+    def try_retry(self) -> bool:
+        """Take one retry from the budget. Returns False when the budget is used up."""
+        now = time.monotonic()
+        self._prune(now)
+
+        allowed = self.min_retries_per_second * self.window + self.ratio * len(self._requests)
+        if len(self._retries) >= allowed:
+            self.rejected += 1
+            return False
+
+        self._retries.append(now)
+        return True
+
+
+# Shared by all pipelines of the process, so that the ratio applies to the total traffic
+DEFAULT_RETRY_BUDGET = RetryBudget()
+
+
+def _seconds_until(moment: datetime) -> float:
+    # Timestamps without an offset are taken as UTC
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    return (moment - datetime.now(UTC)).total_seconds()
+
+
+def _retry_after_ms(headers: Mapping[str, str]) -> float | None:
+    try:
+        return float(headers['retry-after-ms']) / 1000
+    except KeyError, ValueError:
+        return None
+
+
+def _retry_after(headers: Mapping[str, str]) -> float | None:
+    """Standard ``Retry-After``: seconds or an HTTP date."""
+    value = headers.get('retry-after')
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return _seconds_until(parsedate_to_datetime(value))
+    except TypeError, ValueError:
+        return None
+
+
+def _ratelimit_reset(headers: Mapping[str, str]) -> float | None:
+    """``x-ratelimit-reset``: either seconds to wait or a Unix timestamp."""
+    try:
+        reset = float(headers['x-ratelimit-reset'])
+    except KeyError, ValueError:
+        return None
+    return reset - time.time() if reset > UNIX_TIMESTAMP_THRESHOLD else reset
+
+
+def _openai_reset(headers: Mapping[str, str]) -> float | None:
+    """OpenAI: durations until the exhausted request and token quotas are refilled."""
+    resets = [
+        sum(float(amount) * DURATION_UNITS[unit] for amount, unit in DURATION_PATTERN.findall(headers[name]))
+        for name in ('x-ratelimit-reset-requests', 'x-ratelimit-reset-tokens')
+        if name in headers and headers.get(name.replace('reset', 'remaining')) == '0'
+    ]
+    return max(resets) if resets else None
+
+
+def _anthropic_reset(headers: Mapping[str, str]) -> float | None:
+    """Anthropic: RFC 3339 timestamps when the exhausted request and token quotas are refilled."""
+    resets = []
+    for name in ('anthropic-ratelimit-requests-reset', 'anthropic-ratelimit-tokens-reset'):
+        if name not in headers or headers.get(name.replace('reset', 'remaining')) != '0':
+            continue
+        try:
+            resets.append(_seconds_until(datetime.fromisoformat(headers[name])))
+        except ValueError:
+            logger.debug('Unparseable %s header: %s', name, headers[name])
+    return max(resets) if resets else None
+
+
+def _parse_retry_after(headers: Mapping[str, str]) -> float | None:
+    """Seconds to wait according to the response headers, None if they do not say."""
+    for parse in (_retry_after_ms, _retry_after, _ratelimit_reset, _openai_reset, _anthropic_reset):
+        seconds = parse(headers)
+        if seconds is not None:
+            return seconds
+    return None
+
+
+def _from_status(status: int, message: str, headers: Mapping[str, str]) -> RetryableError | None:
+    retry_after = _parse_retry_after(headers)
+    if retry_after is not None:
+        retry_after = max(retry_after, 0.0)
+
+    if status == TOO_MANY_REQUESTS:
+        return RateLimitError(message, retry_after)
+    if status == REQUEST_TIMEOUT:
+        return RequestTimeoutError(message, retry_after)
+    if status in OVERLOADED_STATUSES:
+        return OverloadedError(message, retry_after)
+    if status in SERVER_ERROR_STATUSES:
+        return ServerError(message, retry_after)
+    return None
+
+
+def classify_error(error: Exception) -> RetryableError | None:
+    """
+    Map an exception raised by a provider SDK or HTTP client to a retryable error.
+
+    Args:
+        error: Exception raised by the request.
+
+    Returns:
+        The retryable error, or None if the request should not be retried.
+    """
+    if isinstance(error, RetryableError):
+        return error
+
+    if isinstance(error, openai.APITimeoutError | anthropic.APITimeoutError | httpx.TimeoutException | TimeoutError):
+        return RequestTimeoutError(str(error))
+    if isinstance(error, openai.APIConnectionError | anthropic.APIConnectionError | httpx.TransportError):
+        return NetworkError(str(error))
+    if isinstance(error, openai.APIStatusError | anthropic.APIStatusError | httpx.HTTPStatusError):
+        return _from_status(error.response.status_code, str(error), error.response.headers)
+    return None
+
+
+def _next_wait(error: RetryableError, previous: float) -> float:
+    if error.retry_after is not None:
+        return error.retry_after
+    return min(WAIT_MAX, random.uniform(WAIT_BASE, previous * 3))  # noqa: S311
+
+
+async def with_retry[T](
+    func: Callable[[], Awaitable[T]],
+    controller: AdaptiveConcurrencyController | None = None,
+    budget: RetryBudget | None = None,
+    max_attempts: int = MAX_ATTEMPTS,
+) -> T:
     """
     Execute an async function with retry logic.
 
+    Errors are classified by type and status code (see ``classify_error``). Retries wait as long
+    as the server asked in ``Retry-After`` and similar headers, otherwise for a decorrelated jittered
+    backoff, so that concurrent requests failing together do not retry together.
+
     Args:
         func: Async function to execute.
+        controller: Optional concurrency controller notified about successes and
+            rate limit / timeout / overload errors.
+        budget: Retry budget shared between requests. Defaults to ``DEFAULT_RETRY_BUDGET``.
+        max_attempts: Maximum number of attempts, including the first one.
 
     Returns:
         Result of the function.
 
     Raises:
-        Exception: The last exception if all retries fail.
+        RetryableError: A retryable error persisted after all attempts or the budget was used up.
+        Exception: A non-retryable error.
     """
+    budget = budget or DEFAULT_RETRY_BUDGET
+    budget.record_request()
+    wait = WAIT_BASE
 
-    @retry(
-        retry=retry_if_exception_type(RetryableError),
-        stop=stop_after_attempt(MAX_ATTEMPTS),
-        wait=wait_exponential(multiplier=WAIT_MULTIPLIER, min=WAIT_MIN, max=WAIT_MAX),
-        before_sleep=_before_sleep,
-    )
-    async def wrapped() -> T:
+    for attempt in range(1, max_attempts + 1):
         try:
-            return await func()
+            result = await func()
         except Exception as e:
-            error_name = type(e).__name__.lower()
-            error_str = str(e).lower()
+            error = classify_error(e)
+            if error is None:
+                raise
 
-            if 'rate' in error_name or 'rate' in error_str or '429' in error_str:
-                raise RateLimitError(str(e)) from e
-            if 'timeout' in error_name or 'timeout' in error_str:
-                raise RequestTimeoutError(str(e)) from e
+            if controller is not None and isinstance(error, RateLimitError | RequestTimeoutError | OverloadedError):
+                controller.on_overload()
 
-            raise
+            if attempt == max_attempts:
+                logger.error('All %s retry attempts failed. Last error: %s', max_attempts, error)
+                raise error from e
+            if error.retry_after is not None and error.retry_after > MAX_RETRY_AFTER:
+                logger.error('Server asked to retry in %.0fs, giving up: %s', error.retry_after, error)
+                raise error from e
+            if not budget.try_retry():
+                logger.error('Retry budget exhausted, not retrying: %s', error)
+                raise error from e
 
-    try:
-        return await wrapped()
-    except RetryError as e:
-        original_exc = e.last_attempt.exception()
-        logger.error('All %s retry attempts failed. Last error: %s', MAX_ATTEMPTS, original_exc)
-        raise original_exc from e
+            wait = _next_wait(error, wait)
+            logger.warning(
+                'Retry attempt %s/%s, %s: %s. Waiting %.1fs before next attempt.',
+                attempt,
+                max_attempts,
+                type(error).__name__,
+                error,
+                wait,
+            )
+            await asyncio.sleep(wait)
+            continue
+
+        if controller is not None:
+            controller.on_success()
+        return result
+
+    raise AssertionError('unreachable')
@@ -0,0 +1,92 @@
+import math
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+CHARS_PER_TOKEN = 4.0
+
+
+class TokenEstimator:
+    def __init__(
+        self,
+        chars_per_token: float = CHARS_PER_TOKEN,
+        tokenizer: Callable[[str], int] | None = None,
+        output_ratio: float | None = None,
+        min_output_tokens: int = 256,
+        prompt_cache_size: int = 128,
+    ) -> None:
+        """
+        Initialize token estimator.
+
+        Counts are estimated locally, before a request is sent. Prompts are the same for every
+        record of a run, so their counts are cached.
+
+        Args:
+            chars_per_token: Characters per token of the length heuristic used without a tokenizer.
+            tokenizer: Function returning the exact number of tokens in a text, see ``from_tiktoken``.
+            output_ratio: Expected output tokens per input content token. When set, ``max_tokens`` of
+                every request is limited to this share of its content. None keeps the configured limit.
+            min_output_tokens: Lower bound of the per-record output limit.
+            prompt_cache_size: Number of prompt counts kept.
+        """
+        if chars_per_token <= 0:
+            raise ValueError('chars_per_token must be positive')
+        if output_ratio is not None and output_ratio <= 0:
+            raise ValueError('output_ratio must be positive')
+
+        self.chars_per_token = chars_per_token
+        self.tokenizer = tokenizer
+        self.output_ratio = output_ratio
+        self.min_output_tokens = min_output_tokens
+        self.prompt_cache_size = prompt_cache_size
+        self._prompt_counts: OrderedDict[str, int] = OrderedDict()
+
+    @classmethod
+    def from_tiktoken(cls, model: str, **kwargs: Any) -> TokenEstimator:
+        """
+        Create an estimator counting tokens with tiktoken.
+
+        Models unknown to tiktoken are counted with its ``o200k_base`` encoding, which is
+        close enough for context and budget checks of other providers.
+
+        Args:
+            model: Model name.
+            **kwargs: Other ``TokenEstimator`` arguments.
+
+        Raises:
+            ImportError: tiktoken is not installed.
+        """
+        try:
+            import tiktoken  # noqa: PLC0415
+        except ImportError as e:
+            raise ImportError('Exact token counts require tiktoken: pip install rowfluxai[tokenizer]') from e
+
+        try:
+            encoding = tiktoken.encoding_for_model(model)
+        except KeyError:
+            encoding = tiktoken.get_encoding('o200k_base')
+
+        return cls(tokenizer=lambda text: len(encoding.encode(text, disallowed_special=())), **kwargs)
+
+    def count(self, text: str) -> int:
+        """Number of tokens in a text."""
+        if self.tokenizer is not None:
+            return self.tokenizer(text)
+        return math.ceil(len(text) / self.chars_per_token)
+
+    def count_prompt(self, prompt: str) -> int:
+        """Number of tokens in a prompt, cached."""
+        if prompt in self._prompt_counts:
+            self._prompt_counts.move_to_end(prompt)
+            return self._prompt_counts[prompt]
+
+        tokens = self.count(prompt)
+        self._prompt_counts[prompt] = tokens
+        if len(self._prompt_counts) > self.prompt_cache_size:
+            self._prompt_counts.popitem(last=False)
+        return tokens
+
+    def estimate_output(self, content_tokens: int) -> int:
+        """Expected output tokens of a transformation of content of the given size."""
+        # Transformations usually return text of about the same size as the input
+        return max(math.ceil(content_tokens * (self.output_ratio or 1.0)), 1)
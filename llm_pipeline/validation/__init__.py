@@ -1,6 +1,6 @@
 """Validation utilities for the pipeline."""
 
-from .response_validator import validate_html_tags, validate_response
+from .response_validator import validate_partial_response, validate_response
 from .sql_validator import validate_sql_queries
 
-__all__ = ['validate_html_tags', 'validate_response', 'validate_sql_queries']
+__all__ = ['validate_partial_response', 'validate_response', 'validate_sql_queries']
@@ -20,3 +20,22 @@ def validate_response(response: str) -> tuple[bool, str | None]:
         return False, f'Response too long (max {MAX_RESPONSE_LENGTH} chars)'
 
     return True, None
+
+
+def validate_partial_response(response: str) -> tuple[bool, str | None]:
+    """
+    Validate LLM response while it is being streamed.
+
+    Only checks limits that a longer response cannot satisfy again.
+
+    Args:
+        response: The output received so far.
+
+    Returns:
+        Tuple of (is_valid, error_message).
+        If valid, error_message is None.
+    """
+    if len(response) > MAX_RESPONSE_LENGTH:
+        return False, f'Response too long (max {MAX_RESPONSE_LENGTH} chars)'
+
+    return True, None
@@ -63,7 +63,8 @@ async def validate_sql_queries(
         update_query=update_query,
     )
 
-    result, _, _ = await provider.execute(prompt='', content=full_prompt)
+    response = await provider.execute(prompt='', content=full_prompt)
+    result = response.content
 
     first_line = result.strip().split('\n')[0].strip().upper()
     is_valid = first_line == 'VALID'
@@ -0,0 +1,118 @@
+import asyncio
+from collections.abc import AsyncGenerator, Callable
+from types import SimpleNamespace
+from typing import Any
+
+import httpx
+import pytest
+
+from llm_pipeline.models import LLMResponse, Record
+from llm_pipeline.providers import LLMProvider
+from llm_pipeline.sinks.base import DataSink
+from llm_pipeline.sources.base import DataSource
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+class FakeProvider(LLMProvider):
+    """
+    Answers ``<p>{model}: {content}</p>`` after ``delay`` seconds (a float, or a function of the
+    content), or fails with a connection error while ``down``. Requests are projected to cost
+    ``projected_cost`` and cost ``cost``.
+    """
+
+    def __init__(
+        self,
+        model: str = 'fake',
+        delay: float | Callable[[str], float] = 0.0,
+        down: bool = False,
+        cost: float = 0.01,
+        projected_cost: float = 0.01,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__('Fake', model, **kwargs)
+        self.delay = delay
+        self.down = down
+        self.cost = cost
+        self.projected_cost = projected_cost
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _calculate_cost(self, input_tokens: int, output_tokens: int) -> float:
+        return self.projected_cost
+
+    async def _execute(self, prompt: str, content: str) -> LLMResponse:
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay(content) if callable(self.delay) else self.delay)
+        finally:
+            self.in_flight -= 1
+        if self.down:
+            raise httpx.ConnectError(f'{self.model} is down')
+        return LLMResponse(content=f'<p>{self.model}: {content}</p>', input_tokens=10, output_tokens=10, cost=self.cost)
+
+
+class ListSource(DataSource):
+    def __init__(self, count: int) -> None:
+        self.records = [Record(id=index, content=f'record number {index}') for index in range(count)]
+
+    async def fetch_records(self) -> AsyncGenerator[Record]:
+        for record in self.records:
+            yield record
+
+    async def count_records(self) -> int:
+        return len(self.records)
+
+    async def close(self) -> None:
+        pass
+
+
+class DictSink(DataSink):
+    """Keeps committed records in ``committed``; ``fail_commits`` makes the next commits raise."""
+
+    def __init__(self) -> None:
+        self.pending: dict[Any, str] = {}
+        self.committed: dict[Any, str] = {}
+        self.commits = 0
+        self.fail_commits = 0
+
+    async def write_record(self, record_id: Any, content: str) -> None:
+        self.pending[record_id] = content
+
+    async def commit_batch(self) -> None:
+        if self.fail_commits:
+            self.fail_commits -= 1
+            raise ConnectionError('commit failed')
+        self.committed.update(self.pending)
+        self.pending.clear()
+        self.commits += 1
+
+    async def close(self) -> None:
+        pass
+
+
+async def records_of(records: list[Record]) -> AsyncGenerator[Record]:
+    for record in records:
+        yield record
+
+
+@pytest.fixture
+async def mock_transport() -> AsyncGenerator[Callable[[Handler], SimpleNamespace]]:
+    """
+    Build stand-ins for the shared ``HTTPTransport`` whose client answers requests with a local
+    handler instead of the network. Providers only use the transport's ``client``.
+    """
+    clients: list[httpx.AsyncClient] = []
+
+    def make(handler: Handler) -> SimpleNamespace:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        clients.append(client)
+        return SimpleNamespace(client=client)
+
+    yield make
+
+    for client in clients:
+        await client.aclose()
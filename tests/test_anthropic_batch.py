@@ -0,0 +1,180 @@
+import asyncio
+import json
+from collections.abc import AsyncGenerator, Callable
+from types import SimpleNamespace
+from typing import Any
+
+import httpx
+import pytest
+
+from llm_pipeline.config import AnthropicSettings
+from llm_pipeline.models import Record
+from llm_pipeline.providers import AnthropicProvider
+from llm_pipeline.strategies import BatchStrategy
+
+BASE_URL = 'http://anthropic.test'
+MODEL = 'claude-haiku-4-5-20251001'
+
+
+def _message(text: str) -> dict[str, Any]:
+    return {
+        'id': 'msg_1',
+        'type': 'message',
+        'role': 'assistant',
+        'model': MODEL,
+        'content': [{'type': 'text', 'text': text}],
+        'stop_reason': 'end_turn',
+        'stop_sequence': None,
+        'usage': {
+            'input_tokens': 100,
+            'output_tokens': 50,
+            'cache_creation_input_tokens': 0,
+            'cache_read_input_tokens': 0,
+        },
+    }
+
+
+class FakeBatchAPI:
+    """Message Batches endpoints of a local fake Anthropic API. A batch ends after ``polls_until_done`` polls."""
+
+    def __init__(self, polls_until_done: int = 2) -> None:
+        self.polls_until_done = polls_until_done
+        self.submitted: list[dict[str, Any]] = []
+        self.polls = 0
+        self.cancelled: list[str] = []
+
+    def _batch(self, status: str) -> dict[str, Any]:
+        return {
+            'id': 'msgbatch_1',
+            'type': 'message_batch',
+            'processing_status': status,
+            'request_counts': {'processing': 0, 'succeeded': 0, 'errored': 0, 'canceled': 0, 'expired': 0},
+            'created_at': '2026-01-01T00:00:00Z',
+            'expires_at': '2026-01-02T00:00:00Z',
+            'ended_at': None,
+            'archived_at': None,
+            'cancel_initiated_at': None,
+            'results_url': f'{BASE_URL}/v1/messages/batches/msgbatch_1/results' if status == 'ended' else None,
+        }
+
+    def _results(self) -> str:
+        lines = []
+        for request in self.submitted:
+            custom_id = request['custom_id']
+            content = request['params']['messages'][0]['content']
+            if 'error' in content:
+                result = {
+                    'type': 'errored',
+                    'error': {'type': 'error', 'error': {'type': 'invalid_request_error', 'message': 'bad request'}},
+                }
+            elif 'expire' in content:
+                result = {'type': 'expired'}
+            elif 'lost' in content:
+                continue
+            else:
+                result = {'type': 'succeeded', 'message': _message(f'<p>{content.upper()}</p>')}
+            lines.append(json.dumps({'custom_id': custom_id, 'result': result}))
+        return '\n'.join(lines)
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.method == 'POST' and path == '/v1/messages/batches':
+            self.submitted = json.loads(request.content)['requests']
+            return httpx.Response(200, json=self._batch('in_progress'))
+        if request.method == 'POST' and path.endswith('/cancel'):
+            self.cancelled.append(path.split('/')[-2])
+            return httpx.Response(200, json=self._batch('canceling'))
+        if path.endswith('/results'):
+            return httpx.Response(200, text=self._results(), headers={'content-type': 'application/binary'})
+        if path == '/v1/messages/batches/msgbatch_1':
+            self.polls += 1
+            return httpx.Response(
+                200, json=self._batch('ended' if self.polls >= self.polls_until_done else 'in_progress')
+            )
+        return httpx.Response(404, json={'type': 'error', 'error': {'type': 'not_found_error', 'message': path}})
+
+
+@pytest.fixture
+def api() -> FakeBatchAPI:
+    return FakeBatchAPI()
+
+
+@pytest.fixture
+def provider(api: FakeBatchAPI, mock_transport: Callable[..., SimpleNamespace]) -> AnthropicProvider:
+    settings = AnthropicSettings(api_key='test', base_url=BASE_URL)
+    return AnthropicProvider(settings, model=MODEL, transport=mock_transport(api))
+
+
+async def _run(provider: AnthropicProvider, contents: list[str], **kwargs: Any) -> dict[Any, Any]:
+    strategy = BatchStrategy(poll_interval=0, **kwargs)
+    records = [Record(id=index, content=content) for index, content in enumerate(contents)]
+
+    async def source() -> AsyncGenerator[Record]:
+        for record in records:
+            yield record
+
+    return {result.record_id: result async for result in strategy.process(source(), provider, 'Uppercase it')}
+
+
+async def test_submit_sends_message_params(provider: AnthropicProvider, api: FakeBatchAPI) -> None:
+    batch_id = await provider.submit_batch('Uppercase it', {'record-0': 'first', 'record-1': 'second'})
+
+    assert batch_id == 'msgbatch_1'
+    assert [request['custom_id'] for request in api.submitted] == ['record-0', 'record-1']
+    params = api.submitted[0]['params']
+    assert params['model'] == MODEL
+    assert params['system'][0]['text'] == 'Uppercase it'
+    assert params['messages'] == [{'role': 'user', 'content': 'first'}]
+
+
+async def test_polls_until_batch_ends(provider: AnthropicProvider, api: FakeBatchAPI) -> None:
+    await provider.submit_batch('Uppercase it', {'record-0': 'first'})
+
+    assert not await provider.is_batch_done('msgbatch_1')
+    assert await provider.is_batch_done('msgbatch_1')
+
+
+async def test_strategy_parses_results(provider: AnthropicProvider, api: FakeBatchAPI) -> None:
+    results = await _run(provider, ['some text here', 'error please', 'expire please', 'lost record'])
+
+    assert api.polls >= api.polls_until_done
+    assert results[0].success
+    assert results[0].transformed_content == '<p>SOME TEXT HERE</p>'
+    assert results[0].tokens_used == 150
+    # Batches are billed at half price
+    assert results[0].cost == pytest.approx((100 * 0.001 + 50 * 0.005) / 1000 * 0.5)
+    assert results[1].error == 'bad request'
+    assert results[2].error == 'Batch request expired'
+    assert results[3].error == 'Missing from batch msgbatch_1 results'
+
+
+async def test_interrupted_run_cancels_pending_batch(provider: AnthropicProvider, api: FakeBatchAPI) -> None:
+    api.polls_until_done = 100
+    strategy = BatchStrategy(poll_interval=0)
+
+    async def source() -> AsyncGenerator[Record]:
+        yield Record(id=0, content='some text here')
+
+    stream = strategy.process(source(), provider, 'Uppercase it')
+    with pytest.raises(TimeoutError):
+        async with asyncio.timeout(0.05):
+            await anext(stream)
+    await stream.aclose()
+
+    assert api.cancelled == ['msgbatch_1']
+
+
+async def test_shutdown_stops_polling_and_cancels_batch(provider: AnthropicProvider, api: FakeBatchAPI) -> None:
+    api.polls_until_done = 100
+    strategy = BatchStrategy(poll_interval=60)
+    strategy.shutdown_event = asyncio.Event()
+    asyncio.get_running_loop().call_later(0.05, strategy.shutdown_event.set)
+
+    async def source() -> AsyncGenerator[Record]:
+        yield Record(id=0, content='some text here')
+
+    async with asyncio.timeout(1):
+        results = [result async for result in strategy.process(source(), provider, 'Uppercase it')]
+
+    assert not results
+    assert api.cancelled == ['msgbatch_1']
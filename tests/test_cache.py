@@ -0,0 +1,62 @@
+import sqlite3
+from pathlib import Path
+
+from conftest import FakeProvider
+
+from llm_pipeline.cache.sqlite import SQLiteResponseCache
+from llm_pipeline.models import LLMResponse
+from llm_pipeline.providers.cached import CachedProvider
+
+
+def _keys(path: Path) -> list[str]:
+    with sqlite3.connect(path) as conn:
+        return sorted(key for (key,) in conn.execute('SELECT key FROM responses'))
+
+
+async def test_hits_skip_the_provider(tmp_path: Path) -> None:
+    provider = FakeProvider()
+    cached = CachedProvider(provider, SQLiteResponseCache(tmp_path / 'cache.sqlite'))
+
+    first = await cached.execute('prompt', 'text')
+    second = await cached.execute('prompt', 'text')
+    await cached.close()
+
+    assert provider.requests == 1
+    assert not first.cached
+    assert second.cached
+    assert second.content == first.content
+    assert second.cost == 0
+
+
+async def test_close_closes_cache_and_applies_limits(tmp_path: Path) -> None:
+    path = tmp_path / 'cache.sqlite'
+    cache = SQLiteResponseCache(path, max_entries=2)
+    cached = CachedProvider(FakeProvider(), cache)
+    for index in range(5):
+        await cached.execute('prompt', f'text {index}')
+
+    await cached.close()
+
+    assert cache._conn is None
+    assert len(_keys(path)) == 2
+
+
+async def test_recent_hits_survive_eviction(tmp_path: Path) -> None:
+    path = tmp_path / 'cache.sqlite'
+    cache = SQLiteResponseCache(path, max_entries=1)
+    await cache.set('old', LLMResponse(content='old'))
+    await cache.set('new', LLMResponse(content='new'))
+
+    # The hit is only remembered in memory until eviction writes it
+    assert await cache.get('old') is not None
+    await cache.close()
+
+    assert _keys(path) == ['old']
+
+
+async def test_expired_entries_are_misses(tmp_path: Path) -> None:
+    cache = SQLiteResponseCache(tmp_path / 'cache.sqlite', max_age_seconds=-1)
+    await cache.set('key', LLMResponse(content='text'))
+
+    assert await cache.get('key') is None
+    await cache.close()
@@ -0,0 +1,18 @@
+from pathlib import Path
+
+from llm_pipeline.checkpoint.file import FileCheckpointStore
+
+
+async def test_clearing_one_shard_keeps_the_others(tmp_path: Path) -> None:
+    stores = [FileCheckpointStore(tmp_path / 'checkpoint.jsonl') for _ in range(2)]
+    for shard, store in enumerate(stores):
+        store.use_shard(shard)
+        await store.mark_completed([shard])
+
+    await stores[0].clear()
+
+    assert (await stores[0].load()).completed_ids == set()
+    assert (await stores[1].load()).completed_ids == {1}
+    assert stores[1].path == tmp_path / 'checkpoint.shard1.jsonl'
+    for store in stores:
+        await store.close()
@@ -0,0 +1,173 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from conftest import FakeProvider
+
+from llm_pipeline.models import Record
+from llm_pipeline.providers.router import HedgedRouter
+from llm_pipeline.strategies import SequentialStrategy
+from llm_pipeline.utils import circuit_breaker
+from llm_pipeline.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+def test_opens_after_consecutive_failures() -> None:
+    breaker = CircuitBreaker(failure_threshold=3, error_rate_threshold=None)
+
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == 'closed'
+
+    breaker.record_failure()
+    assert breaker.state == 'open'
+    assert not breaker.allow_request()
+    assert breaker.times_opened == 1
+
+
+def test_opens_at_error_rate() -> None:
+    breaker = CircuitBreaker(failure_threshold=100, error_rate_threshold=0.5, min_requests=10)
+
+    for _ in range(5):
+        breaker.record_success()
+        breaker.record_failure()
+
+    assert breaker.error_rate == 0.5
+    assert breaker.state == 'open'
+
+
+def test_error_rate_needs_min_requests() -> None:
+    breaker = CircuitBreaker(failure_threshold=100, error_rate_threshold=0.5, min_requests=10)
+
+    for _ in range(4):
+        breaker.record_failure()
+        breaker.record_success()
+
+    assert breaker.state == 'closed'
+
+
+def test_outcomes_outside_window_are_dropped(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = SimpleNamespace(now=0.0)
+    monkeypatch.setattr(circuit_breaker, 'time', SimpleNamespace(monotonic=lambda: clock.now))
+    breaker = CircuitBreaker(window=10.0)
+
+    for _ in range(1000):
+        breaker.record_success()
+        clock.now += 1.0
+
+    assert len(breaker._outcomes) <= 11
+
+
+def test_half_open_allows_probes_until_they_succeed() -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0, half_open_probes=2)
+    breaker.record_failure()
+    assert breaker.state == 'half_open'
+
+    assert breaker.allow_request()
+    assert breaker.allow_request()
+    # Both probes are in flight
+    assert not breaker.available
+    assert not breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state == 'half_open'
+    # A successful probe keeps its slot until all probes succeeded
+    assert not breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state == 'closed'
+    assert breaker.available
+
+
+def test_released_probe_frees_its_slot() -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    breaker.release_probe()
+    assert breaker.allow_request()
+
+
+def test_failed_probe_reopens() -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    breaker._opened_at -= 0.05  # type: ignore[operator]
+    assert breaker.allow_request()
+
+    breaker.record_failure()
+
+    assert breaker.state == 'open'
+    assert breaker.times_opened == 1
+
+
+async def test_wait_until_available_returns_after_reset_timeout() -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+
+    async with asyncio.timeout(1):
+        await breaker.wait_until_available()
+
+    assert breaker.state == 'half_open'
+
+
+async def test_held_record_fails_after_max_hold() -> None:
+    provider = FakeProvider('down', circuit_breaker=CircuitBreaker(failure_threshold=1, reset_timeout=60), down=True)
+    strategy = SequentialStrategy()
+    strategy.max_hold = 0.05
+
+    async with asyncio.timeout(1):
+        result = await strategy._process_single(Record(id=1, content='text'), provider, 'prompt')
+
+    assert not result.success
+    assert result.error is not None
+    assert 'is open' in result.error
+
+
+async def test_held_record_fails_on_shutdown() -> None:
+    provider = FakeProvider('down', circuit_breaker=CircuitBreaker(failure_threshold=1, reset_timeout=60), down=True)
+    strategy = SequentialStrategy()
+    strategy.max_hold = None
+    strategy.shutdown_event = asyncio.Event()
+    asyncio.get_running_loop().call_later(0.05, strategy.shutdown_event.set)
+
+    async with asyncio.timeout(1):
+        result = await strategy._process_single(Record(id=1, content='text'), provider, 'prompt')
+
+    assert not result.success
+
+
+async def test_held_record_is_sent_once_circuit_recovers() -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    provider = FakeProvider('flaky', circuit_breaker=breaker, down=True)
+    strategy = SequentialStrategy()
+    asyncio.get_running_loop().call_later(0.02, setattr, provider, 'down', False)
+
+    async with asyncio.timeout(1):
+        result = await strategy._process_single(Record(id=1, content='text'), provider, 'prompt')
+
+    assert result.success
+    assert breaker.state == 'closed'
+
+
+async def test_router_skips_provider_with_open_circuit() -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    primary = FakeProvider('primary', circuit_breaker=breaker, down=True)
+    fallback = FakeProvider('fallback')
+    router = HedgedRouter([primary, fallback])
+
+    first = await router.execute('prompt', 'content')
+    second = await router.execute('prompt', 'content')
+
+    assert first.content == second.content == '<p>fallback: content</p>'
+    # The primary's own breaker opened on the first failure, the second request skipped it
+    assert primary.requests == 1
+    assert router.failovers == 1
+
+
+async def test_router_raises_circuit_open_when_all_circuits_are_open() -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    breaker.record_failure()
+    router = HedgedRouter([FakeProvider('primary', circuit_breaker=breaker)])
+
+    with pytest.raises(CircuitOpenError):
+        await router.execute('prompt', 'content')
@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+
+from llm_pipeline.utils.concurrency import AdaptiveConcurrencyController
+from llm_pipeline.utils.retry import RateLimitError, RequestTimeoutError, RetryBudget, with_retry
+
+
+async def test_waiters_get_slots_in_order() -> None:
+    controller = AdaptiveConcurrencyController(initial_limit=1)
+    await controller.acquire()
+    order: list[int] = []
+
+    async def wait(index: int) -> None:
+        async with controller:
+            order.append(index)
+
+    waiters = [asyncio.create_task(wait(index)) for index in range(3)]
+    await asyncio.sleep(0)
+    assert not order
+
+    controller.release()
+    await asyncio.gather(*waiters)
+
+    assert order == [0, 1, 2]
+    assert controller.in_flight == 0
+
+
+def test_success_increases_limit_additively() -> None:
+    controller = AdaptiveConcurrencyController(initial_limit=4, max_limit=5)
+
+    # Roughly one step per window of `limit` successes
+    for _ in range(4):
+        controller.on_success()
+    assert controller.limit == 4
+    controller.on_success()
+    assert controller.limit == 5
+
+    for _ in range(20):
+        controller.on_success()
+    assert controller.limit == 5
+
+
+def test_overload_decreases_limit_once_per_cooldown() -> None:
+    controller = AdaptiveConcurrencyController(initial_limit=16, min_limit=2, cooldown=60)
+
+    controller.on_overload()
+    controller.on_overload()
+
+    assert controller.limit == 8
+    assert [limit for _, limit in controller.history] == [16, 8]
+
+
+def test_overload_respects_min_limit() -> None:
+    controller = AdaptiveConcurrencyController(initial_limit=4, min_limit=3, cooldown=0)
+
+    for _ in range(3):
+        controller.on_overload()
+
+    assert controller.limit == 3
+
+
+@pytest.mark.parametrize('error', [RateLimitError('429', retry_after=0), RequestTimeoutError('408', retry_after=0)])
+async def test_retry_reports_overload_and_success(error: Exception) -> None:
+    controller = AdaptiveConcurrencyController(initial_limit=8, cooldown=60)
+    attempts = 0
+
+    async def request() -> str:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise error
+        return 'ok'
+
+    assert await with_retry(request, controller=controller, budget=RetryBudget()) == 'ok'
+    # Halved by the error, then a small additive step for the success
+    assert controller.limit == 4
+
+
+async def test_cancelled_waiter_leaves_the_queue() -> None:
+    controller = AdaptiveConcurrencyController(initial_limit=1)
+    await controller.acquire()
+    waiter = asyncio.create_task(controller.acquire())
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    controller.release()
+
+    assert controller.in_flight == 0
+    assert not controller._waiters
+
+
+async def test_slot_handed_to_cancelled_waiter_is_returned() -> None:
+    controller = AdaptiveConcurrencyController(initial_limit=1)
+    await controller.acquire()
+    waiter = asyncio.create_task(controller.acquire())
+    await asyncio.sleep(0)
+
+    # The slot is handed over, then the waiter is cancelled before it resumes
+    controller.release()
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert controller.in_flight == 0
+    await asyncio.wait_for(controller.acquire(), 0.1)
@@ -0,0 +1,95 @@
+import asyncio
+from collections.abc import AsyncGenerator
+
+import pytest
+from conftest import FakeProvider
+
+from llm_pipeline.models import Record
+from llm_pipeline.strategies import ConcurrentStrategy
+from llm_pipeline.utils.concurrency import AdaptiveConcurrencyController
+
+
+def _delay(content: str) -> float:
+    # Later records finish first
+    return 0.05 - int(content.rsplit(maxsplit=1)[-1]) * 0.005
+
+
+class CountingSource:
+    def __init__(self, count: int) -> None:
+        self.count = count
+        self.fetched = 0
+
+    async def records(self) -> AsyncGenerator[Record]:
+        for index in range(self.count):
+            self.fetched += 1
+            yield Record(id=index, content=f'record {index}')
+
+
+async def _ids(strategy: ConcurrentStrategy, provider: FakeProvider, count: int = 10) -> list[int]:
+    source = CountingSource(count)
+    return [result.record_id async for result in strategy.process(source.records(), provider, 'prompt')]
+
+
+async def test_ordered_results_follow_source_order() -> None:
+    ids = await _ids(ConcurrentStrategy(concurrency=10, ordered=True), FakeProvider(delay=_delay))
+
+    assert ids == list(range(10))
+
+
+async def test_unordered_results_follow_completion_order() -> None:
+    ids = await _ids(ConcurrentStrategy(concurrency=10), FakeProvider(delay=_delay))
+
+    assert sorted(ids) == list(range(10))
+    assert ids[0] == 9
+
+
+@pytest.mark.parametrize('ordered', [False, True])
+async def test_requests_in_flight_are_bounded(ordered: bool) -> None:
+    provider = FakeProvider(delay=0.01)
+
+    await _ids(ConcurrentStrategy(concurrency=3, ordered=ordered), provider, count=20)
+
+    assert provider.requests == 20
+    assert provider.max_in_flight == 3
+
+
+@pytest.mark.parametrize('ordered', [False, True])
+async def test_read_ahead_window_is_bounded(ordered: bool) -> None:
+    strategy = ConcurrentStrategy(concurrency=2, read_ahead=4, ordered=ordered)
+    source = CountingSource(30)
+    window = 0
+    consumed = 0
+
+    async for _ in strategy.process(source.records(), FakeProvider(delay=0.005), 'prompt'):
+        consumed += 1
+        window = max(window, source.fetched - consumed)
+        # A slow consumer must not let the strategy read the whole source
+        await asyncio.sleep(0.01)
+
+    assert consumed == 30
+    assert window <= strategy.read_ahead
+
+
+async def test_closing_the_stream_cancels_requests_in_flight() -> None:
+    provider = FakeProvider(delay=_delay)
+    stream = ConcurrentStrategy(concurrency=5).process(CountingSource(10).records(), provider, 'prompt')
+
+    await anext(stream)
+    await stream.aclose()
+
+    assert provider.in_flight == 0
+
+
+async def test_adaptive_controller_limits_requests_in_flight() -> None:
+    controller = AdaptiveConcurrencyController(initial_limit=2, max_limit=2)
+    provider = FakeProvider(delay=0.01)
+
+    await _ids(ConcurrentStrategy(concurrency=controller), provider, count=10)
+
+    assert provider.max_in_flight == 2
+    assert controller.in_flight == 0
+
+
+def test_read_ahead_must_cover_concurrency() -> None:
+    with pytest.raises(ValueError, match='read_ahead'):
+        ConcurrentStrategy(concurrency=4, read_ahead=2)
@@ -0,0 +1,77 @@
+import asyncio
+
+import httpx
+import pytest
+from conftest import FakeProvider
+
+from llm_pipeline.providers.dedup import DeduplicatingProvider
+
+
+async def test_identical_payloads_in_flight_are_sent_once() -> None:
+    provider = FakeProvider(delay=0.05)
+    dedup = DeduplicatingProvider(provider)
+
+    responses = await asyncio.gather(*(dedup.execute('prompt', 'same text') for _ in range(5)))
+
+    assert provider.requests == 1
+    assert {response.content for response in responses} == {'<p>fake: same text</p>'}
+    assert [response.deduplicated for response in responses].count(False) == 1
+    assert dedup.calls_saved == 4
+
+
+async def test_completed_response_is_reused_without_cost() -> None:
+    provider = FakeProvider()
+    dedup = DeduplicatingProvider(provider)
+
+    first = await dedup.execute('prompt', 'text')
+    second = await dedup.execute('prompt', 'text')
+    other = await dedup.execute('other prompt', 'text')
+
+    assert provider.requests == 2
+    assert first.cost == 0.01
+    assert second.deduplicated
+    assert second.cost == 0
+    assert not other.deduplicated
+
+
+async def test_failure_reaches_every_waiter_and_is_not_cached() -> None:
+    provider = FakeProvider(delay=0.05, down=True)
+    dedup = DeduplicatingProvider(provider)
+
+    results = await asyncio.gather(*(dedup.execute('prompt', 'text') for _ in range(3)), return_exceptions=True)
+
+    assert provider.requests == 1
+    assert all(isinstance(result, httpx.ConnectError) for result in results)
+
+    provider.down = False
+    response = await dedup.execute('prompt', 'text')
+    assert not response.deduplicated
+    assert provider.requests == 2
+
+
+async def test_invalid_response_is_not_reused() -> None:
+    provider = FakeProvider()
+    dedup = DeduplicatingProvider(provider, validator=lambda _: (False, 'invalid'))
+
+    await dedup.execute('prompt', 'text')
+    await dedup.execute('prompt', 'text')
+
+    assert provider.requests == 2
+
+
+async def test_cancelled_request_lets_waiter_send_it() -> None:
+    provider = FakeProvider(delay=0.05)
+    dedup = DeduplicatingProvider(provider)
+
+    first = asyncio.create_task(dedup.execute('prompt', 'text'))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(dedup.execute('prompt', 'text'))
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    response = await second
+
+    assert not response.deduplicated
+    assert provider.requests == 2
+    with pytest.raises(asyncio.CancelledError):
+        await first
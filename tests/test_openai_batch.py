@@ -0,0 +1,176 @@
+import json
+from collections.abc import AsyncGenerator, Callable
+from types import SimpleNamespace
+from typing import Any
+
+import httpx
+import pytest
+
+from llm_pipeline.config import OpenAISettings
+from llm_pipeline.models import Record
+from llm_pipeline.providers import OpenAIProvider
+from llm_pipeline.strategies import BatchStrategy
+
+BASE_URL = 'http://openai.test/v1'
+MODEL = 'gpt-4o-mini'
+
+
+def _completion(text: str) -> dict[str, Any]:
+    return {
+        'id': 'chatcmpl-1',
+        'object': 'chat.completion',
+        'created': 0,
+        'model': MODEL,
+        'choices': [
+            {'index': 0, 'finish_reason': 'stop', 'message': {'role': 'assistant', 'content': text}},
+        ],
+        'usage': {'prompt_tokens': 100, 'completion_tokens': 50, 'total_tokens': 150},
+    }
+
+
+class FakeBatchAPI:
+    """Files and Batches endpoints of a local fake OpenAI API. A batch completes after ``polls_until_done`` polls."""
+
+    def __init__(self, polls_until_done: int = 2) -> None:
+        self.polls_until_done = polls_until_done
+        self.requests: list[dict[str, Any]] = []
+        self.polls = 0
+        self.files: set[str] = set()
+        self.deleted: list[str] = []
+
+    def _file(self, file_id: str) -> dict[str, Any]:
+        return {
+            'id': file_id,
+            'object': 'file',
+            'bytes': 0,
+            'created_at': 0,
+            'filename': 'batch.jsonl',
+            'purpose': 'batch',
+            'status': 'processed',
+        }
+
+    def _batch(self, status: str) -> dict[str, Any]:
+        done = status == 'completed'
+        return {
+            'id': 'batch_1',
+            'object': 'batch',
+            'endpoint': '/v1/chat/completions',
+            'completion_window': '24h',
+            'created_at': 0,
+            'input_file_id': 'file-input',
+            'output_file_id': 'file-output' if done else None,
+            'error_file_id': 'file-errors' if done else None,
+            'status': status,
+        }
+
+    def _output(self) -> str:
+        lines = []
+        for request in self.requests:
+            content = request['body']['messages'][1]['content']
+            if 'error' in content:
+                continue
+            response = {'status_code': 200, 'body': _completion(f'<p>{content.upper()}</p>')}
+            lines.append(json.dumps({'custom_id': request['custom_id'], 'response': response, 'error': None}))
+        return '\n'.join(lines)
+
+    def _errors(self) -> str:
+        lines = [
+            json.dumps(
+                {
+                    'custom_id': request['custom_id'],
+                    'response': {'status_code': 400, 'body': {'error': {'message': 'bad request'}}},
+                    'error': None,
+                }
+            )
+            for request in self.requests
+            if 'error' in request['body']['messages'][1]['content']
+        ]
+        return '\n'.join(lines)
+
+    def _upload(self, request: httpx.Request) -> httpx.Response:
+        # Multipart upload: the JSONL lines are the only lines starting with a JSON object
+        body = request.content.decode()
+        self.requests = [json.loads(line) for line in body.splitlines() if line.startswith('{')]
+        self.files.add('file-input')
+        return httpx.Response(200, json=self._file('file-input'))
+
+    def _create(self, request: httpx.Request) -> httpx.Response:
+        assert json.loads(request.content)['input_file_id'] == 'file-input'
+        return httpx.Response(200, json=self._batch('validating'))
+
+    def _poll(self, request: httpx.Request) -> httpx.Response:
+        self.polls += 1
+        if self.polls < self.polls_until_done:
+            return httpx.Response(200, json=self._batch('in_progress'))
+        self.files |= {'file-output', 'file-errors'}
+        return httpx.Response(200, json=self._batch('completed'))
+
+    def _delete(self, file_id: str) -> httpx.Response:
+        self.files.discard(file_id)
+        self.deleted.append(file_id)
+        return httpx.Response(200, json={'id': file_id, 'object': 'file', 'deleted': True})
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path.removeprefix('/v1')
+        if request.method == 'DELETE' and path.startswith('/files/'):
+            return self._delete(path.removeprefix('/files/'))
+
+        routes: dict[tuple[str, str], Callable[[httpx.Request], httpx.Response]] = {
+            ('POST', '/files'): self._upload,
+            ('POST', '/batches'): self._create,
+            ('GET', '/batches/batch_1'): self._poll,
+            ('GET', '/files/file-output/content'): lambda _: httpx.Response(200, text=self._output()),
+            ('GET', '/files/file-errors/content'): lambda _: httpx.Response(200, text=self._errors()),
+        }
+        route = routes.get((request.method, path))
+        if route is None:
+            return httpx.Response(404, json={'error': {'message': f'{request.method} {path}'}})
+        return route(request)
+
+
+@pytest.fixture
+def api() -> FakeBatchAPI:
+    return FakeBatchAPI()
+
+
+@pytest.fixture
+def provider(api: FakeBatchAPI, mock_transport: Callable[..., SimpleNamespace]) -> OpenAIProvider:
+    settings = OpenAISettings(api_key='test', base_url=BASE_URL)
+    return OpenAIProvider(settings, model=MODEL, transport=mock_transport(api))
+
+
+async def test_submit_uploads_requests(provider: OpenAIProvider, api: FakeBatchAPI) -> None:
+    batch_id = await provider.submit_batch('Uppercase it', {'record-0': 'first', 'record-1': 'second'})
+
+    assert batch_id == 'batch_1'
+    assert [request['custom_id'] for request in api.requests] == ['record-0', 'record-1']
+    body = api.requests[0]['body']
+    assert api.requests[0]['url'] == '/v1/chat/completions'
+    assert body['model'] == MODEL
+    assert body['messages'][0] == {'role': 'system', 'content': 'Uppercase it'}
+
+
+async def test_polls_until_batch_completes(provider: OpenAIProvider) -> None:
+    await provider.submit_batch('Uppercase it', {'record-0': 'first'})
+
+    assert not await provider.is_batch_done('batch_1')
+    assert await provider.is_batch_done('batch_1')
+
+
+async def test_strategy_parses_results_and_deletes_files(provider: OpenAIProvider, api: FakeBatchAPI) -> None:
+    records = [Record(id=0, content='some text here'), Record(id=1, content='error please')]
+
+    async def source() -> AsyncGenerator[Record]:
+        for record in records:
+            yield record
+
+    strategy = BatchStrategy(poll_interval=0)
+    results = {result.record_id: result async for result in strategy.process(source(), provider, 'Uppercase it')}
+
+    assert results[0].success
+    assert results[0].transformed_content == '<p>SOME TEXT HERE</p>'
+    assert results[0].tokens_used == 150
+    assert results[1].error == 'bad request'
+    # Input, output and error files do not outlive the run
+    assert sorted(api.deleted) == ['file-errors', 'file-input', 'file-output']
+    assert not api.files
@@ -0,0 +1,24 @@
+import pytest
+
+from llm_pipeline.models import LLMResponse, Record
+from llm_pipeline.strategies import PackedStrategy
+
+
+def test_split_usage_is_proportional_to_content_length() -> None:
+    response = LLMResponse(content='', input_tokens=300, output_tokens=90, cost=0.3)
+    unit = [Record(id=0, content='a' * 100), Record(id=1, content='b' * 200)]
+
+    shares = PackedStrategy._split_usage(response, unit)
+
+    assert [share.input_tokens for share in shares] == [100, 200]
+    assert [share.output_tokens for share in shares] == [30, 60]
+    assert sum(share.cost for share in shares) == pytest.approx(0.3)
+
+
+def test_deduplicated_pack_counts_as_one_saved_request() -> None:
+    response = LLMResponse(content='', input_tokens=300, deduplicated=True)
+    unit = [Record(id=index, content='text') for index in range(5)]
+
+    shares = PackedStrategy._split_usage(response, unit)
+
+    assert [share.deduplicated for share in shares] == [True, False, False, False, False]
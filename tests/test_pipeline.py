@@ -0,0 +1,72 @@
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from conftest import DictSink, FakeProvider, ListSource
+
+from llm_pipeline import Pipeline
+from llm_pipeline.checkpoint.file import FileCheckpointStore
+from llm_pipeline.models import RunOptions
+from llm_pipeline.providers import LLMProvider
+from llm_pipeline.sources.base import DataSource
+from llm_pipeline.strategies import ConcurrentStrategy
+
+
+@pytest.fixture
+def make_pipeline(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Callable[..., Pipeline]:
+    # setup_logging writes pipeline.log into the working directory
+    monkeypatch.chdir(tmp_path)
+    prompt_file = tmp_path / 'prompt.txt'
+    prompt_file.write_text('Uppercase it', encoding='utf-8')
+
+    def make(source: DataSource | None = None, provider: LLMProvider | None = None, **kwargs: Any) -> Pipeline:
+        return Pipeline(
+            source=source or ListSource(10),
+            sink=DictSink(),
+            provider=provider or FakeProvider(),
+            prompt_file=prompt_file,
+            strategy=ConcurrentStrategy(concurrency=4),
+            validate_sql=False,
+            **kwargs,
+        )
+
+    return make
+
+
+async def test_run_writes_all_records(make_pipeline: Callable[..., Pipeline]) -> None:
+    pipeline = make_pipeline()
+
+    summary = await pipeline.run()
+
+    assert summary is not None
+    assert summary.successful == 10
+    assert pipeline.sink.committed[3] == '<p>fake: record number 3</p>'  # type: ignore[attr-defined]
+
+
+def test_resume_requires_resumable_source(make_pipeline: Callable[..., Pipeline], tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match='ListSource does not support resuming'):
+        make_pipeline(checkpoint=FileCheckpointStore(tmp_path / 'checkpoint.jsonl'), resume=True)
+
+
+async def test_results_file_is_overwritten(make_pipeline: Callable[..., Pipeline], tmp_path: Path) -> None:
+    results_file = tmp_path / 'results.jsonl'
+    results_file.write_text('{"stale": true}\n', encoding='utf-8')
+
+    await make_pipeline(options=RunOptions(results_file=results_file)).run()
+
+    lines = results_file.read_text(encoding='utf-8').splitlines()
+    assert len(lines) == 10
+    assert 'stale' not in lines[0]
+
+
+async def test_budget_holds_when_provider_costs_more_than_projected(make_pipeline: Callable[..., Pipeline]) -> None:
+    # Every request costs three times its projection
+    provider = FakeProvider(cost=0.03)
+    pipeline = make_pipeline(source=ListSource(100), provider=provider, options=RunOptions(max_cost=0.5))
+
+    summary = await pipeline.run()
+
+    assert summary is not None
+    assert summary.budget_exhausted
+    assert 0.4 < summary.total_cost <= 0.5
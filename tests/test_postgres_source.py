@@ -0,0 +1,70 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from llm_pipeline.config import PGSettings
+from llm_pipeline.sources.postgres import PostgresSource
+
+
+class FakePool:
+    """Answers the bounds query with a fixed (min, max) row and records the queries sent."""
+
+    def __init__(self, row: tuple[Any, Any] | None) -> None:
+        self.row = row
+        self.queries: list[str] = []
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[FakePool]:
+        yield self
+
+    async def fetchrow(self, query: str, *args: Any) -> tuple[Any, Any] | None:
+        self.queries.append(query)
+        return self.row
+
+
+def _source(partitions: int) -> PostgresSource:
+    return PostgresSource(
+        "SELECT id, content FROM articles WHERE status = 'pending'",
+        settings=PGSettings.model_construct(),
+        partitions=partitions,
+        shard=(1, 4),
+    )
+
+
+async def test_bounds_come_from_key_range_without_sorting() -> None:
+    pool = FakePool((1, 1_000_001))
+
+    bounds = await _source(4)._partition_bounds(pool)  # type: ignore[arg-type]
+
+    assert bounds == [250_001, 500_001, 750_001]
+    (query,) = pool.queries
+    assert 'min("id"), max("id")' in query
+    assert 'percentile' not in query
+    # The shard filter would defeat the index, chunks apply it instead
+    assert 'hashtext' not in query
+
+
+async def test_bigint_bounds_stay_exact() -> None:
+    lowest = 2**62
+    bounds = await _source(2)._partition_bounds(FakePool((lowest, lowest + 2)))  # type: ignore[arg-type]
+
+    assert bounds == [lowest + 1]
+
+
+@pytest.mark.parametrize(
+    ('row', 'expected'),
+    [
+        ((Decimal(0), Decimal(3)), [Decimal(1), Decimal(2)]),
+        # Narrow key space: repeated bounds collapse
+        ((1, 2), [1]),
+        # Empty result set
+        ((None, None), []),
+        # Text keys cannot be split
+        (('a', 'z'), []),
+    ],
+)
+async def test_bounds(row: tuple[Any, Any], expected: list[Any]) -> None:
+    assert await _source(3)._partition_bounds(FakePool(row)) == expected  # type: ignore[arg-type]
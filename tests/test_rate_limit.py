@@ -0,0 +1,110 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from conftest import FakeProvider
+
+from llm_pipeline.utils import rate_limit
+from llm_pipeline.utils.rate_limit import TokenBucketLimiter
+
+
+class FakeClock:
+    """Stands in for time.monotonic and asyncio.sleep of the rate limiter: sleeping advances the clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.slept = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.now += seconds
+        self.slept += seconds
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limit, 'time', SimpleNamespace(monotonic=clock.monotonic))
+    monkeypatch.setattr(rate_limit, 'asyncio', SimpleNamespace(Lock=asyncio.Lock, sleep=clock.sleep))
+    return clock
+
+
+async def test_requests_wait_for_refill(clock: FakeClock) -> None:
+    limiter = TokenBucketLimiter(requests_per_minute=60)
+
+    for _ in range(60):
+        await limiter.reserve(0)
+    assert clock.slept == 0
+
+    await limiter.reserve(0)
+    assert clock.slept == pytest.approx(1.0)
+
+
+async def test_tokens_wait_for_refill(clock: FakeClock) -> None:
+    limiter = TokenBucketLimiter(tokens_per_minute=600)
+
+    await limiter.reserve(500)
+    await limiter.reserve(200)
+
+    # 100 missing tokens at 10 tokens per second
+    assert clock.slept == pytest.approx(10.0)
+
+
+async def test_oversized_request_reserves_whole_bucket(clock: FakeClock) -> None:
+    limiter = TokenBucketLimiter(tokens_per_minute=600)
+
+    assert await limiter.reserve(10_000) == 600
+    assert clock.slept == 0
+
+
+async def test_settle_returns_unused_tokens(clock: FakeClock) -> None:
+    limiter = TokenBucketLimiter(tokens_per_minute=600)
+
+    reserved = await limiter.reserve(500)
+    limiter.settle(reserved, 100)
+    await limiter.reserve(500)
+
+    assert clock.slept == 0
+
+
+async def test_settle_takes_overuse(clock: FakeClock) -> None:
+    limiter = TokenBucketLimiter(tokens_per_minute=600)
+
+    reserved = await limiter.reserve(100)
+    limiter.settle(reserved, 400)
+    await limiter.reserve(300)
+
+    # 600 - 400 leaves 200 tokens, 100 are missing
+    assert clock.slept == pytest.approx(10.0)
+
+
+async def test_failed_request_refunds_tokens(clock: FakeClock) -> None:
+    limiter = TokenBucketLimiter(requests_per_minute=60, tokens_per_minute=600)
+    provider = FakeProvider(down=True, rate_limiter=limiter)
+
+    with pytest.raises(Exception, match='is down'):
+        await provider.execute('prompt', 'x' * 1000)
+
+    # The request slot stays used, the tokens are returned
+    assert limiter._tokens is not None
+    assert limiter._requests is not None
+    assert limiter._tokens.level == limiter._tokens.capacity
+    assert limiter._requests.level == limiter._requests.capacity - 1
+
+
+async def test_limiter_is_shared_between_providers(clock: FakeClock) -> None:
+    limiter = TokenBucketLimiter(requests_per_minute=2)
+    first = FakeProvider('first', rate_limiter=limiter)
+    second = FakeProvider('second', rate_limiter=limiter)
+
+    await first.execute('prompt', 'a')
+    await second.execute('prompt', 'b')
+    assert clock.slept == 0
+
+    await asyncio.gather(first.execute('prompt', 'c'), second.execute('prompt', 'd'))
+
+    # Both waited for the shared quota, one after the other
+    assert clock.slept == pytest.approx(60.0)
@@ -0,0 +1,130 @@
+import time
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import anthropic
+import httpx
+import openai
+import pytest
+
+from llm_pipeline.utils.retry import (
+    NetworkError,
+    OverloadedError,
+    RateLimitError,
+    RequestTimeoutError,
+    ServerError,
+    _parse_retry_after,
+    classify_error,
+)
+
+
+def _in(seconds: float) -> datetime:
+    return datetime.now(UTC) + timedelta(seconds=seconds)
+
+
+@pytest.mark.parametrize(
+    ('headers', 'expected'),
+    [
+        ({'retry-after-ms': '1500'}, 1.5),
+        ({'retry-after-ms': 'soon', 'retry-after': '3'}, 3.0),
+        ({'retry-after': '7'}, 7.0),
+        ({'x-ratelimit-reset': '12'}, 12.0),
+        ({'x-ratelimit-reset-requests': '1m30s', 'x-ratelimit-remaining-requests': '0'}, 90.0),
+        (
+            {
+                'x-ratelimit-reset-requests': '2s',
+                'x-ratelimit-remaining-requests': '0',
+                'x-ratelimit-reset-tokens': '250ms',
+                'x-ratelimit-remaining-tokens': '0',
+            },
+            2.0,
+        ),
+        # Quotas that are not exhausted do not delay the retry
+        ({'x-ratelimit-reset-tokens': '6m', 'x-ratelimit-remaining-tokens': '1000'}, None),
+        ({'retry-after': 'whenever'}, None),
+        ({}, None),
+    ],
+)
+def test_parse_retry_after(headers: dict[str, str], expected: float | None) -> None:
+    assert _parse_retry_after(headers) == expected
+
+
+def test_parse_retry_after_http_date() -> None:
+    headers = {'retry-after': format_datetime(_in(30), usegmt=True)}
+
+    assert _parse_retry_after(headers) == pytest.approx(30, abs=2)
+
+
+def test_parse_retry_after_unix_timestamp() -> None:
+    headers = {'x-ratelimit-reset': str(time.time() + 20)}
+
+    assert _parse_retry_after(headers) == pytest.approx(20, abs=1)
+
+
+# Without an offset the timestamp is taken as UTC
+@pytest.mark.parametrize('naive', [False, True])
+def test_parse_retry_after_anthropic_reset(naive: bool) -> None:
+    reset = _in(40).replace(tzinfo=None) if naive else _in(40)
+    headers = {'anthropic-ratelimit-requests-reset': reset.isoformat(), 'anthropic-ratelimit-requests-remaining': '0'}
+
+    assert _parse_retry_after(headers) == pytest.approx(40, abs=1)
+
+
+def test_parse_retry_after_ignores_invalid_anthropic_reset() -> None:
+    headers = {
+        'anthropic-ratelimit-requests-reset': 'tomorrow',
+        'anthropic-ratelimit-requests-remaining': '0',
+        'anthropic-ratelimit-tokens-reset': _in(10).isoformat(),
+        'anthropic-ratelimit-tokens-remaining': '0',
+    }
+
+    assert _parse_retry_after(headers) == pytest.approx(10, abs=1)
+
+
+def _status_error(status: int, headers: dict[str, str] | None = None) -> httpx.HTTPStatusError:
+    request = httpx.Request('POST', 'http://provider.test')
+    response = httpx.Response(status, headers=headers, request=request)
+    return httpx.HTTPStatusError(f'{status}', request=request, response=response)
+
+
+@pytest.mark.parametrize(
+    ('status', 'expected'),
+    [
+        (429, RateLimitError),
+        (408, RequestTimeoutError),
+        (503, OverloadedError),
+        (529, OverloadedError),
+        (500, ServerError),
+        (502, ServerError),
+    ],
+)
+def test_classify_status(status: int, expected: type[Exception]) -> None:
+    assert type(classify_error(_status_error(status))) is expected
+
+
+def test_classify_keeps_retry_after() -> None:
+    error = classify_error(_status_error(429, {'retry-after': '5'}))
+
+    assert isinstance(error, RateLimitError)
+    assert error.retry_after == 5.0
+
+
+def test_classify_clamps_past_reset_to_zero() -> None:
+    error = classify_error(_status_error(429, {'x-ratelimit-reset': str(time.time() - 60)}))
+
+    assert error is not None
+    assert error.retry_after == 0.0
+
+
+def test_classify_sdk_errors() -> None:
+    request = httpx.Request('POST', 'http://provider.test')
+
+    assert isinstance(classify_error(openai.APITimeoutError(request)), RequestTimeoutError)
+    assert isinstance(classify_error(anthropic.APIConnectionError(request=request)), NetworkError)
+    assert isinstance(classify_error(httpx.ConnectError('refused')), NetworkError)
+    assert isinstance(classify_error(TimeoutError()), RequestTimeoutError)
+
+
+@pytest.mark.parametrize('error', [_status_error(400), _status_error(401), ValueError('bad output')])
+def test_classify_not_retryable(error: Exception) -> None:
+    assert classify_error(error) is None
@@ -0,0 +1,35 @@
+import httpx
+import pytest
+from conftest import FakeProvider
+
+from llm_pipeline.providers.router import HedgedRouter
+
+
+async def test_hedge_wins_and_loser_latency_is_recorded() -> None:
+    router = HedgedRouter([FakeProvider('slow', delay=1.0), FakeProvider('fast', delay=0.01)], initial_hedge_delay=0.05)
+
+    response = await router.execute('prompt', 'content')
+
+    assert response.content == '<p>fast: content</p>'
+    assert router.hedges_sent == 1
+    assert router.hedges_won == 1
+    # The fast hedge and a lower bound for the cancelled slow request
+    latencies = sorted(router._latencies)
+    assert len(latencies) == 2
+    assert latencies[1] >= 0.05
+
+
+async def test_fails_over_to_next_provider() -> None:
+    router = HedgedRouter([FakeProvider('down', down=True), FakeProvider('up')])
+
+    response = await router.execute('prompt', 'content')
+
+    assert response.content == '<p>up: content</p>'
+    assert router.failovers == 1
+
+
+async def test_raises_last_error_when_all_providers_fail() -> None:
+    router = HedgedRouter([FakeProvider('first', down=True), FakeProvider('second', down=True)])
+
+    with pytest.raises(httpx.ConnectError, match='second is down'):
+        await router.execute('prompt', 'content')
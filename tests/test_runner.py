@@ -0,0 +1,80 @@
+from pathlib import Path
+from queue import Queue
+from typing import Any
+
+from llm_pipeline.models import RunOptions, RunSummary, TierStats
+from llm_pipeline.runner import ShardedRunner, _shard_options, _shard_path
+from llm_pipeline.utils.progress import ProgressTracker
+
+
+def _shard_summary(requests: int, accepted: int, results_file: Path | None = None) -> RunSummary:
+    tiers = [
+        TierStats(tier=0, model='small', requests=requests, accepted=accepted, cost=0.1, total_latency=1.0),
+        TierStats(tier=1, model='large', requests=requests - accepted, accepted=requests - accepted, cost=1.0),
+    ]
+    return RunSummary(successful=requests, failed_ids=[requests], results_file=results_file, tiers=tiers)
+
+
+def _drain(runner: ShardedRunner, queue: Queue[Any]) -> RunSummary:
+    summaries: dict[int, tuple[RunSummary, bool]] = {}
+    progress = ProgressTracker(None)
+    runner._drain(queue, progress, {}, summaries, set(range(runner.workers)))
+    return runner._summarize(progress, 1.0, summaries)
+
+
+def test_tier_stats_are_merged_across_shards() -> None:
+    queue: Queue[Any] = Queue()
+    queue.put(('summary', 0, (_shard_summary(requests=10, accepted=8), False)))
+    queue.put(('summary', 1, (_shard_summary(requests=20, accepted=5), False)))
+
+    runner = ShardedRunner(lambda: None, workers=2)  # type: ignore[arg-type,return-value]
+    summary = _drain(runner, queue)
+
+    assert summary.failed_ids == [10, 20]
+    tiers = {stats.tier: stats for stats in summary.tiers}
+    assert tiers[0].requests == 30
+    assert tiers[0].accepted == 13
+    assert tiers[0].total_latency == 2.0
+    assert tiers[1].requests == 17
+    assert tiers[1].cost == 2.0
+
+
+def test_shard_results_files_are_concatenated(tmp_path: Path) -> None:
+    results_file = tmp_path / 'results.jsonl'
+    results_file.write_text('stale\n', encoding='utf-8')
+    for shard in range(2):
+        _shard_path(results_file, shard).write_text(f'shard {shard}\n', encoding='utf-8')
+    queue: Queue[Any] = Queue()
+    queue.put(('summary', 1, (_shard_summary(requests=1, accepted=1, results_file=results_file), False)))
+
+    runner = ShardedRunner(lambda: None, workers=2)  # type: ignore[arg-type,return-value]
+    summary = _drain(runner, queue)
+
+    # Shard 0 failed before reporting, its results are kept all the same
+    assert summary.results_file == results_file
+    assert results_file.read_text(encoding='utf-8') == 'shard 0\nshard 1\n'
+    assert not _shard_path(results_file, 0).exists()
+    assert not _shard_path(results_file, 1).exists()
+
+
+def test_resumed_shard_results_are_appended(tmp_path: Path) -> None:
+    results_file = tmp_path / 'results.jsonl'
+    results_file.write_text('previous run\n', encoding='utf-8')
+    _shard_path(results_file, 0).write_text('shard 0\n', encoding='utf-8')
+    queue: Queue[Any] = Queue()
+    queue.put(('summary', 0, (_shard_summary(requests=1, accepted=1, results_file=results_file), True)))
+
+    runner = ShardedRunner(lambda: None, workers=1)  # type: ignore[arg-type,return-value]
+    _drain(runner, queue)
+
+    assert results_file.read_text(encoding='utf-8') == 'previous run\nshard 0\n'
+
+
+def test_shard_options_split_the_budget(tmp_path: Path) -> None:
+    options = RunOptions(results_file=tmp_path / 'results.jsonl', max_cost=10.0)
+
+    shard_options = _shard_options(options, 3, 4)
+
+    assert shard_options.max_cost == 2.5
+    assert shard_options.results_file == tmp_path / 'results.shard3.jsonl'
+    assert options.max_cost == 10.0
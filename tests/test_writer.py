@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+from conftest import DictSink
+
+from llm_pipeline.models import ProcessingResult
+from llm_pipeline.sinks.writer import BackgroundWriter
+
+
+def _result(record_id: int, success: bool = True) -> ProcessingResult:
+    return ProcessingResult(
+        record_id=record_id,
+        success=success,
+        original_content='text',
+        transformed_content=f'<p>{record_id}</p>' if success else None,
+    )
+
+
+async def test_commits_full_batches() -> None:
+    sink = DictSink()
+    committed: list[list[int]] = []
+
+    async def on_commit(batch: list[ProcessingResult]) -> None:
+        committed.append([result.record_id for result in batch])
+
+    writer = BackgroundWriter(sink, batch_size=3, flush_interval=60, on_commit=on_commit)
+    writer.start()
+    for record_id in range(7):
+        await writer.put(_result(record_id))
+    await asyncio.sleep(0.01)
+
+    # The seventh result waits for a full batch or the flush interval
+    assert committed == [[0, 1, 2], [3, 4, 5]]
+    assert sorted(sink.committed) == [0, 1, 2, 3, 4, 5]
+
+    await writer.close()
+
+    assert committed[-1] == [6]
+    assert writer.batches_committed == 3
+
+
+async def test_flushes_partial_batch_after_interval() -> None:
+    sink = DictSink()
+    writer = BackgroundWriter(sink, batch_size=100, flush_interval=0.02)
+    writer.start()
+
+    await writer.put(_result(0))
+    await asyncio.sleep(0.05)
+
+    assert sink.committed == {0: '<p>0</p>'}
+    await writer.close()
+
+
+async def test_failed_results_are_committed_but_not_written() -> None:
+    sink = DictSink()
+    committed: list[ProcessingResult] = []
+
+    async def on_commit(batch: list[ProcessingResult]) -> None:
+        committed.extend(batch)
+
+    writer = BackgroundWriter(sink, batch_size=2, on_commit=on_commit)
+    writer.start()
+    await writer.put(_result(0))
+    await writer.put(_result(1, success=False))
+    await writer.close()
+
+    assert sink.committed == {0: '<p>0</p>'}
+    assert [result.record_id for result in committed] == [0, 1]
+
+
+async def test_failed_commit_skips_on_commit_and_surfaces_error() -> None:
+    sink = DictSink()
+    sink.fail_commits = 1
+    committed: list[ProcessingResult] = []
+
+    async def on_commit(batch: list[ProcessingResult]) -> None:
+        committed.extend(batch)
+
+    writer = BackgroundWriter(sink, batch_size=1, on_commit=on_commit)
+    writer.start()
+    await writer.put(_result(0))
+    await asyncio.sleep(0.01)
+
+    with pytest.raises(ConnectionError, match='commit failed'):
+        await writer.put(_result(1))
+    assert not committed
+    assert not sink.committed
+
+
+async def test_put_waits_while_queue_is_full() -> None:
+    sink = DictSink()
+    writer = BackgroundWriter(sink, batch_size=1, max_queue_size=1)
+    writer.start()
+    gate = asyncio.Event()
+    commit = sink.commit_batch
+
+    async def slow_commit() -> None:
+        await gate.wait()
+        await commit()
+
+    sink.commit_batch = slow_commit  # type: ignore[method-assign]
+    await writer.put(_result(0))
+    await asyncio.sleep(0.01)
+    await writer.put(_result(1))
+    blocked = asyncio.create_task(writer.put(_result(2)))
+    await asyncio.sleep(0.01)
+
+    assert not blocked.done()
+    gate.set()
+    await blocked
+    await writer.close()
+    assert sorted(sink.committed) == [0, 1, 2]